@@ -0,0 +1,7 @@
+"""
+Algoritmos de ordenamiento y selección que usa la interfaz sobre las tablas
+de países (o de regiones, en simulaciones más grandes).
+
+Los submódulos se importan directamente, por ejemplo
+`from algoritmos.ordenamiento import argsort_estable`.
+"""
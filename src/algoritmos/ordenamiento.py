@@ -0,0 +1,122 @@
+import numpy as np
+
+# =============================
+# MERGE SORT DE ABAJO ARRIBA
+# =============================
+
+def _mezclar(origen_v, origen_i, destino_v, destino_i, inicio, medio, fin, descendente):
+    """
+    Mezcla los tramos ordenados [inicio, medio) y [medio, fin) de origen en
+    destino. Solo pasa primero un elemento de la derecha si es estrictamente
+    mejor, así que los iguales conservan su orden (estable).
+    """
+    i, j = inicio, medio
+    for k in range(inicio, fin):
+        if j < fin and (i >= medio or ((origen_v[j] > origen_v[i]) if descendente
+                                       else (origen_v[j] < origen_v[i]))):
+            destino_v[k] = origen_v[j]
+            destino_i[k] = origen_i[j]
+            j += 1
+        else:
+            destino_v[k] = origen_v[i]
+            destino_i[k] = origen_i[i]
+            i += 1
+
+class OrdenadorMezcla:
+    """
+    Merge sort de abajo arriba (sin recursión) sobre búferes preasignados:
+    valores e índices van y vuelven entre dos pares de listas (ping-pong)
+    mezclando tramos de 1, 2, 4... elementos, sin cortes ni listas nuevas en
+    cada nivel como merge_sort_DyV. Es estable: los valores iguales
+    conservan el orden de entrada.
+
+    Los búferes se reutilizan mientras no cambie el tamaño, de modo que
+    ordenar la misma tabla en cada clic no genera basura. Las listas
+    devueltas son esos búferes: valen hasta la siguiente llamada.
+    """
+    def __init__(self):
+        self._buferes = ([], [], [], [])
+
+    def _reservar(self, n):
+        if len(self._buferes[0]) != n:
+            self._buferes = ([0.0] * n, [0] * n, [0.0] * n, [0] * n)
+        return self._buferes
+
+    def ordenar(self, valores, indices=None, descendente=True):
+        """(valores, indices) ordenados; indices por defecto 0..n-1"""
+        n = len(valores)
+        origen_v, origen_i, destino_v, destino_i = self._reservar(n)
+        origen_v[:] = valores
+        if indices is None:
+            origen_i[:] = range(n)
+        else:
+            origen_i[:] = indices
+
+        ancho = 1
+        while ancho < n:
+            for inicio in range(0, n, 2 * ancho):
+                medio = min(inicio + ancho, n)
+                fin = min(inicio + 2 * ancho, n)
+                _mezclar(origen_v, origen_i, destino_v, destino_i, inicio, medio, fin, descendente)
+            origen_v, destino_v = destino_v, origen_v
+            origen_i, destino_i = destino_i, origen_i
+            ancho *= 2
+        return origen_v, origen_i
+
+# =============================
+# ORDEN ESTABLE CON NUMPY
+# =============================
+
+def argsort_estable(valores, descendente=True):
+    """
+    Permutación que ordena `valores` en una sola llamada de NumPy (Timsort
+    estable), con el mismo orden que OrdenadorMezcla. En orden descendente
+    se ordena el array invertido y se invierte el resultado, para que los
+    iguales sigan en su orden original sin negar los valores.
+    """
+    valores = np.asarray(valores)
+    if not descendente:
+        return np.argsort(valores, kind="stable")
+    n = valores.size
+    return n - 1 - np.argsort(valores[::-1], kind="stable")[::-1]
+
+# =============================
+# RANKING INCREMENTAL
+# =============================
+
+class RankingIncremental:
+    """
+    Orden de los países (índices) por una columna que cambia poco de un día
+    al siguiente. En lugar de ordenar desde cero en cada cuadro, toma los
+    valores nuevos en el orden del cuadro anterior y los reordena con el
+    sort estable de NumPy (Timsort, un merge sort natural): detecta los
+    tramos que siguen ordenados y solo mezcla donde se cruzaron países, así
+    que la reparación es casi lineal cuando el ranking apenas cambia.
+
+    Al ser estable sobre el orden anterior, los iguales conservan la
+    posición que tenían en el cuadro anterior y las filas empatadas no
+    saltan durante la animación. reiniciar() ordena desde cero, con los
+    iguales en el orden de la lista, con argsort_estable o, si se pasa un
+    OrdenadorMezcla como `ordenador`, con él (mismo orden).
+    """
+    def __init__(self, descendente=True, ordenador=None):
+        self.descendente = descendente
+        self.ordenador = ordenador
+        self.orden = np.arange(0)
+
+    def reiniciar(self, valores):
+        """Ordena desde cero y guarda el orden como punto de partida"""
+        if self.ordenador is None:
+            self.orden = argsort_estable(valores, self.descendente)
+        else:
+            _, indices = self.ordenador.ordenar(list(valores), descendente=self.descendente)
+            self.orden = np.array(indices)
+        return self.orden.tolist()
+
+    def actualizar(self, valores):
+        """Orden (lista de índices) para los valores nuevos, reparando el anterior"""
+        valores = np.asarray(valores)
+        if self.orden.size != valores.size:
+            return self.reiniciar(valores)
+        self.orden = self.orden[argsort_estable(valores[self.orden], self.descendente)]
+        return self.orden.tolist()
@@ -0,0 +1,80 @@
+import heapq
+
+import numpy as np
+
+# =============================
+# SELECCIÓN SIN ORDENAR
+# =============================
+
+# Todas las funciones siguen el orden de argsort_estable: de mayor a menor
+# (o de menor a mayor) y, entre iguales, primero el de menor índice. Así el
+# elemento k o los k primeros coinciden con las primeras filas de la tabla
+# ordenada, sin ordenar la tabla entera.
+
+def _claves(valores, descendente):
+    """Claves únicas (valor, índice) que ordenan de menor a mayor"""
+    if descendente:
+        return [(-v, i) for i, v in enumerate(valores)]
+    return [(v, i) for i, v in enumerate(valores)]
+
+def top_k_heap(valores, k, descendente=True):
+    """
+    (valores, indices) de los k primeros con un montículo de tamaño k:
+    O(n log k) en lugar de ordenar los n elementos
+    """
+    primeros = heapq.nsmallest(k, _claves(valores, descendente))
+    return [valores[i] for _, i in primeros], [i for _, i in primeros]
+
+# =============================
+# MEDIANA DE MEDIANAS (DIVIDE Y VENCERÁS)
+# =============================
+
+def _mediana_de_medianas(claves):
+    """Pivote: mediana de las medianas de grupos de 5"""
+    medianas = []
+    for inicio in range(0, len(claves), 5):
+        grupo = sorted(claves[inicio:inicio + 5])
+        medianas.append(grupo[len(grupo) // 2])
+    return _seleccionar(medianas, len(medianas) // 2)
+
+def _seleccionar(claves, k):
+    """Clave en la posición k del orden; las claves no se repiten"""
+    while len(claves) > 5:
+        pivote = _mediana_de_medianas(claves)
+        menores = [c for c in claves if c < pivote]
+        if k < len(menores):
+            claves = menores
+        elif k == len(menores):
+            return pivote
+        else:
+            claves = [c for c in claves if c > pivote]
+            k -= len(menores) + 1
+    return sorted(claves)[k]
+
+def seleccionar_DyV(valores, k, descendente=True):
+    """
+    (valor, índice) del elemento en la posición k (desde 0) del orden, con
+    quickselect y pivote por mediana de medianas: O(n) en el peor caso.
+    k=0 es el máximo (o el mínimo) y k=n//2 la mediana.
+    """
+    if not 0 <= k < len(valores):
+        raise ValueError(f"Posición fuera de rango: {k}")
+    _, indice = _seleccionar(_claves(valores, descendente), k)
+    return valores[indice], indice
+
+# =============================
+# CAMINO RÁPIDO CON NUMPY
+# =============================
+
+def k_esimo(valores, k, descendente=True):
+    """
+    (valor, índice) del elemento k con np.partition (introselect, O(n)).
+    El índice se elige entre los iguales como en seleccionar_DyV.
+    """
+    valores = np.asarray(valores)
+    if not 0 <= k < valores.size:
+        raise ValueError(f"Posición fuera de rango: {k}")
+    posicion = valores.size - 1 - k if descendente else k
+    valor = np.partition(valores, posicion)[posicion]
+    antes = np.count_nonzero(valores > valor if descendente else valores < valor)
+    return valor, int(np.flatnonzero(valores == valor)[k - antes])
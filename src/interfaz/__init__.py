@@ -0,0 +1,8 @@
+"""
+Componentes de la interfaz gráfica: geometría del mapa, renderizado y
+estructuras auxiliares de la ventana principal.
+
+Los submódulos se importan directamente (por ejemplo
+`from interfaz.geometria import cargar_geometria`) para que generar la caché
+del mapa no requiera Tkinter.
+"""
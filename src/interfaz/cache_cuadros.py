@@ -0,0 +1,51 @@
+from collections import OrderedDict
+
+# =============================
+# CACHÉ LRU DE CUADROS
+# =============================
+
+CAPACIDAD_CACHE = 1024
+
+class CacheLRU:
+    """
+    Memoiza `calcular(clave)` con expulsión LRU: guarda como máximo
+    `capacidad` entradas y descarta la usada hace más tiempo. Se usa para los
+    cuadros de la animación, con claves como (tipo_mapa, dia) o dia, de modo
+    que recorrer el deslizador hacia atrás y adelante no recalcula nada.
+    """
+    def __init__(self, calcular, capacidad=CAPACIDAD_CACHE):
+        if capacidad < 1:
+            raise ValueError("La capacidad de la caché debe ser al menos 1")
+        self._calcular = calcular
+        self.capacidad = capacidad
+        self._entradas = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave):
+        if clave in self._entradas:
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return self._entradas[clave]
+
+        self.fallos += 1
+        valor = self._calcular(clave)
+        self._entradas[clave] = valor
+        if len(self._entradas) > self.capacidad:
+            self._entradas.popitem(last=False)
+        return valor
+
+    def precalcular(self, claves):
+        """Llena la caché por adelantado (hasta su capacidad)"""
+        for clave in claves:
+            self.obtener(clave)
+
+    def limpiar(self):
+        self._entradas.clear()
+        self.aciertos = self.fallos = 0
+
+    def __contains__(self, clave):
+        return clave in self._entradas
+
+    def __len__(self):
+        return len(self._entradas)
@@ -0,0 +1,188 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+# =============================
+# CACHÉ BINARIA DE GEOMETRÍA DEL MAPA
+# =============================
+
+# Códigos de trazado de matplotlib.path.Path (se repiten aquí para no
+# importar matplotlib al generar la caché)
+MOVETO = 1
+LINETO = 2
+CLOSEPOLY = 79
+
+# Ventana visible del mapa (lon/lat) y latitud de referencia de la proyección
+LIMITES_EUROPA = (-25.0, 60.0, 34.0, 72.0)
+LATITUD_REFERENCIA = 53.0
+TOLERANCIA_SIMPLIFICACION = 0.05
+
+VERSION_CACHE = 1
+
+def hash_archivo(ruta):
+    """SHA-256 del archivo fuente, usado para invalidar la caché"""
+    h = hashlib.sha256()
+    with open(ruta, "rb") as f:
+        for bloque in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+def simplificar_anillo(puntos, tolerancia):
+    """Douglas-Peucker iterativo sobre un anillo cerrado de forma (k, 2)"""
+    if len(puntos) <= 4:
+        return puntos
+
+    conservar = np.zeros(len(puntos), dtype=bool)
+    conservar[0] = conservar[-1] = True
+    pila = [(0, len(puntos) - 1)]
+    while pila:
+        ini, fin = pila.pop()
+        if fin - ini < 2:
+            continue
+        a, b = puntos[ini], puntos[fin]
+        tramo = puntos[ini + 1:fin]
+        ab = b - a
+        largo = np.hypot(*ab)
+        if largo == 0:
+            distancias = np.hypot(*(tramo - a).T)
+        else:
+            distancias = np.abs(ab[0] * (tramo[:, 1] - a[1]) - ab[1] * (tramo[:, 0] - a[0])) / largo
+        k = int(distancias.argmax())
+        if distancias[k] > tolerancia:
+            medio = ini + 1 + k
+            conservar[medio] = True
+            pila.append((ini, medio))
+            pila.append((medio, fin))
+
+    simplificado = puntos[conservar]
+    # Un anillo necesita al menos un triángulo
+    return simplificado if len(simplificado) >= 4 else puntos
+
+def proyectar(lonlat, latitud_referencia=LATITUD_REFERENCIA):
+    """Proyección equirectangular: misma apariencia que el mapa lon/lat original"""
+    xy = np.asarray(lonlat, dtype=float).copy()
+    xy[:, 0] *= np.cos(np.radians(latitud_referencia))
+    return xy
+
+def _anillos(geometria):
+    """Anillos exteriores e interiores de un Polygon o MultiPolygon GeoJSON"""
+    if geometria["type"] == "Polygon":
+        poligonos = [geometria["coordinates"]]
+    elif geometria["type"] == "MultiPolygon":
+        poligonos = geometria["coordinates"]
+    else:
+        return []
+    return [np.asarray(anillo, dtype=float)[:, :2] for poligono in poligonos for anillo in poligono]
+
+def _visible(anillo, limites):
+    xmin, xmax, ymin, ymax = limites
+    return (anillo[:, 0].max() >= xmin and anillo[:, 0].min() <= xmax and
+            anillo[:, 1].max() >= ymin and anillo[:, 1].min() <= ymax)
+
+class GeometriaMapa:
+    """
+    Polígonos de cada país ya simplificados y proyectados, listos para
+    construir trayectos de matplotlib: vertices[pais] es un array (k, 2) y
+    codigos[pais] los códigos de trazado correspondientes.
+    """
+    def __init__(self, nombres, vertices, codigos, limites):
+        self.nombres = nombres
+        self.vertices = vertices
+        self.codigos = codigos
+        self.limites = limites
+
+    def trayectos(self):
+        """Un matplotlib.path.Path por país, en el orden de self.nombres"""
+        from matplotlib.path import Path
+        return [Path(self.vertices[n], self.codigos[n]) for n in self.nombres]
+
+    @classmethod
+    def desde_geojson(cls, ruta, continente="Europe", limites=LIMITES_EUROPA,
+                      tolerancia=TOLERANCIA_SIMPLIFICACION):
+        """Lee el GeoJSON (sin GeoPandas), filtra, simplifica y proyecta"""
+        with open(ruta, encoding="utf-8") as f:
+            datos = json.load(f)
+
+        vertices, codigos = {}, {}
+        for feature in datos["features"]:
+            props = feature["properties"]
+            if props.get("CONTINENT") != continente:
+                continue
+
+            partes_v, partes_c = [], []
+            for anillo in _anillos(feature["geometry"]):
+                if not _visible(anillo, limites):
+                    continue
+                anillo = simplificar_anillo(anillo, tolerancia)
+                c = np.full(len(anillo), LINETO, dtype=np.uint8)
+                c[0] = MOVETO
+                c[-1] = CLOSEPOLY
+                partes_v.append(proyectar(anillo))
+                partes_c.append(c)
+            if partes_v:
+                vertices[props["NAME"]] = np.concatenate(partes_v).astype(np.float32)
+                codigos[props["NAME"]] = np.concatenate(partes_c)
+
+        xmin, xmax, ymin, ymax = limites
+        esquinas = proyectar([[xmin, ymin], [xmax, ymax]])
+        limites_proyectados = (esquinas[0, 0], esquinas[1, 0], esquinas[0, 1], esquinas[1, 1])
+        return cls(sorted(vertices), vertices, codigos, limites_proyectados)
+
+    def guardar(self, ruta, hash_fuente):
+        """Guarda la geometría como .npz comprimido, con el hash de la fuente"""
+        arrays = {}
+        for i, nombre in enumerate(self.nombres):
+            arrays[f"v{i}"] = self.vertices[nombre]
+            arrays[f"c{i}"] = self.codigos[nombre]
+        np.savez_compressed(ruta, nombres=np.array(self.nombres), limites=np.array(self.limites),
+                            hash_fuente=np.array(hash_fuente),
+                            version=np.array(VERSION_CACHE), **arrays)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Lee la caché .npz; devuelve (geometria, hash_fuente)"""
+        with np.load(ruta) as datos:
+            if int(datos["version"]) != VERSION_CACHE:
+                raise ValueError("Versión de caché de geometría incompatible")
+            nombres = [str(n) for n in datos["nombres"]]
+            vertices = {n: datos[f"v{i}"] for i, n in enumerate(nombres)}
+            codigos = {n: datos[f"c{i}"] for i, n in enumerate(nombres)}
+            geometria = cls(nombres, vertices, codigos, tuple(datos["limites"]))
+            return geometria, str(datos["hash_fuente"])
+
+def cargar_geometria(geojson_path, cache_path=None):
+    """
+    Devuelve la geometría del mapa usando la caché binaria. La caché se
+    regenera si no existe o si el hash del GeoJSON no coincide; si el GeoJSON
+    no está disponible se usa la caché tal cual.
+    """
+    if cache_path is None:
+        cache_path = os.path.splitext(geojson_path)[0] + "_europa.npz"
+
+    hash_fuente = hash_archivo(geojson_path) if os.path.exists(geojson_path) else None
+
+    if os.path.exists(cache_path):
+        try:
+            geometria, hash_guardado = GeometriaMapa.cargar(cache_path)
+            if hash_fuente is None or hash_fuente == hash_guardado:
+                return geometria
+        except (OSError, KeyError, ValueError):
+            pass
+
+    if hash_fuente is None:
+        raise FileNotFoundError(geojson_path)
+
+    print("Generando caché de geometría del mapa...")
+    geometria = GeometriaMapa.desde_geojson(geojson_path)
+    geometria.guardar(cache_path, hash_fuente)
+    return geometria
+
+if __name__ == "__main__":
+    import sys
+
+    ruta = sys.argv[1] if len(sys.argv) > 1 else "ne_110m_admin_0_countries.geojson"
+    geometria = cargar_geometria(ruta)
+    print(f"{len(geometria.nombres)} países, "
+          f"{sum(len(v) for v in geometria.vertices.values())} vértices")
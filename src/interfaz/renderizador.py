@@ -0,0 +1,69 @@
+from matplotlib.collections import PatchCollection
+from matplotlib.patches import PathPatch
+
+# =============================
+# RENDERIZADOR DEL MAPA COROPLÉTICO
+# =============================
+
+class RenderizadorMapa:
+    """
+    Dibuja los países una sola vez como una PatchCollection persistente.
+    Cada día solo cambia el array de valores (set_array) y se redibujan con
+    blitting la colección y el título sobre un fondo guardado; los ejes, la
+    barra de color y el resto de la figura no se vuelven a renderizar.
+    """
+    def __init__(self, fig, ax, canvas, geometria):
+        self.fig = fig
+        self.ax = ax
+        self.canvas = canvas
+        self.nombres = geometria.nombres
+        self.fondo = None
+        self.colorbar = None
+
+        self.coleccion = PatchCollection([PathPatch(t) for t in geometria.trayectos()],
+                                         linewidth=0.8, edgecolor="black", animated=True)
+        ax.add_collection(self.coleccion)
+
+        xmin, xmax, ymin, ymax = geometria.limites
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
+        ax.set_aspect("equal")
+        ax.axis("off")
+
+        self.titulo = ax.set_title("", fontsize=14, fontweight='bold')
+        self.titulo.set_animated(True)
+
+        # Cada redibujado completo (inicio, cambio de tamaño...) renueva el fondo
+        self.canvas.mpl_connect("draw_event", self._al_dibujar)
+
+    def configurar(self, cmap, vmax):
+        """Cambia paleta y escala (cambio de tipo de mapa): redibujado completo"""
+        self.coleccion.set_cmap(cmap)
+        self.coleccion.set_clim(0, vmax)
+        if self.colorbar is None:
+            self.colorbar = self.fig.colorbar(self.coleccion, ax=self.ax, fraction=0.03, pad=0.04)
+        else:
+            self.colorbar.update_normal(self.coleccion)
+        self.fondo = None
+        self.canvas.draw()
+
+    def actualizar(self, valores, titulo):
+        """Actualiza los colores de todos los países (en el orden de self.nombres)"""
+        self.coleccion.set_array(valores)
+        self.titulo.set_text(titulo)
+
+        if self.fondo is None:
+            self.canvas.draw()
+            return
+
+        self.canvas.restore_region(self.fondo)
+        self._dibujar_animados()
+        self.canvas.blit(self.fig.bbox)
+
+    def _dibujar_animados(self):
+        self.ax.draw_artist(self.coleccion)
+        self.ax.draw_artist(self.titulo)
+
+    def _al_dibujar(self, _evento):
+        self.fondo = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._dibujar_animados()
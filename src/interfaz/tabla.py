@@ -0,0 +1,52 @@
+# =============================
+# MODELO INCREMENTAL DE LA TABLA
+# =============================
+
+class ModeloTabla:
+    """
+    Mantiene un ttk.Treeview sincronizado con una lista de filas sin borrar
+    ni recrear nada: cada fila tiene un id estable (el nombre del país), solo
+    se llama a item(..., values=...) en las filas cuyos valores cambiaron, el
+    orden se corrige con move() y las filas que sobran se ocultan con detach().
+    """
+    def __init__(self, tabla):
+        self.tabla = tabla
+        self._valores = {}   # id -> valores mostrados (también de filas ocultas)
+        self._visibles = []  # ids visibles, en orden
+
+    def mostrar(self, filas):
+        """filas: lista de (id, valores) en el orden en que deben verse"""
+        nuevos = [iid for iid, _ in filas]
+        visibles_nuevos = set(nuevos)
+
+        # Ocultar las filas que ya no aparecen
+        ocultar = [iid for iid in self._visibles if iid not in visibles_nuevos]
+        if ocultar:
+            self.tabla.detach(*ocultar)
+        actuales = [iid for iid in self._visibles if iid in visibles_nuevos]
+        en_pantalla = set(actuales)
+
+        # Crear filas nuevas o actualizar solo los valores que cambiaron
+        for iid, valores in filas:
+            valores = tuple(valores)
+            if iid not in self._valores:
+                self.tabla.insert("", "end", iid=iid, values=valores)
+                actuales.append(iid)
+                en_pantalla.add(iid)
+            elif self._valores[iid] != valores:
+                self.tabla.item(iid, values=valores)
+            self._valores[iid] = valores
+
+        # Reordenar moviendo solo las filas fuera de lugar (move también
+        # vuelve a mostrar las filas ocultas)
+        for pos, iid in enumerate(nuevos):
+            if pos < len(actuales) and actuales[pos] == iid:
+                continue
+            self.tabla.move(iid, "", pos)
+            if iid in en_pantalla:
+                actuales.remove(iid)
+            actuales.insert(pos, iid)
+            en_pantalla.add(iid)
+
+        self._visibles = nuevos
+
@@ -0,0 +1,58 @@
+import queue
+import threading
+
+# =============================
+# SIMULACIÓN EN SEGUNDO PLANO
+# =============================
+
+# Cada cuántos días se avisa a la interfaz
+DIAS_POR_AVISO = 5
+
+class TrabajadorSimulacion:
+    """
+    Ejecuta un MotorSIRD en un hilo aparte y publica su avance en una cola,
+    para que el bucle principal de Tk nunca se bloquee. Mensajes:
+    - ("progreso", dias_listos): los días 0..dias_listos-1 ya son definitivos
+    - ("fin", dias_listos): la simulación terminó
+    - ("cancelado", dias_listos): se detuvo a petición del usuario
+    - ("error", excepcion)
+
+    Los arrays del motor se comparten con la interfaz: un día no se vuelve a
+    escribir una vez anunciado, así que puede leerse sin copiarlo.
+    """
+    def __init__(self, motor, dias_por_aviso=DIAS_POR_AVISO):
+        self.motor = motor
+        self.dias_por_aviso = dias_por_aviso
+        self.cola = queue.Queue()
+        self._cancelar = threading.Event()
+        self._hilo = threading.Thread(target=self._ejecutar, daemon=True)
+
+    def iniciar(self):
+        self._hilo.start()
+
+    def cancelar(self):
+        self._cancelar.set()
+
+    def activo(self):
+        return self._hilo.is_alive()
+
+    def mensajes(self):
+        """Vacía la cola sin bloquear"""
+        while True:
+            try:
+                yield self.cola.get_nowait()
+            except queue.Empty:
+                return
+
+    def _ejecutar(self):
+        try:
+            for dia in range(self.motor.dia_actual + 1, self.motor.dias):
+                if self._cancelar.is_set():
+                    self.cola.put(("cancelado", dia))
+                    return
+                self.motor.avanzar(dia)
+                if dia % self.dias_por_aviso == 0:
+                    self.cola.put(("progreso", dia + 1))
+            self.cola.put(("fin", self.motor.dias))
+        except Exception as e:
+            self.cola.put(("error", e))
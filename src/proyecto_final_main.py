@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import geopandas as gpd
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
@@ -8,6 +7,19 @@ import urllib.request, os
 import heapq
 from collections import Counter
 
+from simulacion import (ConfiguracionSimulacion, MemoriaSimulaciones, MotorSIRD,
+                        clave_simulacion, iterar_sird, simular_sird)
+from simulacion.analitica import extremo, top_k_por_dia
+from simulacion.datos import config_paises, paises, vecinos
+from simulacion.referencia import imprimir_encabezado_simulacion
+from algoritmos.ordenamiento import OrdenadorMezcla, RankingIncremental
+from algoritmos.seleccion import k_esimo, seleccionar_DyV, top_k_heap
+from interfaz.geometria import cargar_geometria
+from interfaz.cache_cuadros import CacheLRU
+from interfaz.renderizador import RenderizadorMapa
+from interfaz.tabla import ModeloTabla
+from interfaz.trabajador import TrabajadorSimulacion
+
 # =============================
 # ALGORITMOS DIVIDE Y VENCERÁS
 # =============================
@@ -242,48 +254,6 @@ def predecir_ruta_contagio_voraz(pais_origen, max_pasos=10):
     
     return ruta
 
-# =============================
-# DATOS REALISTAS: POBLACIÓN POR PAÍS (2023)
-# =============================
-
-poblacion_paises = {
-    "Albania": 2746000,
-    "Austria": 9027000,
-    "Belarus": 9230000,
-    "Belgium": 11632000,
-    "Bosnia and Herz.": 3151000,
-    "Bulgaria": 6808000,
-    "Croatia": 3856000,
-    "Czechia": 10496000,
-    "Denmark": 5933000,
-    "Estonia": 1331000,
-    "Finland": 5541000,
-    "France": 68073000,
-    "Germany": 83295000,
-    "Greece": 10373000,
-    "Hungary": 9604000,
-    "Ireland": 5123000,
-    "Italy": 58851000,
-    "Latvia": 1863000,
-    "Lithuania": 2795000,
-    "Luxembourg": 654000,
-    "Moldova": 2513000,
-    "Netherlands": 17767000,
-    "Norway": 5466000,
-    "Poland": 37551000,
-    "Portugal": 10247000,
-    "Romania": 19052000,
-    "Russia": 144444000,
-    "Serbia": 6655000,
-    "Slovakia": 5422000,
-    "Slovenia": 2117000,
-    "Spain": 47558000,
-    "Sweden": 10528000,
-    "Switzerland": 8797000,
-    "Ukraine": 36755000,
-    "United Kingdom": 67736000,
-}
-
 # =============================
 # SIMULACIÓN Y CONFIGURACIÓN
 # =============================
@@ -291,133 +261,59 @@ poblacion_paises = {
 url = "https://github.com/nvkelso/natural-earth-vector/raw/master/geojson/ne_110m_admin_0_countries.geojson"
 geojson_path = "ne_110m_admin_0_countries.geojson"
 
-if not os.path.exists(geojson_path):
-    print("Descargando mapa base de Europa...")
-    urllib.request.urlretrieve(url, geojson_path)
+cache_geometria_path = "ne_110m_europa.npz"
 
-world = gpd.read_file(geojson_path)
-europa = world[world['CONTINENT'] == 'Europe']
-paises = sorted(europa['NAME'].tolist())
+def cargar_mapa_europa():
+    """
+    Devuelve la geometría de Europa desde la caché binaria (simplificada y
+    proyectada). La caché se regenera si cambia el GeoJSON; solo se descarga
+    el mapa si no hay ni caché ni archivo fuente.
+    """
+    if not os.path.exists(geojson_path) and not os.path.exists(cache_geometria_path):
+        print("Descargando mapa base de Europa...")
+        urllib.request.urlretrieve(url, geojson_path)
 
-# Sistemas sanitarios por país
-sistemas_sanitarios = {
-    "Norway": "desarrollado", "Switzerland": "desarrollado", "Germany": "desarrollado",
-    "Sweden": "desarrollado", "Netherlands": "desarrollado", "Denmark": "desarrollado",
-    "Austria": "desarrollado", "Finland": "desarrollado", "Belgium": "desarrollado",
-    "France": "desarrollado", "United Kingdom": "desarrollado", "Ireland": "desarrollado",
-    "Luxembourg": "desarrollado",
+    return cargar_geometria(geojson_path, cache_geometria_path)
 
-    "Spain": "normal", "Italy": "normal", "Portugal": "normal", "Greece": "normal",
-    "Czechia": "normal", "Slovenia": "normal", "Estonia": "normal", "Poland": "normal",
-    "Slovakia": "normal", "Lithuania": "normal", "Latvia": "normal", "Croatia": "normal",
-    "Hungary": "normal",
+# Horizonte, paso y constantes del modelo. Cada simulación (y cada ventana)
+# puede recibir otra configuración sin tocar esta.
+configuracion_por_defecto = ConfiguracionSimulacion()
 
-    "Romania": "precario", "Bulgaria": "precario", "Serbia": "precario",
-    "Bosnia and Herz.": "precario", "Albania": "precario", "Moldova": "precario",
-    "Ukraine": "precario", "Belarus": "precario", "Russia": "precario",
-}
-
-# Parámetros del modelo SIR por sistema sanitario
-PARAMS_SISTEMA = {
-    "desarrollado": {
-        "beta": 0.08,
-        "gamma": 0.00,
-        "gamma_post": 0.10,
-        "mu": 0.00015,
-        "dia_recuperacion": 235,
-        "vac_inicio": 250,
-        "vac_rate": 0.010,
-        "umbral_contagiar": 20000,
-        "umbral_ser_contagiado": 20000,
-    },
-    "normal": {
-        "beta": 0.15,
-        "gamma": 0.00,
-        "gamma_post": 0.06,
-        "mu": 0.0004,
-        "dia_recuperacion": 235,
-        "vac_inicio": 240,
-        "vac_rate": 0.007,
-        "umbral_contagiar": 5000,
-        "umbral_ser_contagiado": 5000,
-    },
-    "precario": {
-        "beta": 0.3,
-        "gamma": 0.00,
-        "gamma_post": 0.05,
-        "mu": 0.0008,
-        "dia_recuperacion": 235,
-        "vac_inicio": 250,
-        "vac_rate": 0.003,
-        "umbral_contagiar": 1000,
-        "umbral_ser_contagiado": 1000,
-    }
-}
+# Parámetros por país como vectores, compilados una sola vez
+params_paises = configuracion_por_defecto.parametros(paises, config_paises, vecinos)
 
-config_paises = {}
-for pais in paises:
-    sistema = sistemas_sanitarios.get(pais, "normal")
-    poblacion = poblacion_paises.get(pais, 5000000)
-    params = PARAMS_SISTEMA[sistema]
+def parametros_de(configuracion):
+    """Parámetros por país de una configuración (reutiliza los ya compilados)"""
+    if configuracion is configuracion_por_defecto:
+        return params_paises
+    return configuracion.parametros(paises, config_paises, vecinos)
 
-    config_paises[pais] = {
-        "sistema": sistema,
-        "poblacion": poblacion,
-        "beta": params["beta"],
-        "gamma": params["gamma"],
-        "gamma_post": params["gamma_post"],
-        "mu": params["mu"],
-        "dia_recuperacion": params["dia_recuperacion"],
-        "vac_inicio": params["vac_inicio"],
-        "vac_rate": params["vac_rate"],
-        "umbral_contagiar": params["umbral_contagiar"],
-        "umbral_ser_contagiado": params["umbral_ser_contagiado"],
-    }
+# Escenarios ya simulados (parámetros, origen, semilla y configuración): los
+# recientes en memoria y los últimos CAPACIDAD_DISCO en archivos mapeados en disco
+cache_simulaciones_path = "simulaciones_cache"
+memoria_simulaciones = MemoriaSimulaciones(directorio=cache_simulaciones_path)
 
-dias = 300
-dt = 1.0
-TASA_CONTAGIO_BASE = 0.90
-INFECCION_INICIAL = 30
-
-# Vecinos (relaciones geográficas)
-vecinos = {
-    "France": ["Spain", "Italy", "Germany", "Belgium", "Switzerland"],
-    "Spain": ["France", "Portugal"],
-    "Italy": ["France", "Switzerland", "Austria", "Slovenia"],
-    "Germany": ["France", "Poland", "Czechia", "Austria", "Switzerland", "Belgium", "Netherlands", "Denmark"],
-    "Portugal": ["Spain"],
-    "United Kingdom": ["Ireland"],
-    "Ireland": ["United Kingdom"],
-    "Belgium": ["France", "Germany", "Netherlands"],
-    "Netherlands": ["Belgium", "Germany"],
-    "Poland": ["Germany", "Czechia", "Slovakia", "Ukraine", "Belarus", "Lithuania"],
-    "Czechia": ["Germany", "Poland", "Slovakia", "Austria"],
-    "Austria": ["Germany", "Czechia Rep.", "Slovakia", "Hungary", "Slovenia", "Italy", "Switzerland"],
-    "Switzerland": ["France", "Germany", "Austria", "Italy"],
-    "Greece": ["Albania", "Bulgaria"],
-    "Romania": ["Hungary", "Serbia", "Bulgaria", "Ukraine", "Moldova"],
-    "Hungary": ["Austria", "Slovakia", "Ukraine", "Romania", "Serbia", "Croatia", "Slovenia"],
-    "Sweden": ["Norway", "Finland"],
-    "Norway": ["Sweden", "Finland"],
-    "Finland": ["Sweden", "Norway", "Russia"],
-    "Denmark": ["Germany", "Sweden"],
-    "Croatia": ["Slovenia", "Hungary", "Serbia", "Bosnia and Herz."],
-    "Serbia": ["Hungary", "Romania", "Bulgaria", "Croatia", "Bosnia and Herz."],
-    "Bulgaria": ["Romania", "Serbia", "Greece"],
-    "Ukraine": ["Poland", "Slovakia", "Hungary", "Romania", "Moldova", "Russia", "Belarus"],
-    "Belarus": ["Poland", "Lithuania", "Latvia", "Russia", "Ukraine"],
-    "Lithuania": ["Poland", "Belarus", "Latvia", "Russia"],
-    "Latvia": ["Lithuania", "Belarus", "Russia", "Estonia"],
-    "Estonia": ["Latvia", "Russia"],
-    "Slovakia": ["Poland", "Czechia", "Austria", "Hungary", "Ukraine"],
-    "Slovenia": ["Italy", "Austria", "Hungary", "Croatia"],
-    "Albania": ["Greece", "Serbia"],
-    "Bosnia and Herz.": ["Croatia", "Serbia"],
-    "Moldova": ["Romania", "Ukraine"],
-    "Russia": ["Norway", "Finland", "Estonia", "Latvia", "Lithuania", "Belarus", "Ukraine"]
-}
+def semilla_guardada(directorio):
+    """
+    Semilla de la interfaz guardada en `directorio`: se sortea la primera vez
+    y las sesiones siguientes la reutilizan, así que volver a simular un
+    escenario da la misma clave y se reabre desde el disco. Borrar el
+    archivo da una semilla nueva.
+    """
+    ruta = os.path.join(directorio, "semilla.txt")
+    try:
+        with open(ruta, encoding="utf-8") as archivo:
+            return int(archivo.read())
+    except (OSError, ValueError):
+        pass
+    semilla = int(np.random.SeedSequence().generate_state(1)[0])
+    os.makedirs(directorio, exist_ok=True)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write(str(semilla))
+    return semilla
 
-def iniciar_simulacion(pais_inicial):
+def ejecutar_simulacion(pais_inicial, semilla=None, configuracion=configuracion_por_defecto,
+                        memoria=None):
     """
     Modelo SIRD (Susceptible-Infectado-Recuperado-Muerto) con vacunación
     y RECUPERACIÓN RETARDADA
@@ -429,204 +325,114 @@ def iniciar_simulacion(pais_inicial):
     dD/dt = μ*I
     
     donde γ(t) = 0 si t < día_recuperación, sino γ_post
+
+    Usa el motor vectorizado (todos los países en un solo paso de Euler).
+    Con la misma semilla produce las mismas trayectorias que
+    simulacion.referencia.iniciar_simulacion_fuerza_bruta. Con una
+    MemoriaSimulaciones (p. ej. memoria_simulaciones) y semilla, un escenario
+    ya simulado se devuelve sin recalcularlo.
     """
-    
-    # Inicializar compartimentos
-    datos_S = {pais: np.zeros(dias) for pais in paises}
-    datos_I = {pais: np.zeros(dias) for pais in paises}
-    datos_R = {pais: np.zeros(dias) for pais in paises}
-    datos_D = {pais: np.zeros(dias) for pais in paises}
-    datos_V = {pais: np.zeros(dias) for pais in paises}
+    imprimir_encabezado_simulacion(pais_inicial)
+
+    if memoria is not None:
+        resultado = memoria.simular(parametros_de(configuracion), pais_inicial, semilla,
+                                    configuracion, imprimir=True)
+    else:
+        resultado = simular_sird(parametros_de(configuracion), pais_inicial, semilla=semilla,
+                                 imprimir=True, configuracion=configuracion)
+    imprimir_resumen_simulacion(resultado, configuracion.dias)
+
+    return resultado
 
+def imprimir_resumen_simulacion(resultado, dias_simulados):
     print(f"\n{'='*70}")
-    print(f"INICIANDO SIMULACIÓN - MODELO SIRD CON UMBRALES PERSONALIZADOS")
-    print(f"País inicial: {pais_inicial}")
-    print(f"Población: {config_paises[pais_inicial]['poblacion']:,}")
-    print(f"Sistema: {config_paises[pais_inicial]['sistema'].upper()}")
-    print(f"Umbral para contagiar: {config_paises[pais_inicial]['umbral_contagiar']:,}")
-    print(f"Umbral de resistencia: {config_paises[pais_inicial]['umbral_ser_contagiado']:,}")
-    print(f"")
-    print(f"UMBRALES POR SISTEMA:")
-    print(f"🟢 Desarrollado: contagia a 15k | se infecta a 40k")
-    print(f"🟡 Normal:        contagia a 10k | se infecta a 20k")
-    print(f"🔴 Precario:      contagia a  5k | se infecta a 10k")
+    print(f"SIMULACIÓN COMPLETADA")
+    print(f"Total de días simulados: {dias_simulados}")
+    print(f"Países infectados: {int((resultado.dia_llegada >= 0).sum())}/{len(paises)}")
     print(f"{'='*70}\n")
 
-    # Condiciones iniciales
-    for pais in paises:
-        config = config_paises[pais]
-        N = config["poblacion"]
-        datos_I[pais] = [0 for _ in range(dias)]
-        datos_S[pais] = [N for _ in range(dias)]
-        if pais == pais_inicial:
-            datos_I[pais][0] = INFECCION_INICIAL
-            print(datos_I[pais])
-            datos_S[pais][0] = N - INFECCION_INICIAL
-            print(datos_S[pais])
-        
-        datos_R[pais] = [0 for _ in range(dias)]
-        datos_D[pais] = [0 for _ in range(dias)]
-        datos_V[pais] = [0 for _ in range(dias)]
-
-    np.random.seed()
-    paises_infectados = {pais_inicial}
-    
-    recuperacion_iniciada = False
+def iniciar_simulacion(pais_inicial, semilla=None, configuracion=configuracion_por_defecto):
+    """
+    Igual que ejecutar_simulacion, pero devuelve los diccionarios
+    (datos_I, datos_D, datos_R, datos_S, datos_V) con una serie por país.
+    """
+    return ejecutar_simulacion(pais_inicial, semilla, configuracion).como_diccionarios()
 
-    # Integración temporal (Método de Euler)
-    for dia in range(1, dias):
-        # FASE 1: Verificar contagios ANTES de actualizar ecuaciones
-        nuevos_contagios = []
-        
-        for pais in paises:
-            if pais not in paises_infectados:
-                continue
-                
-            config = config_paises[pais]
-            
-            # Contagio a países vecinos
-            if datos_I[pais][dia - 1] >= config["umbral_contagiar"] and pais in vecinos:
-                for vecino in vecinos[pais]:
-                    if vecino in paises and vecino not in paises_infectados:
-                        config_vecino = config_paises[vecino]
-                        
-                        if datos_I[pais][dia - 1] >= config_vecino["umbral_ser_contagiado"]:
-                            prob_contagio = TASA_CONTAGIO_BASE
-                            
-                            if config_vecino["sistema"] == "desarrollado":
-                                prob_contagio *= 0.4
-                            elif config_vecino["sistema"] == "precario":
-                                prob_contagio *= 2.0
-                            
-                            if np.random.random() < prob_contagio:
-                                nuevos_contagios.append((pais, vecino))
-                                print(pais, vecino)
-        
-        # Aplicar contagios
-        print(nuevos_contagios)
-        for pais_origen, vecino in nuevos_contagios:
-            print(vecino)
-            if vecino not in paises_infectados:
-                paises_infectados.add(vecino)
-                config_vecino = config_paises[vecino]
-                N_vecino = config_vecino["poblacion"]
-                datos_I[vecino][dia] = INFECCION_INICIAL
-                datos_S[vecino][dia] = N_vecino - INFECCION_INICIAL
-                datos_R[vecino][dia] = 0
-                datos_D[vecino][dia] = 0
-                datos_V[vecino][dia] = 0
-                
-                print(f"Día {dia}: {pais_origen} ({int(datos_I[pais_origen][dia-1]):,} inf.) → {vecino} "
-                    f"[{config_paises[vecino]['sistema']}] (inicializado con {INFECCION_INICIAL} inf.)")
-        
-        # Verificar recuperación
-        if not recuperacion_iniciada:
-            for pais in paises:
-                if pais in paises_infectados:
-                    config = config_paises[pais]
-                    if dia >= config["dia_recuperacion"]:
-                        print(f"\n{'*'*70}")
-                        print(f"🏥 DÍA {dia}: ¡FASE DE RECUPERACIÓN INICIADA!")
-                        print(f"Los sistemas de salud comienzan a recuperar pacientes")
-                        print(f"{'*'*70}\n")
-                        recuperacion_iniciada = True
-                        break
-        
-        # FASE 2: Actualizar ecuaciones diferenciales
-        for pais in paises:
-            if pais in [vecino for _, vecino in nuevos_contagios]:
-                continue
-            
-            if pais not in paises_infectados:
-                continue
-            config = config_paises[pais]
-            N = config["poblacion"]
-            
-            # Estado actual
-            S = max(0, min(datos_S[pais][dia - 1], N-INFECCION_INICIAL))
-            I = max(INFECCION_INICIAL, datos_I[pais][dia - 1])
-            R = max(0, datos_R[pais][dia - 1])
-            D = max(0, datos_D[pais][dia - 1])
-            V_acum = datos_V[pais][dia - 1]
+def reanudar_simulacion(ruta_punto_control, configuracion=configuracion_por_defecto):
+    """
+    Continúa hasta el final una simulación guardada con
+    MotorSIRD.guardar_punto_control y devuelve el ResultadoSIRD completo.
+    """
+    motor = MotorSIRD.cargar_punto_control(ruta_punto_control, parametros_de(configuracion),
+                                           imprimir=True)
+    print(f"Reanudando simulación desde el día {motor.dia_actual}")
+    resultado = motor.ejecutar()
+    imprimir_resumen_simulacion(resultado, motor.dias)
+    return resultado
 
-            # Parámetros del modelo
-            beta = config["beta"]
-            mu = config["mu"]
-            
-            # Tasa de recuperación variable
-            if dia < config["dia_recuperacion"]:
-                gamma = 0.0
-            else:
-                gamma = config["gamma_post"]
+def iterar_simulacion(pais_inicial, semilla=None, configuracion=configuracion_por_defecto):
+    """
+    Versión en streaming de iniciar_simulacion: genera un EstadoDiario por
+    día (vectores S/I/R/D/V en el orden de `paises`) sin guardar el historial,
+    de modo que la memoria no crece con los días. Con
+    configuracion.reemplazar(dias=None) simula sin límite; basta con dejar de
+    consumir el generador para parar.
+    """
+    return iterar_sird(parametros_de(configuracion), pais_inicial, semilla=semilla,
+                       configuracion=configuracion)
 
-            # Vacunación
-            vac_inicio = config["vac_inicio"]
-            vac_rate = config["vac_rate"]
-            
-            if dia >= vac_inicio and S > 0:
-                nu = min(vac_rate * N, S)
-            else:
-                nu = 0
+# =============================
+# INTERFAZ PRINCIPAL
+# =============================
 
-            # Ecuaciones diferenciales del modelo SIRD
-            dS = -(beta * S * I / N) - nu
-            dI = (beta * S * I / N) - gamma * I - mu * I
-            dR = gamma * I + nu
-            dD = mu * I
+# Tipo de mapa -> (compartimento, fracción de población para vmax, paleta, título)
+ESTILOS_MAPA = {
+    "infectados": ("I", 0.05, "Reds", "Infectados Activos"),
+    "muertes": ("D", 0.003, "Greys", "Muertes Acumuladas"),
+    "recuperados": ("R", 0.15, "Greens", "Recuperados"),
+    "susceptibles": ("S", 1.0, "Blues", "Susceptibles"),
+}
 
-            # Actualizar estados (Método de Euler)
-            if dia%10 == 0:
-                print(f'Pais: {pais}, dia: {dia}, beta: {beta}, S: {S}, I: {I}, N: {N}')
-            datos_S[pais][dia] = max(0, S + dS * dt)
-            datos_I[pais][dia] = max(0, I + dI * dt)
-            datos_R[pais][dia] = max(0, R + dR * dt)
-            datos_D[pais][dia] = max(0, D + dD * dt)
-            datos_V[pais][dia] = V_acum + nu
+# Compartimento de cada criterio de ordenamiento de la tabla
+COLUMNAS_TABLA = {"infectados": "I", "muertes": "D", "recuperados": "R"}
 
-            # Contagio a países vecinos
-            if pais in paises_infectados and datos_I[pais][dia] >= config["umbral_contagiar"]:
-                if pais in vecinos:
-                    for vecino in vecinos[pais]:
-                        if vecino in paises and vecino not in paises_infectados:
-                            config_vecino = config_paises[vecino]
-                            
-                            if datos_I[pais][dia] >= config_vecino["umbral_ser_contagiado"]:
-                                prob_contagio = TASA_CONTAGIO_BASE
-                                
-                                if config_vecino["sistema"] == "desarrollado":
-                                    prob_contagio *= 0.5
-                                elif config_vecino["sistema"] == "precario":
-                                    prob_contagio *= 2.0
-                                
-                                if np.random.random() < prob_contagio:
-                                    paises_infectados.add(vecino)
-                                    S_vecino = datos_S[vecino][dia - 1] if dia > 0 else config_paises[vecino]["poblacion"]
-                                    casos_importados = min(INFECCION_INICIAL, S_vecino)
-                                    
-                                    if casos_importados < INFECCION_INICIAL:
-                                        casos_importados = INFECCION_INICIAL
-                                    
-                                    datos_I[vecino][dia] = max(datos_I[vecino][dia], casos_importados)
-                                    datos_S[vecino][dia] = max(0, datos_S[vecino][dia] - casos_importados)
-                                    
-                                    print(f"Día {dia}: {pais} ({int(datos_I[pais][dia]):,} inf.) → {vecino} "
-                                        f"[{config_vecino['sistema']}] ({int(casos_importados)} inf. iniciales)")
+# Países que muestra el análisis "Top" (los peores del día)
+TOP_PAISES = 5
 
-    print(f"\n{'='*70}")
-    print(f"SIMULACIÓN COMPLETADA")
-    print(f"Total de días simulados: {dias}")
-    print(f"Países infectados: {len(paises_infectados)}/{len(paises)}")
-    print(f"{'='*70}\n")
-    
-    return datos_I, datos_D, datos_R, datos_S, datos_V
+# Id estable de la fila de totales en la tabla (las demás usan el nombre del país)
+ID_FILA_TOTAL = "__total__"
 
-# =============================
-# INTERFAZ PRINCIPAL
-# =============================
+def emoji_sistema(sistema):
+    return "🟢" if sistema == "desarrollado" else ("🟡" if sistema == "normal" else "🔴")
 
 class SimuladorPandemia:
-    def __init__(self, root):
+    # True: los análisis y la tabla ordenada usan los algoritmos de divide y
+    # vencerás originales sobre listas (camino de referencia para comparar)
+    analisis_referencia = False
+    # Orden desde cero de la tabla: "numpy" (argsort_estable) o "mezcla"
+    # (OrdenadorMezcla, merge sort sobre búferes reutilizados); mismo resultado
+    ordenamiento_tabla = "numpy"
+    
+    def __init__(self, root, configuracion=configuracion_por_defecto, semilla=None,
+                 memoria=memoria_simulaciones):
         self.root = root
+        self.configuracion = configuracion
+        self.params = parametros_de(configuracion)
+        self.memoria = memoria if memoria is not None else MemoriaSimulaciones()
+        # Semilla fija para que volver a simular un país reabra el escenario
+        # guardado: con almacén en disco, la guardada junto a él (vale entre
+        # sesiones); sin él (memoria=None), una nueva por sesión
+        if semilla is None:
+            if self.memoria.almacen is not None:
+                semilla = semilla_guardada(self.memoria.almacen.directorio)
+            else:
+                semilla = int(np.random.SeedSequence().generate_state(1)[0])
+        self.semilla = semilla
+        self.clave_resultado = None
+        # El aviso de recuperación va desde el primer día de recuperación hasta
+        # que la vacunación ha empezado en todos los sistemas sanitarios
+        self.dia_aviso_recuperacion = int(self.params.dia_recuperacion.min())
+        self.dia_fin_aviso = int(self.params.vac_inicio.max())
         self.root.title("Simulador de Pandemia COVID-19 - Modelo SIRD con Algoritmos Voraces")
         
         ancho_pantalla = root.winfo_screenwidth()
@@ -639,6 +445,16 @@ class SimuladorPandemia:
         self.datos_recuperados = None
         self.datos_susceptibles = None
         self.datos_vacunados = None
+        self.resultado = None
+        self.trabajador = None
+        self.dias_calculados = 0
+        self.id_animacion = None
+        # Criterio del último "Ordenar" y orden de países que se repara día a día
+        self.criterio_tabla = None
+        self.ranking = RankingIncremental(
+            descendente=True,
+            ordenador=OrdenadorMezcla() if self.ordenamiento_tabla == "mezcla" else None)
+        self.geometria = cargar_mapa_europa()
         
         self.frame_principal = tk.PanedWindow(root, orient=tk.HORIZONTAL)
         self.frame_principal.pack(fill="both", expand=True, padx=10, pady=10)
@@ -657,6 +473,11 @@ class SimuladorPandemia:
                                     command=self.iniciar_simulacion, height=2)
         self.boton_iniciar.pack(pady=10, padx=10, fill="x")
         
+        self.boton_cancelar = tk.Button(self.frame_izquierdo, text="⏹️ Cancelar Cálculo",
+                                    font=("Arial", 10), command=self.cancelar_simulacion,
+                                    state="disabled")
+        self.boton_cancelar.pack(pady=2, padx=10, fill="x")
+        
         # Separador
         ttk.Separator(self.frame_izquierdo, orient='horizontal').pack(fill='x', pady=10)
         
@@ -691,12 +512,20 @@ class SimuladorPandemia:
                 command=lambda: self.analizar("max_recuperados"), font=("Arial", 10)).pack(fill="x", pady=2)
         tk.Button(frame_botones_analisis, text="📅 Día Pico Infecciones", 
                 command=lambda: self.analizar("dia_pico"), font=("Arial", 10)).pack(fill="x", pady=2)
+        tk.Button(frame_botones_analisis, text=f"🏆 Top {TOP_PAISES} Muertes (Día Actual)", 
+                command=lambda: self.analizar("top_muertes"), font=("Arial", 10)).pack(fill="x", pady=2)
+        tk.Button(frame_botones_analisis, text="📐 Mediana Infectados (Día Actual)", 
+                command=lambda: self.analizar("mediana_infectados"), font=("Arial", 10)).pack(fill="x", pady=2)
         tk.Button(frame_botones_analisis, text="🔽 Ordenar: Infectados", 
                 command=lambda: self.ordenar_tabla("infectados"), font=("Arial", 10)).pack(fill="x", pady=2)
         tk.Button(frame_botones_analisis, text="🔽 Ordenar: Muertes", 
                 command=lambda: self.ordenar_tabla("muertes"), font=("Arial", 10)).pack(fill="x", pady=2)
         tk.Button(frame_botones_analisis, text="🔽 Ordenar: Recuperados", 
                 command=lambda: self.ordenar_tabla("recuperados"), font=("Arial", 10)).pack(fill="x", pady=2)
+        self.orden_vivo = tk.BooleanVar(value=False)
+        tk.Checkbutton(frame_botones_analisis, text="🔄 Mantener orden durante la animación",
+                       variable=self.orden_vivo, command=self.cambiar_orden_vivo,
+                       font=("Arial", 10)).pack(fill="x", pady=2)
         
         # Separador
         ttk.Separator(self.frame_izquierdo, orient='horizontal').pack(fill='x', pady=10)
@@ -726,6 +555,7 @@ class SimuladorPandemia:
         scrollbar_tabla = ttk.Scrollbar(self.frame_izquierdo, orient="vertical", command=self.tabla.yview)
         self.tabla.configure(yscroll=scrollbar_tabla.set)
         scrollbar_tabla.pack(side="right", fill="y")
+        self.modelo_tabla = ModeloTabla(self.tabla)
         # ===== COLUMNA DERECHA =====
         self.frame_derecho = tk.Frame(self.frame_principal)
         self.frame_principal.add(self.frame_derecho)
@@ -754,17 +584,24 @@ class SimuladorPandemia:
         self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=5)
         
         self.dia_actual = tk.IntVar(value=0)
-        self.slider = ttk.Scale(self.frame_derecho, from_=0, to=dias-1, 
+        self.slider = ttk.Scale(self.frame_derecho, from_=0, to=configuracion.dias-1, 
                             orient="horizontal", variable=self.dia_actual,
                             command=self.actualizar_dia)
         self.slider.pack(fill="x", padx=20, pady=5)
         
-        self.label_dia = tk.Label(self.frame_derecho, text="Día: 0 / 300", font=("Arial", 11, "bold"))
+        self.label_dia = tk.Label(self.frame_derecho, text=f"Día: 0 / {configuracion.dias}",
+                                  font=("Arial", 11, "bold"))
         self.label_dia.pack(pady=5)
         
         self.tipo_mapa = "infectados"
         self.dia_simulacion = 0
-        self.colorbar = None
+        self.renderizador = None
+
+        # Fila de cada país del mapa en los arrays de resultados (-1 si no se simula)
+        self.fila_mapa = np.array([paises.index(n) if n in paises else -1
+                                   for n in self.geometria.nombres])
+        self.cache_mapa = CacheLRU(self._calcular_valores_mapa)
+        self.cache_tabla = CacheLRU(self._calcular_filas_tabla)
         
         self.mostrar_mensaje_inicial()
     
@@ -781,19 +618,48 @@ class SimuladorPandemia:
             messagebox.showwarning("Advertencia", "Selecciona un país inicial")
             return
         
-        self.boton_iniciar.config(state="disabled", text="⏳ Calculando...")
-        self.root.update()
+        if self.trabajador is not None:
+            self.trabajador.cancelar()
+        
+        imprimir_encabezado_simulacion(pais_inicial)
+        self.clave_resultado = clave_simulacion(self.params, pais_inicial, self.semilla,
+                                                self.configuracion)
+        guardado = self.memoria.obtener(self.clave_resultado)
+        if guardado is not None:
+            # Escenario ya simulado: se reabre sin recalcular nada
+            self.trabajador = None
+            self.resultado = guardado
+            self.dias_calculados = self.configuracion.dias
+            self.boton_iniciar.config(state="normal", text="▶️ Iniciar Simulación")
+            self.boton_cancelar.config(state="disabled")
+            imprimir_resumen_simulacion(self.resultado, self.dias_calculados)
+        else:
+            self.boton_iniciar.config(state="disabled", text="⏳ Calculando...")
+            self.boton_cancelar.config(state="normal")
+            # El motor corre en un hilo aparte; el mapa empieza a animarse con
+            # los primeros días mientras el resto se sigue calculando
+            motor = self.configuracion.crear_motor(self.params, pais_inicial,
+                                                   semilla=self.semilla, imprimir=True)
+            self.resultado = motor.resultado()
+            self.dias_calculados = 1
+            self.trabajador = TrabajadorSimulacion(motor)
         
         self.datos_infectados, self.datos_muertes, self.datos_recuperados, \
-        self.datos_susceptibles, self.datos_vacunados = iniciar_simulacion(pais_inicial)
+        self.datos_susceptibles, self.datos_vacunados = self.resultado.como_diccionarios()
+        self.cache_mapa.limpiar()
+        self.cache_tabla.limpiar()
+        if self.trabajador is not None:
+            self.trabajador.iniciar()
+            self.revisar_trabajador(self.trabajador)
         
         self.dia_simulacion = 0
         self.slider.set(0)
         self.pausado = False
         self.boton_pausa.config(text="⏸️ Pausar")
-        self.boton_iniciar.config(state="normal", text="▶️ Iniciar Simulación")
         
         self.actualizar_mapa(inicial=True)
+        if self.id_animacion is not None:
+            self.root.after_cancel(self.id_animacion)
         self.simular_tiempo()
         
         config = config_paises[pais_inicial]
@@ -805,6 +671,46 @@ class SimuladorPandemia:
                         f"Contagia a vecinos: {config['umbral_contagiar']:,} infectados\n"
                         f"Se infecta cuando vecino tiene: {config['umbral_ser_contagiado']:,}")
     
+    def calculando(self):
+        return self.trabajador is not None and self.dias_calculados < self.configuracion.dias
+    
+    def revisar_trabajador(self, trabajador):
+        """Recoge los días que el hilo de simulación ya terminó"""
+        if trabajador is not self.trabajador:
+            return  # simulación reemplazada por otra
+        
+        for tipo, dato in trabajador.mensajes():
+            if tipo == "progreso":
+                self.dias_calculados = dato
+                self.boton_iniciar.config(text=f"⏳ Calculando... ({dato}/{self.configuracion.dias})")
+            elif tipo in ("fin", "cancelado"):
+                self.dias_calculados = dato
+                self.boton_iniciar.config(state="normal", text="▶️ Iniciar Simulación")
+                self.boton_cancelar.config(state="disabled")
+                imprimir_resumen_simulacion(self.resultado, dato)
+                if tipo == "fin":
+                    self.memoria.guardar(self.clave_resultado, self.resultado)
+                if tipo == "cancelado":
+                    messagebox.showinfo("⏹️ Cálculo Cancelado",
+                                        f"Se conservan los primeros {dato} días simulados")
+                    # Sin más días por calcular, el resto de la interfaz trata la
+                    # simulación como terminada
+                    self.trabajador = None
+                return
+            elif tipo == "error":
+                self.boton_iniciar.config(state="normal", text="▶️ Iniciar Simulación")
+                self.boton_cancelar.config(state="disabled")
+                self.trabajador = None
+                messagebox.showerror("Error", f"La simulación falló:\n{dato}")
+                return
+        
+        self.root.after(50, self.revisar_trabajador, trabajador)
+    
+    def cancelar_simulacion(self):
+        if self.trabajador is not None:
+            self.trabajador.cancelar()
+            self.boton_cancelar.config(state="disabled")
+    
     # ===== MÉTODOS DE ALGORITMOS VORACES =====
     
     def predecir_ruta_voraz(self):
@@ -975,10 +881,12 @@ class SimuladorPandemia:
         if self.datos_infectados is None:
             messagebox.showwarning("Advertencia", "Inicia la simulación primero")
             return
+        if self.calculando():
+            messagebox.showwarning("Advertencia", "Espera a que termine el cálculo de la simulación")
+            return
         
         if tipo == "max_infectados":
-            valores = [max(self.datos_infectados[p]) for p in paises]
-            max_val, idx = encontrar_maximo_DyV(valores, 0, len(valores)-1)
+            max_val, idx = self._maximo_analisis("I")
             pais = paises[idx]
             pct = (max_val / config_paises[pais]["poblacion"]) * 100
             messagebox.showinfo("📊 Análisis - Máximo", 
@@ -989,18 +897,16 @@ class SimuladorPandemia:
                 f"Sistema: {config_paises[pais]['sistema'].capitalize()}")
         
         elif tipo == "max_muertes":
-            valores = [max(self.datos_muertes[p]) for p in paises]
-            max_val, idx = encontrar_maximo_DyV(valores, 0, len(valores)-1)
+            max_val, idx = self._maximo_analisis("D")
             pais = paises[idx]
             messagebox.showinfo("⚫ Análisis - Máximo", 
                 f"País con MÁS muertes acumuladas:\n\n"
                 f"⚫ {pais}\n"
                 f"Muertes: {int(max_val):,}\n"
-                f"Letalidad: {(max_val/max(self.datos_infectados[pais]))*100:.2f}%")
+                f"Letalidad: {(max_val/self.resultado.maximos('I')[idx])*100:.2f}%")
         
         elif tipo == "max_recuperados":
-            valores = [max(self.datos_recuperados[p]) for p in paises]
-            max_val, idx = encontrar_maximo_DyV(valores, 0, len(valores)-1)
+            max_val, idx = self._maximo_analisis("R")
             pais = paises[idx]
             messagebox.showinfo("🟢 Análisis - Máximo", 
                 f"País con MÁS recuperados:\n\n"
@@ -1008,45 +914,100 @@ class SimuladorPandemia:
                 f"Recuperados: {int(max_val):,}")
         
         elif tipo == "dia_pico":
-            infectados_diarios = [sum(self.datos_infectados[p][d] for p in paises) for d in range(dias)]
-            max_val, dia = encontrar_maximo_DyV(infectados_diarios, 0, len(infectados_diarios)-1)
+            max_val, dia = self._dia_pico_analisis()
             messagebox.showinfo("📅 Análisis - Día Pico", 
                 f"Día con MÁS infectados activos en toda Europa:\n\n"
                 f"📅 Día {dia+1}\n"
                 f"Total infectados: {int(max_val):,}\n"
                 f"Fecha aprox: {dia+1} días después del brote inicial")
+        
+        elif tipo == "top_muertes":
+            dia = self.dia_simulacion
+            valores, indices = self._top_analisis("D", dia, TOP_PAISES)
+            lineas = [f"{pos}. {paises[idx]}: {int(val):,}"
+                      for pos, (val, idx) in enumerate(zip(valores, indices), 1)]
+            messagebox.showinfo("🏆 Análisis - Top", 
+                f"Países con MÁS muertes acumuladas el día {dia+1}:\n\n" + "\n".join(lineas))
+        
+        elif tipo == "mediana_infectados":
+            dia = self.dia_simulacion
+            valor, idx = self._mediana_analisis("I", dia)
+            messagebox.showinfo("📐 Análisis - Mediana", 
+                f"Mediana de infectados activos por país el día {dia+1}:\n\n"
+                f"Infectados: {int(valor):,}\n"
+                f"País en la mediana: {paises[idx]}")
+    
+    def _maximo_analisis(self, compartimento):
+        """(valor, índice del país) del mayor máximo de un compartimento"""
+        if self.analisis_referencia:
+            datos = {"I": self.datos_infectados, "D": self.datos_muertes,
+                     "R": self.datos_recuperados}[compartimento]
+            valores = [max(datos[p]) for p in paises]
+            return encontrar_maximo_DyV(valores, 0, len(valores)-1)
+        # Máximos por país memorizados en el resultado y una sola reducción
+        return extremo(self.resultado.maximos(compartimento))
+    
+    def _dia_pico_analisis(self):
+        """(total, día) del día con más infectados activos en toda Europa"""
+        if self.analisis_referencia:
+            infectados_diarios = [sum(self.datos_infectados[p][d] for p in paises)
+                                  for d in range(self.configuracion.dias)]
+            return encontrar_maximo_DyV(infectados_diarios, 0, len(infectados_diarios)-1)
+        return extremo(self.resultado.totales("I"))
+    
+    def _top_analisis(self, compartimento, dia, k):
+        """(valores, índices) de los k países con más casos del compartimento en un día"""
+        if self.analisis_referencia:
+            return top_k_heap(list(getattr(self.resultado, compartimento)[:, dia]), k)
+        valores, indices = top_k_por_dia(getattr(self.resultado, compartimento)[:, dia:dia+1], k)
+        return valores[0], indices[0]
+    
+    def _mediana_analisis(self, compartimento, dia):
+        """(valor, índice del país) de la mediana de un compartimento en un día"""
+        columna = getattr(self.resultado, compartimento)[:, dia]
+        if self.analisis_referencia:
+            return seleccionar_DyV(list(columna), len(columna) // 2)
+        return k_esimo(columna, len(columna) // 2)
     
     def ordenar_tabla(self, criterio):
         if self.datos_infectados is None:
             return
         
-        if criterio == "infectados":
-            valores = [self.datos_infectados[p][self.dia_simulacion] for p in paises]
-        elif criterio == "muertes":
-            valores = [self.datos_muertes[p][self.dia_simulacion] for p in paises]
-        elif criterio == "recuperados":
-            valores = [self.datos_recuperados[p][self.dia_simulacion] for p in paises]
-        
-        indices = list(range(len(paises)))
-        valores_ordenados, indices_ordenados = merge_sort_DyV(valores.copy(), indices, descendente=True)
-        
-        for i in self.tabla.get_children():
-            self.tabla.delete(i)
+        self.criterio_tabla = criterio
+        dia = self.dia_simulacion
+        columna = getattr(self.resultado, COLUMNAS_TABLA[criterio])[:, dia]
         
+        if self.analisis_referencia:
+            valores = list(columna)
+            indices = list(range(len(paises)))
+            valores_ordenados, indices_ordenados = merge_sort_DyV(valores.copy(), indices, descendente=True)
+        else:
+            indices_ordenados = self.ranking.reiniciar(columna)
+        self.modelo_tabla.mostrar(self._filas_ordenadas(dia, indices_ordenados))
+    
+    def _filas_ordenadas(self, dia, indices_ordenados):
+        """Filas (id, valores) de todos los países en el orden dado, más los totales"""
+        I = self.resultado.I[:, dia]
+        D = self.resultado.D[:, dia]
+        R = self.resultado.R[:, dia]
+        filas = []
         total_inf = total_mue = total_rec = 0
         for idx in indices_ordenados:
             pais = paises[idx]
-            sistema = config_paises[pais]["sistema"]
-            emoji = "🟢" if sistema == "desarrollado" else ("🟡" if sistema == "normal" else "🔴")
-            inf = int(self.datos_infectados[pais][self.dia_simulacion])
-            mue = int(self.datos_muertes[pais][self.dia_simulacion])
-            rec = int(self.datos_recuperados[pais][self.dia_simulacion])
-            self.tabla.insert("", "end", values=(pais, emoji, inf, mue, rec))
+            inf, mue, rec = int(I[idx]), int(D[idx]), int(R[idx])
+            filas.append((pais, (pais, emoji_sistema(config_paises[pais]["sistema"]), inf, mue, rec)))
             total_inf += inf
             total_mue += mue
             total_rec += rec
         
-        self.tabla.insert("", "end", values=("═══ TOTAL ═══", "", total_inf, total_mue, total_rec))
+        filas.append((ID_FILA_TOTAL, ("═══ TOTAL ═══", "", total_inf, total_mue, total_rec)))
+        return filas
+    
+    def cambiar_orden_vivo(self):
+        if self.orden_vivo.get() and self.criterio_tabla is None:
+            self.criterio_tabla = "infectados"
+        if self.datos_infectados is not None:
+            self.actualizar_tabla()
     
     # ===== MÉTODOS DE VISUALIZACIÓN =====
     
@@ -1065,99 +1026,88 @@ class SimuladorPandemia:
     def actualizar_dia(self, _=None):
         if self.datos_infectados is None:
             return
-        self.dia_simulacion = int(self.dia_actual.get())
+        # Solo se muestran días ya calculados
+        self.dia_simulacion = min(int(self.dia_actual.get()), self.dias_calculados - 1)
         self.actualizar_mapa()
     
     def actualizar_mapa(self, inicial=False):
         if self.datos_infectados is None:
             return
 
-        if self.tipo_mapa == "infectados":
-            valores_dict = {pais: self.datos_infectados[pais][self.dia_simulacion] for pais in paises}
-            vmax = max(config_paises[p]["poblacion"] * 0.05 for p in paises)
-            color = "Reds"
-            titulo = "Infectados Activos"
-        elif self.tipo_mapa == "muertes":
-            valores_dict = {pais: self.datos_muertes[pais][self.dia_simulacion] for pais in paises}
-            vmax = max(config_paises[p]["poblacion"] * 0.003 for p in paises)
-            color = "Greys"
-            titulo = "Muertes Acumuladas"
-        elif self.tipo_mapa == "recuperados":
-            valores_dict = {pais: self.datos_recuperados[pais][self.dia_simulacion] for pais in paises}
-            vmax = max(config_paises[p]["poblacion"] * 0.15 for p in paises)
-            color = "Greens"
-            titulo = "Recuperados"
-        elif self.tipo_mapa == "susceptibles":
-            valores_dict = {pais: self.datos_susceptibles[pais][self.dia_simulacion] for pais in paises}
-            vmax = max(config_paises[p]["poblacion"] for p in paises)
-            color = "Blues"
-            titulo = "Susceptibles"
-
-        europa_plot = europa.copy()
-        europa_plot["valor"] = europa_plot['NAME'].map(valores_dict).fillna(0)
+        _, fraccion, color, titulo = ESTILOS_MAPA[self.tipo_mapa]
+        valores = self.cache_mapa.obtener((self.tipo_mapa, self.dia_simulacion))
 
-        self.ax.clear()
-        europa_plot.plot(column="valor", cmap=color, linewidth=0.8, ax=self.ax,
-                        edgecolor="black", legend=False, vmin=0, vmax=vmax)
+        # Los polígonos se crean una sola vez; después solo cambian sus colores
+        if self.renderizador is None:
+            self.ax.clear()
+            self.renderizador = RenderizadorMapa(self.fig, self.ax, self.canvas, self.geometria)
+        if inicial:
+            vmax = max(config_paises[p]["poblacion"] * fraccion for p in paises)
+            self.renderizador.configurar(color, vmax)
+        self.renderizador.actualizar(valores, f"{titulo} - Día {self.dia_simulacion + 1}")
 
-        self.ax.set_xlim(-25, 60)
-        self.ax.set_ylim(34, 72)
-        self.ax.set_title(f"{titulo} - Día {self.dia_simulacion + 1}", fontsize=14, fontweight='bold')
-        self.ax.axis("off")
+        self.label_dia.config(text=f"Día: {self.dia_simulacion + 1} / {self.configuracion.dias}")
 
-        if inicial:
-            if self.colorbar:
-                self.colorbar.remove()
-            norm = plt.Normalize(vmin=0, vmax=vmax)
-            sm = plt.cm.ScalarMappable(cmap=color, norm=norm)
-            sm._A = []
-            self.colorbar = self.fig.colorbar(sm, ax=self.ax, fraction=0.03, pad=0.04)
+        self.actualizar_tabla()
 
-        self.canvas.draw()
-        self.label_dia.config(text=f"Día: {self.dia_simulacion + 1} / {dias}")
+    def actualizar_tabla(self):
+        """Tabla del día actual (solo cambian las filas que lo necesitan)"""
+        dia = self.dia_simulacion
+        if self.orden_vivo.get() and self.criterio_tabla is not None:
+            # Orden en vivo: se repara el orden del cuadro anterior
+            columna = getattr(self.resultado, COLUMNAS_TABLA[self.criterio_tabla])[:, dia]
+            filas = self._filas_ordenadas(dia, self.ranking.actualizar(columna))
+        else:
+            filas = self.cache_tabla.obtener(dia)
+        self.modelo_tabla.mostrar(filas)
 
-        # Actualizar tabla
-        for i in self.tabla.get_children():
-            self.tabla.delete(i)
+    def _calcular_valores_mapa(self, clave):
+        """Colores del mapa para (tipo_mapa, dia), en el orden de la geometría"""
+        tipo, dia = clave
+        matriz = getattr(self.resultado, ESTILOS_MAPA[tipo][0])
+        return np.where(self.fila_mapa >= 0, matriz[self.fila_mapa, dia], 0.0)
 
+    def _calcular_filas_tabla(self, dia):
+        """Filas (id, valores) de la tabla para un día: países con casos y totales"""
+        filas = []
         total_inf = total_mue = total_rec = 0
-        paises_mostrados = 0
-        for pais in paises:
-            sistema = config_paises[pais]["sistema"]
-            emoji = "🟢" if sistema == "desarrollado" else ("🟡" if sistema == "normal" else "🔴")
-            inf = int(self.datos_infectados[pais][self.dia_simulacion])
-            mue = int(self.datos_muertes[pais][self.dia_simulacion])
-            rec = int(self.datos_recuperados[pais][self.dia_simulacion])
-            
+        for i, pais in enumerate(paises):
+            inf = int(self.resultado.I[i, dia])
+            mue = int(self.resultado.D[i, dia])
+            rec = int(self.resultado.R[i, dia])
+
             if inf > 0 or mue > 0 or rec > 0:
-                self.tabla.insert("", "end", values=(pais, emoji, inf, mue, rec))
+                filas.append((pais, (pais, emoji_sistema(config_paises[pais]["sistema"]), inf, mue, rec)))
                 total_inf += inf
                 total_mue += mue
                 total_rec += rec
-                paises_mostrados += 1
-                
-                if inf > 0 and self.dia_simulacion % 10 == 0:
-                    print(f"DEBUG Día {self.dia_simulacion}: {pais} tiene {inf} infectados")
 
-        self.tabla.insert("", "end", values=(f"═══ TOTAL ({paises_mostrados} países) ═══", "", total_inf, total_mue, total_rec))
+        filas.append((ID_FILA_TOTAL, (f"═══ TOTAL ({len(filas)} países) ═══", "",
+                                      total_inf, total_mue, total_rec)))
+        return filas
 
     def simular_tiempo(self):
         if self.datos_infectados is None:
             return
         
-        if not self.pausado:
-            self.dia_simulacion = (self.dia_simulacion + 1) % dias
+        siguiente = self.dia_simulacion + 1
+        if siguiente >= self.dias_calculados:
+            # Si el día aún se está calculando, se espera; si no, se vuelve a empezar
+            siguiente = self.dia_simulacion if self.calculando() else 0
+        
+        if not self.pausado and siguiente != self.dia_simulacion:
+            self.dia_simulacion = siguiente
             self.slider.set(self.dia_simulacion)
             self.actualizar_mapa()
             
-            if self.dia_simulacion >= 235 and self.dia_simulacion <= 250:
-                if self.dia_simulacion == 235:
+            if self.dia_aviso_recuperacion <= self.dia_simulacion <= self.dia_fin_aviso:
+                if self.dia_simulacion == self.dia_aviso_recuperacion:
                     self.titulo.config(text="🏥 ¡FASE DE RECUPERACIÓN INICIADA! 🏥", fg="green")
-                elif self.dia_simulacion == 250:
+                elif self.dia_simulacion == self.dia_fin_aviso:
                     self.titulo.config(text="🗺️ Visualización Geográfica", fg="black")
         
         if self.datos_infectados is not None:
-            self.root.after(150, self.simular_tiempo)
+            self.id_animacion = self.root.after(150, self.simular_tiempo)
 
 if __name__ == "__main__":
     root = tk.Tk()
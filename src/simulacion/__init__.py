@@ -0,0 +1,88 @@
+"""
+Núcleo de simulación SIRD vectorizado (solo NumPy).
+
+Los compartimentos de todos los países se guardan como arrays 2-D de forma
+(n_paises, dias) y cada paso de integración es una operación vectorizada.
+
+El paquete no depende de Tkinter, Matplotlib ni GeoPandas, y sus submódulos se
+importan de forma perezosa: `from simulacion import simular_sird` solo carga
+lo necesario, de modo que los procesos de trabajo arrancan en milisegundos.
+"""
+
+import importlib
+
+# Nombre público -> submódulo que lo define
+_EXPORTACIONES = {
+    "FlujoAleatorio": "aleatorio",
+    "crear_generador": "aleatorio",
+    "semillas_replicas": "aleatorio",
+    "acumulado": "analitica",
+    "dia_pico": "analitica",
+    "extremo": "analitica",
+    "extremos_por_pais": "analitica",
+    "k_esimo_por_dia": "analitica",
+    "nuevos_por_dia": "analitica",
+    "top_k_por_dia": "analitica",
+    "totales_por_dia": "analitica",
+    "ResultadoBarrido": "barrido",
+    "aplicar_cambios": "barrido",
+    "barrido_parametros": "barrido",
+    "muestreo_parametros": "barrido",
+    "rejilla_parametros": "barrido",
+    "GrafoVecinos": "contagio",
+    "contagio_disperso": "contagio",
+    "contagio_disperso_lote": "contagio",
+    "PARAMS_SISTEMA": "datos",
+    "PAISES_EUROPA": "datos",
+    "config_paises": "datos",
+    "construir_config_paises": "datos",
+    "paises": "datos",
+    "poblacion_paises": "datos",
+    "sistemas_sanitarios": "datos",
+    "vecinos": "datos",
+    "ResultadoEnsamble": "ensamble",
+    "simular_ensamble": "ensamble",
+    "MotorEventos": "eventos",
+    "simular_sird_eventos": "eventos",
+    "INTEGRADORES": "integradores",
+    "IntegradorFilas": "integradores",
+    "derivadas_sird": "integradores",
+    "AlmacenMapeado": "memo",
+    "MemoriaSimulaciones": "memo",
+    "clave_simulacion": "memo",
+    "huella_parametros": "memo",
+    "DIAS": "motor",
+    "DT": "motor",
+    "EstadoDiario": "motor",
+    "INFECCION_INICIAL": "motor",
+    "PARAMETROS_MODIFICABLES": "motor",
+    "TASA_CONTAGIO_BASE": "motor",
+    "ConfiguracionSimulacion": "motor",
+    "MotorSIRD": "motor",
+    "ParametrosPaises": "motor",
+    "ResultadoSIRD": "motor",
+    "bifurcar_sird": "motor",
+    "crear_motor": "motor",
+    "iterar_sird": "motor",
+    "paso_euler_dia": "motor",
+    "paso_euler_sird": "motor",
+    "simular_sird": "motor",
+    "ResumenMultiorigen": "multiorigen",
+    "simular_todos_los_origenes": "multiorigen",
+    "IndiceRangos": "rangos",
+    "TablaDispersa": "rangos",
+    "iniciar_simulacion_fuerza_bruta": "referencia",
+}
+
+__all__ = sorted(_EXPORTACIONES)
+
+def __getattr__(nombre):
+    modulo = _EXPORTACIONES.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{modulo}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTACIONES))
@@ -0,0 +1,118 @@
+import json
+
+import numpy as np
+
+# =============================
+# FLUJOS ALEATORIOS REPRODUCIBLES
+# =============================
+
+# Uniformes que se piden al generador de una vez
+BLOQUE_ALEATORIOS = 256
+
+def crear_generador(semilla=None):
+    """
+    Generador para una semilla:
+    - None o entero (o secuencia de enteros): RandomState (MT19937), el mismo
+      generador que el modelo original, para reproducir sus trayectorias
+    - SeedSequence: Generator con PCG64, flujo independiente de sus hermanos
+    - Generator o RandomState: se usa tal cual
+    """
+    if isinstance(semilla, (np.random.Generator, np.random.RandomState)):
+        return semilla
+    if isinstance(semilla, np.random.SeedSequence):
+        return np.random.Generator(np.random.PCG64(semilla))
+    return np.random.RandomState(semilla)
+
+def semillas_replicas(semilla, replicas):
+    """
+    Una SeedSequence hija por réplica, derivadas de `semilla` (entero, None
+    o SeedSequence): flujos independientes que no dependen de cómo se
+    repartan las réplicas entre procesos
+    """
+    if not isinstance(semilla, np.random.SeedSequence):
+        semilla = np.random.SeedSequence(semilla)
+    return semilla.spawn(replicas)
+
+def descripcion_semilla(semilla):
+    """
+    Descripción JSON de una semilla reproducible (para claves de caché), o
+    None si no lo es: sin semilla o con un generador que ya tiene estado
+    """
+    if semilla is None or isinstance(semilla, (np.random.Generator, np.random.RandomState,
+                                               FlujoAleatorio)):
+        return None
+    if isinstance(semilla, np.random.SeedSequence):
+        return {"entropia": np.asarray(semilla.entropy).tolist(),
+                "hijo": list(semilla.spawn_key), "pool": semilla.pool_size}
+    return np.asarray(semilla).tolist()
+
+class FlujoAleatorio:
+    """
+    Fuente de uniformes [0, 1) del motor. Envuelve un generador y sirve los
+    números desde un búfer que se rellena por bloques de `bloque`, así que
+    un sorteo suelto (un vecino) no cuesta una llamada al generador. La
+    secuencia servida es la misma que pidiéndolos uno a uno, de modo que
+    una semilla entera sigue reproduciendo el modelo original.
+
+    random_sample() tiene la misma interfaz que RandomState.random_sample.
+    """
+    def __init__(self, generador, bloque=BLOQUE_ALEATORIOS):
+        self.generador = generador
+        self.bloque = bloque
+        self._bufer = []
+        self._pos = 0
+
+    def _uniformes(self, n):
+        if isinstance(self.generador, np.random.Generator):
+            return self.generador.random(n)
+        return self.generador.random_sample(n)
+
+    def random_sample(self, size=None):
+        if size is None:
+            if self._pos == len(self._bufer):
+                self._bufer = self._uniformes(self.bloque).tolist()
+                self._pos = 0
+            valor = self._bufer[self._pos]
+            self._pos += 1
+            return valor
+
+        # Primero lo que quede en el búfer, después un bloque nuevo del generador
+        n = size if isinstance(size, int) else int(np.prod(size))
+        restantes = len(self._bufer) - self._pos
+        if n <= restantes:
+            valores = np.array(self._bufer[self._pos:self._pos + n], dtype=float)
+            self._pos += n
+            return valores.reshape(size)
+        del_bufer = restantes
+        valores = np.empty(n)
+        valores[:del_bufer] = self._bufer[self._pos:self._pos + del_bufer]
+        self._pos += del_bufer
+        if n > del_bufer:
+            valores[del_bufer:] = self._uniformes(n - del_bufer)
+        return valores.reshape(size)
+
+    def estado(self):
+        """Estado completo como texto JSON (generador y números aún sin servir)"""
+        if isinstance(self.generador, np.random.Generator):
+            tipo, estado = "Generator", self.generador.bit_generator.state
+        else:
+            tipo, estado = "RandomState", self.generador.get_state(legacy=False)
+        return json.dumps({"tipo": tipo, "estado": estado, "bloque": self.bloque,
+                           "bufer": self._bufer[self._pos:]},
+                          default=lambda valor: np.asarray(valor).tolist())
+
+    @classmethod
+    def desde_estado(cls, texto):
+        datos = json.loads(texto)
+        estado = datos["estado"]
+        if datos["tipo"] == "Generator":
+            bits = getattr(np.random, estado["bit_generator"])()
+            bits.state = estado
+            generador = np.random.Generator(bits)
+        else:
+            estado["state"]["key"] = np.array(estado["state"]["key"], dtype=np.uint32)
+            generador = np.random.RandomState()
+            generador.set_state(estado)
+        flujo = cls(generador, datos["bloque"])
+        flujo._bufer = datos["bufer"]
+        return flujo
@@ -0,0 +1,74 @@
+import numpy as np
+
+# =============================
+# REDUCCIONES VECTORIZADAS
+# =============================
+
+# Todas las funciones trabajan sobre matrices (paises, dias) como las de
+# ResultadoSIRD y hacen una sola llamada de NumPy por reducción. En los
+# empates devuelven el último índice, igual que encontrar_maximo_DyV y
+# encontrar_minimo_DyV, que se conservan como camino de referencia.
+
+def extremo(valores, modo="max"):
+    """(valor, índice) del máximo o mínimo de un vector"""
+    valores = np.asarray(valores)
+    invertidos = valores[::-1]
+    posicion = invertidos.argmax() if modo == "max" else invertidos.argmin()
+    indice = valores.size - 1 - int(posicion)
+    return valores[indice], indice
+
+def extremos_por_pais(matriz, modo="max"):
+    """(valores, días) del máximo o mínimo de cada fila, p. ej. el pico de cada país"""
+    matriz = np.asarray(matriz)
+    invertida = matriz[:, ::-1]
+    posicion = invertida.argmax(axis=1) if modo == "max" else invertida.argmin(axis=1)
+    dias = matriz.shape[1] - 1 - posicion
+    return matriz[np.arange(matriz.shape[0]), dias], dias
+
+def totales_por_dia(matriz):
+    """Suma de todos los países para cada día"""
+    return np.asarray(matriz).sum(axis=0)
+
+def acumulado(matriz):
+    """Suma acumulada de cada país a lo largo de los días"""
+    return np.cumsum(matriz, axis=1)
+
+def nuevos_por_dia(acumulada):
+    """Incremento diario de una serie acumulada (p. ej. muertes nuevas desde D)"""
+    return np.diff(acumulada, axis=1, prepend=0.0)
+
+def dia_pico(matriz):
+    """(total, día) del día con mayor total continental"""
+    return extremo(totales_por_dia(matriz))
+
+# =============================
+# CABEZAS DE RANKING Y ESTADÍSTICOS DE ORDEN
+# =============================
+
+# Sin ordenar ninguna columna: np.partition separa cada día en O(n). El
+# orden es el de la tabla ordenada: de mayor a menor y, entre iguales,
+# primero el país de menor índice.
+
+def k_esimo_por_dia(matriz, k):
+    """Valor en la posición k (desde 0, de mayor a menor) de cada día; k = n//2 da la mediana"""
+    matriz = np.asarray(matriz)
+    if not 0 <= k < matriz.shape[0]:
+        raise ValueError(f"Posición fuera de rango: {k}")
+    posicion = matriz.shape[0] - 1 - k
+    return np.partition(matriz, posicion, axis=0)[posicion]
+
+def top_k_por_dia(matriz, k):
+    """(valores, índices) de forma (dias, k) con los k países mayores de cada día, ordenados"""
+    matriz = np.asarray(matriz)
+    if not 1 <= k <= matriz.shape[0]:
+        raise ValueError(f"k debe estar entre 1 y el número de países ({matriz.shape[0]}): {k}")
+    umbral = k_esimo_por_dia(matriz, k - 1)
+    # Todos los mayores que el umbral y, de los iguales, los de menor índice
+    mayores = matriz > umbral
+    iguales = matriz == umbral
+    faltan = k - mayores.sum(axis=0)
+    elegidos = mayores | (iguales & (np.cumsum(iguales, axis=0) <= faltan))
+    indices = np.nonzero(elegidos.T)[1].reshape(matriz.shape[1], k)
+    valores = np.take_along_axis(matriz.T, indices, axis=1)
+    orden = np.argsort(-valores, axis=1, kind="stable")
+    return np.take_along_axis(valores, orden, axis=1), np.take_along_axis(indices, orden, axis=1)
@@ -0,0 +1,199 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .datos import PARAMS_SISTEMA, construir_config_paises, paises as PAISES, vecinos as VECINOS
+from .memo import AlmacenMapeado, clave_simulacion, huella_parametros
+from .motor import ConfiguracionSimulacion
+
+# Métricas guardadas por celda, en este orden
+METRICAS = ("muertes", "pico_I", "dia_pico", "alcanzados")
+
+# =============================
+# PUNTOS DEL BARRIDO
+# =============================
+
+def _ejes(clave, base):
+    """'normal.beta' -> [('normal', 'beta')]; 'beta' -> el parámetro en todos los sistemas"""
+    if "." in clave:
+        sistema, parametro = clave.split(".", 1)
+        ejes = [(sistema, parametro)]
+    else:
+        ejes = [(sistema, clave) for sistema in base]
+    for sistema, parametro in ejes:
+        if parametro not in base.get(sistema, {}):
+            raise ValueError(f"Parámetro desconocido: {sistema}.{parametro}")
+    return ejes
+
+def aplicar_cambios(cambios, base=PARAMS_SISTEMA):
+    """
+    Copia de `base` (con la forma de PARAMS_SISTEMA) con los cambios
+    {clave: valor}, donde clave es "sistema.parametro" o solo "parametro"
+    (el mismo valor en todos los sistemas)
+    """
+    nuevo = {sistema: dict(valores) for sistema, valores in base.items()}
+    for clave, valor in cambios.items():
+        for sistema, parametro in _ejes(clave, base):
+            nuevo[sistema][parametro] = valor.item() if isinstance(valor, np.generic) else valor
+    return nuevo
+
+def rejilla_parametros(ejes):
+    """
+    Producto cartesiano de {clave: valores}: una lista de diccionarios de
+    cambios, uno por punto, en el orden de los ejes
+    """
+    claves = list(ejes)
+    return [dict(zip(claves, valores)) for valores in itertools.product(*ejes.values())]
+
+def muestreo_parametros(rangos, muestras, semilla=None):
+    """
+    `muestras` puntos al azar, cada clave uniforme en su rango {clave: (min, max)}.
+    Con la misma semilla se obtienen los mismos puntos.
+    """
+    rng = np.random.default_rng(semilla)
+    valores = {clave: rng.uniform(minimo, maximo, muestras)
+               for clave, (minimo, maximo) in rangos.items()}
+    return [{clave: float(valores[clave][m]) for clave in rangos} for m in range(muestras)]
+
+# =============================
+# TRABAJO DE CADA PROCESO
+# =============================
+
+def _metricas(res):
+    total_I = res.I.sum(axis=0)
+    return np.array([res.D[:, -1].sum(), total_I.max(), total_I.argmax(),
+                     (res.dia_llegada >= 0).sum()], dtype=float)
+
+def _ejecutar_celdas(paises, vecinos, configuracion, sistemas, celdas, cache):
+    """
+    Ejecuta un bloque de celdas (punto, origen, semilla, clave). `sistemas`
+    da los PARAMS_SISTEMA de cada punto del bloque; los ParametrosPaises se
+    construyen una vez por punto. Con caché, cada proceso guarda sus celdas
+    en el AlmacenMapeado; solo las métricas vuelven al proceso principal.
+    """
+    params_punto = {}
+    salida = []
+    for punto, origen, semilla, clave in celdas:
+        if punto not in params_punto:
+            config_paises = construir_config_paises(paises, sistemas[punto])
+            params_punto[punto] = configuracion.parametros(paises, config_paises, vecinos)
+        res = configuracion.crear_motor(params_punto[punto], origen, semilla=semilla).ejecutar()
+        metricas = _metricas(res)
+        if cache is not None:
+            cache.guardar(clave, res, metricas)
+        salida.append(metricas)
+    return salida
+
+# =============================
+# RESULTADO DEL BARRIDO
+# =============================
+
+class ResultadoBarrido:
+    """
+    Métricas de cada celda (punto, origen, semilla) como arrays de forma
+    (n_puntos, n_origenes, n_semillas):
+    - muertes: muertes acumuladas al final en todo el continente
+    - pico_I, dia_pico: máximo de infectados activos a la vez y su día
+    - alcanzados: países a los que llegó el virus
+    `calculadas` cuenta las celdas simuladas en esta llamada (el resto salió
+    de la caché). Las trayectorias completas se leen de la caché con resultado().
+    """
+    def __init__(self, puntos, origenes, semillas, claves, metricas, calculadas, cache):
+        self.puntos = puntos
+        self.origenes = origenes
+        self.semillas = semillas
+        self.claves = claves
+        self.calculadas = calculadas
+        self.cache = cache
+        for k, nombre in enumerate(METRICAS):
+            setattr(self, nombre, metricas[..., k])
+
+    def resultado(self, punto, origen=0, semilla=0):
+        """ResultadoSIRD de una celda (índices en puntos, origenes y semillas)"""
+        if self.cache is None:
+            raise ValueError("El barrido se ejecutó sin caché; solo guarda las métricas")
+        return self.cache.cargar(self.claves[punto, origen, semilla])
+
+# =============================
+# EJECUCIÓN DEL BARRIDO
+# =============================
+
+def barrido_parametros(puntos, origenes, semillas, configuracion=None, cache=None, procesos=None,
+                       base=PARAMS_SISTEMA, paises=PAISES, vecinos=VECINOS):
+    """
+    Simula cada combinación de punto (cambios sobre PARAMS_SISTEMA, ver
+    rejilla_parametros y muestreo_parametros), país de origen y semilla,
+    repartiendo las celdas en un ProcessPoolExecutor como simular_ensamble.
+
+    Con `cache` (un AlmacenMapeado o un directorio) solo se simulan las
+    celdas que aún no están guardadas: repetir un barrido con un punto más
+    calcula únicamente las celdas nuevas. Las claves son las de
+    clave_simulacion, así que la caché se comparte con MemoriaSimulaciones.
+    Con procesos=1 todo se ejecuta en el proceso actual.
+    """
+    if configuracion is None:
+        configuracion = ConfiguracionSimulacion(contagio="disperso")
+    if configuracion.dias is None:
+        raise ValueError("El barrido necesita un horizonte (dias) finito")
+    if isinstance(cache, str):
+        cache = AlmacenMapeado(cache)
+    origenes = [origenes] if isinstance(origenes, str) else list(origenes)
+    semillas = list(semillas) if isinstance(semillas, (list, tuple, np.ndarray)) else [semillas]
+    paises = list(paises)
+
+    sistemas = [aplicar_cambios(cambios, base) for cambios in puntos]
+    forma = (len(puntos), len(origenes), len(semillas))
+    claves = np.empty(forma, dtype=object)
+    metricas = np.full(forma + (len(METRICAS),), np.nan)
+
+    pendientes = []
+    for punto, sistema in enumerate(sistemas):
+        config_paises = construir_config_paises(paises, sistema)
+        huella = huella_parametros(configuracion.parametros(paises, config_paises, vecinos))
+        for (o, origen), (s, semilla) in itertools.product(enumerate(origenes), enumerate(semillas)):
+            clave = clave_simulacion(huella, origen, semilla, configuracion)
+            if clave is None:
+                raise ValueError("Una celda sin semilla fija no es reproducible y no puede guardarse")
+            claves[punto, o, s] = clave
+            if cache is not None and clave in cache:
+                guardadas = cache.metricas(clave)
+                # Las entradas de MemoriaSimulaciones no traen métricas
+                if guardadas is None:
+                    guardadas = _metricas(cache.cargar(clave))
+                metricas[punto, o, s] = guardadas
+            else:
+                pendientes.append((punto, o, s))
+
+    if pendientes:
+        if procesos is None:
+            procesos = os.cpu_count() or 1
+        procesos = max(1, min(procesos, len(pendientes)))
+
+        # Bloques consecutivos (pocos puntos distintos por bloque)
+        tam_bloque = max(1, -(-len(pendientes) // (procesos * 4)))
+        bloques = [pendientes[i:i + tam_bloque] for i in range(0, len(pendientes), tam_bloque)]
+
+        def argumentos(bloque):
+            celdas = [(punto, origenes[o], semillas[s], claves[punto, o, s])
+                      for punto, o, s in bloque]
+            return (paises, vecinos, configuracion,
+                    {punto: sistemas[punto] for punto, _, _ in bloque}, celdas, cache)
+
+        if procesos == 1:
+            parciales = (_ejecutar_celdas(*argumentos(bloque)) for bloque in bloques)
+        else:
+            ejecutor = ProcessPoolExecutor(max_workers=procesos)
+            futuros = [ejecutor.submit(_ejecutar_celdas, *argumentos(bloque)) for bloque in bloques]
+            parciales = (futuro.result() for futuro in futuros)
+
+        try:
+            for bloque, salida in zip(bloques, parciales):
+                for celda, metricas_celda in zip(bloque, salida):
+                    metricas[celda] = metricas_celda
+        finally:
+            if procesos > 1:
+                ejecutor.shutdown()
+
+    return ResultadoBarrido(puntos, origenes, semillas, claves, metricas, len(pendientes), cache)
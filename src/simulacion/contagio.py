@@ -0,0 +1,97 @@
+import numpy as np
+
+# =============================
+# GRAFO DE VECINOS EN FORMATO CSR
+# =============================
+
+class GrafoVecinos:
+    """
+    Matriz de adyacencia dispersa en formato CSR (indptr, indices), compilada
+    una sola vez desde las listas de vecinos. Las aristas de la fila i son
+    indices[indptr[i]:indptr[i+1]], en el mismo orden que vecinos[pais].
+    """
+    def __init__(self, listas_vecinos):
+        self.n = len(listas_vecinos)
+        grados = np.array([len(lista) for lista in listas_vecinos], dtype=np.int64)
+
+        self.indptr = np.zeros(self.n + 1, dtype=np.int64)
+        np.cumsum(grados, out=self.indptr[1:])
+        self.indices = np.array([v for lista in listas_vecinos for v in lista], dtype=np.int64)
+        # País origen de cada arista (la "fila" de la matriz)
+        self.origen = np.repeat(np.arange(self.n, dtype=np.int64), grados)
+
+    @property
+    def n_aristas(self):
+        return self.indices.size
+
+    def aristas_de(self, filas):
+        """
+        Índices de las aristas que salen de las filas dadas (en orden CSR),
+        sin recorrer el resto de la matriz.
+        """
+        inicio = self.indptr[filas]
+        grados = self.indptr[filas + 1] - inicio
+        total = int(grados.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+        # Desplazamiento de cada arista dentro del bloque concatenado
+        desplazamiento = np.repeat(inicio - (np.cumsum(grados) - grados), grados)
+        return desplazamiento + np.arange(total, dtype=np.int64)
+
+    @classmethod
+    def desde_diccionario(cls, paises, vecinos):
+        """Construye el grafo desde {pais: [vecinos]}, ignorando nombres desconocidos"""
+        indice = {pais: i for i, pais in enumerate(paises)}
+        listas = [[indice[v] for v in vecinos.get(p, []) if v in indice] for p in paises]
+        return cls(listas)
+
+# =============================
+# ETAPA DE CONTAGIO VECTORIZADA
+# =============================
+
+def contagio_disperso(grafo, infectado, infectados_fuente, umbral_contagiar,
+                      umbral_ser_contagiado, prob_contagio, rng):
+    """
+    Evalúa todos los contagios entre vecinos de un día en una sola pasada
+    dispersa: los umbrales se comprueban con máscaras y los ensayos de
+    Bernoulli se sortean con una única llamada al generador.
+
+    Devuelve (destinos, fuentes): cada país contagiado junto con la fuente de
+    menor índice cuyo ensayo tuvo éxito.
+    """
+    _, destinos, fuentes = contagio_disperso_lote(grafo, infectado[None], infectados_fuente[None],
+                                                  umbral_contagiar, umbral_ser_contagiado,
+                                                  prob_contagio, rng)
+    return destinos, fuentes
+
+def contagio_disperso_lote(grafo, infectado, infectados_fuente, umbral_contagiar,
+                           umbral_ser_contagiado, prob_contagio, rng):
+    """
+    Igual que contagio_disperso, pero para varios escenarios independientes a
+    la vez: `infectado` e `infectados_fuente` tienen forma (escenarios, n_paises).
+
+    Devuelve (escenarios, destinos, fuentes) ordenados por escenario y destino.
+    """
+    esc_activo, fuentes_activas = np.nonzero(infectado & (infectados_fuente >= umbral_contagiar))
+    aristas = grafo.aristas_de(fuentes_activas)
+    grados = grafo.indptr[fuentes_activas + 1] - grafo.indptr[fuentes_activas]
+
+    escenario = np.repeat(esc_activo, grados)
+    origen = grafo.origen[aristas]
+    destino = grafo.indices[aristas]
+    candidatas = ~infectado[escenario, destino] & \
+        (infectados_fuente[escenario, origen] >= umbral_ser_contagiado[destino])
+    escenario = escenario[candidatas]
+    origen = origen[candidatas]
+    destino = destino[candidatas]
+
+    exito = rng.random_sample(destino.size) < prob_contagio[destino]
+    escenario = escenario[exito]
+    origen = origen[exito]
+    destino = destino[exito]
+
+    # Las aristas están ordenadas por escenario y luego por origen: la primera
+    # aparición de cada (escenario, destino) corresponde a la fuente de menor índice
+    clave = escenario * grafo.n + destino
+    _, primera = np.unique(clave, return_index=True)
+    return escenario[primera], destino[primera], origen[primera]
@@ -0,0 +1,178 @@
+# =============================
+# DATOS REALISTAS: POBLACIÓN POR PAÍS (2023)
+# =============================
+
+poblacion_paises = {
+    "Albania": 2746000,
+    "Austria": 9027000,
+    "Belarus": 9230000,
+    "Belgium": 11632000,
+    "Bosnia and Herz.": 3151000,
+    "Bulgaria": 6808000,
+    "Croatia": 3856000,
+    "Czechia": 10496000,
+    "Denmark": 5933000,
+    "Estonia": 1331000,
+    "Finland": 5541000,
+    "France": 68073000,
+    "Germany": 83295000,
+    "Greece": 10373000,
+    "Hungary": 9604000,
+    "Ireland": 5123000,
+    "Italy": 58851000,
+    "Latvia": 1863000,
+    "Lithuania": 2795000,
+    "Luxembourg": 654000,
+    "Moldova": 2513000,
+    "Netherlands": 17767000,
+    "Norway": 5466000,
+    "Poland": 37551000,
+    "Portugal": 10247000,
+    "Romania": 19052000,
+    "Russia": 144444000,
+    "Serbia": 6655000,
+    "Slovakia": 5422000,
+    "Slovenia": 2117000,
+    "Spain": 47558000,
+    "Sweden": 10528000,
+    "Switzerland": 8797000,
+    "Ukraine": 36755000,
+    "United Kingdom": 67736000,
+}
+
+# Países de Europa en el mapa Natural Earth 1:110m (columna NAME con
+# CONTINENT == 'Europe'), en orden alfabético. Fijos aquí para no tener que
+# descargar ni leer el GeoJSON para simular.
+PAISES_EUROPA = [
+    "Albania", "Austria", "Belarus", "Belgium", "Bosnia and Herz.", "Bulgaria",
+    "Croatia", "Czechia", "Denmark", "Estonia", "Finland", "France", "Germany",
+    "Greece", "Hungary", "Iceland", "Ireland", "Italy", "Kosovo", "Latvia",
+    "Lithuania", "Luxembourg", "Moldova", "Montenegro", "Netherlands",
+    "North Macedonia", "Norway", "Poland", "Portugal", "Romania", "Russia",
+    "Serbia", "Slovakia", "Slovenia", "Spain", "Sweden", "Switzerland",
+    "Ukraine", "United Kingdom",
+]
+
+# =============================
+# CONFIGURACIÓN POR PAÍS
+# =============================
+
+# Sistemas sanitarios por país
+sistemas_sanitarios = {
+    "Norway": "desarrollado", "Switzerland": "desarrollado", "Germany": "desarrollado",
+    "Sweden": "desarrollado", "Netherlands": "desarrollado", "Denmark": "desarrollado",
+    "Austria": "desarrollado", "Finland": "desarrollado", "Belgium": "desarrollado",
+    "France": "desarrollado", "United Kingdom": "desarrollado", "Ireland": "desarrollado",
+    "Luxembourg": "desarrollado",
+
+    "Spain": "normal", "Italy": "normal", "Portugal": "normal", "Greece": "normal",
+    "Czechia": "normal", "Slovenia": "normal", "Estonia": "normal", "Poland": "normal",
+    "Slovakia": "normal", "Lithuania": "normal", "Latvia": "normal", "Croatia": "normal",
+    "Hungary": "normal",
+
+    "Romania": "precario", "Bulgaria": "precario", "Serbia": "precario",
+    "Bosnia and Herz.": "precario", "Albania": "precario", "Moldova": "precario",
+    "Ukraine": "precario", "Belarus": "precario", "Russia": "precario",
+}
+
+# Parámetros del modelo SIR por sistema sanitario
+PARAMS_SISTEMA = {
+    "desarrollado": {
+        "beta": 0.08,
+        "gamma": 0.00,
+        "gamma_post": 0.10,
+        "mu": 0.00015,
+        "dia_recuperacion": 235,
+        "vac_inicio": 250,
+        "vac_rate": 0.010,
+        "umbral_contagiar": 20000,
+        "umbral_ser_contagiado": 20000,
+    },
+    "normal": {
+        "beta": 0.15,
+        "gamma": 0.00,
+        "gamma_post": 0.06,
+        "mu": 0.0004,
+        "dia_recuperacion": 235,
+        "vac_inicio": 240,
+        "vac_rate": 0.007,
+        "umbral_contagiar": 5000,
+        "umbral_ser_contagiado": 5000,
+    },
+    "precario": {
+        "beta": 0.3,
+        "gamma": 0.00,
+        "gamma_post": 0.05,
+        "mu": 0.0008,
+        "dia_recuperacion": 235,
+        "vac_inicio": 250,
+        "vac_rate": 0.003,
+        "umbral_contagiar": 1000,
+        "umbral_ser_contagiado": 1000,
+    }
+}
+
+def construir_config_paises(paises, params_sistema=PARAMS_SISTEMA):
+    """Combina población y sistema sanitario de cada país con los parámetros del modelo"""
+    config_paises = {}
+    for pais in paises:
+        sistema = sistemas_sanitarios.get(pais, "normal")
+        poblacion = poblacion_paises.get(pais, 5000000)
+        params = params_sistema[sistema]
+
+        config_paises[pais] = {
+            "sistema": sistema,
+            "poblacion": poblacion,
+            "beta": params["beta"],
+            "gamma": params["gamma"],
+            "gamma_post": params["gamma_post"],
+            "mu": params["mu"],
+            "dia_recuperacion": params["dia_recuperacion"],
+            "vac_inicio": params["vac_inicio"],
+            "vac_rate": params["vac_rate"],
+            "umbral_contagiar": params["umbral_contagiar"],
+            "umbral_ser_contagiado": params["umbral_ser_contagiado"],
+        }
+    return config_paises
+
+paises = list(PAISES_EUROPA)
+config_paises = construir_config_paises(paises)
+
+# Vecinos (relaciones geográficas)
+vecinos = {
+    "France": ["Spain", "Italy", "Germany", "Belgium", "Switzerland"],
+    "Spain": ["France", "Portugal"],
+    "Italy": ["France", "Switzerland", "Austria", "Slovenia"],
+    "Germany": ["France", "Poland", "Czechia", "Austria", "Switzerland", "Belgium", "Netherlands", "Denmark"],
+    "Portugal": ["Spain"],
+    "United Kingdom": ["Ireland"],
+    "Ireland": ["United Kingdom"],
+    "Belgium": ["France", "Germany", "Netherlands"],
+    "Netherlands": ["Belgium", "Germany"],
+    "Poland": ["Germany", "Czechia", "Slovakia", "Ukraine", "Belarus", "Lithuania"],
+    "Czechia": ["Germany", "Poland", "Slovakia", "Austria"],
+    "Austria": ["Germany", "Czechia Rep.", "Slovakia", "Hungary", "Slovenia", "Italy", "Switzerland"],
+    "Switzerland": ["France", "Germany", "Austria", "Italy"],
+    "Greece": ["Albania", "Bulgaria"],
+    "Romania": ["Hungary", "Serbia", "Bulgaria", "Ukraine", "Moldova"],
+    "Hungary": ["Austria", "Slovakia", "Ukraine", "Romania", "Serbia", "Croatia", "Slovenia"],
+    "Sweden": ["Norway", "Finland"],
+    "Norway": ["Sweden", "Finland"],
+    "Finland": ["Sweden", "Norway", "Russia"],
+    "Denmark": ["Germany", "Sweden"],
+    "Croatia": ["Slovenia", "Hungary", "Serbia", "Bosnia and Herz."],
+    "Serbia": ["Hungary", "Romania", "Bulgaria", "Croatia", "Bosnia and Herz."],
+    "Bulgaria": ["Romania", "Serbia", "Greece"],
+    "Ukraine": ["Poland", "Slovakia", "Hungary", "Romania", "Moldova", "Russia", "Belarus"],
+    "Belarus": ["Poland", "Lithuania", "Latvia", "Russia", "Ukraine"],
+    "Lithuania": ["Poland", "Belarus", "Latvia", "Russia"],
+    "Latvia": ["Lithuania", "Belarus", "Russia", "Estonia"],
+    "Estonia": ["Latvia", "Russia"],
+    "Slovakia": ["Poland", "Czechia", "Austria", "Hungary", "Ukraine"],
+    "Slovenia": ["Italy", "Austria", "Hungary", "Croatia"],
+    "Albania": ["Greece", "Serbia"],
+    "Bosnia and Herz.": ["Croatia", "Serbia"],
+    "Moldova": ["Romania", "Ukraine"],
+    "Russia": ["Norway", "Finland", "Estonia", "Latvia", "Lithuania", "Belarus", "Ukraine"]
+}
+
@@ -0,0 +1,124 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .aleatorio import semillas_replicas
+from .motor import DIAS, DT, simular_sird
+
+COMPARTIMENTOS = ("S", "I", "R", "D", "V")
+CUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# =============================
+# TRABAJO DE CADA PROCESO
+# =============================
+
+def _ejecutar_bloque(params, pais_inicial, dias, dt, contagio, semillas):
+    """
+    Ejecuta un bloque de réplicas y devuelve solo estadísticas agregadas:
+    sumas por compartimento, totales continentales por día, picos, muertes
+    finales y días de llegada. Las trayectorias completas no salen del proceso.
+    """
+    sumas = {c: np.zeros((params.n, dias)) for c in COMPARTIMENTOS}
+    k = len(semillas)
+    total_I = np.empty((k, dias))
+    total_D = np.empty((k, dias))
+    pico_I = np.empty((k, params.n))
+    muertes = np.empty((k, params.n))
+    dia_llegada = np.empty((k, params.n), dtype=int)
+
+    for r, semilla in enumerate(semillas):
+        res = simular_sird(params, pais_inicial, dias=dias, dt=dt, semilla=semilla,
+                           contagio=contagio)
+        for c in COMPARTIMENTOS:
+            sumas[c] += getattr(res, c)
+        total_I[r] = res.I.sum(axis=0)
+        total_D[r] = res.D.sum(axis=0)
+        pico_I[r] = res.I.max(axis=1)
+        muertes[r] = res.D[:, -1]
+        dia_llegada[r] = res.dia_llegada
+
+    return sumas, total_I, total_D, pico_I, muertes, dia_llegada
+
+# =============================
+# RESULTADO DEL ENSAMBLE
+# =============================
+
+class ResultadoEnsamble:
+    """
+    Resumen de N réplicas independientes de la simulación:
+    - media[c]: media por país y día de cada compartimento, forma (n_paises, dias)
+    - bandas_I / bandas_D: cuantiles por día del total continental de
+      infectados activos y muertes acumuladas, forma (len(cuantiles), dias)
+    - pico_I, muertes, dia_llegada: un valor por réplica y país,
+      forma (replicas, n_paises); dia_llegada vale -1 si el virus no llegó
+    """
+    def __init__(self, paises, cuantiles, media, total_I, total_D, pico_I, muertes, dia_llegada):
+        self.paises = paises
+        self.cuantiles = np.asarray(cuantiles)
+        self.replicas = dia_llegada.shape[0]
+        self.media = media
+        self.bandas_I = np.quantile(total_I, self.cuantiles, axis=0)
+        self.bandas_D = np.quantile(total_D, self.cuantiles, axis=0)
+        self.pico_I = pico_I
+        self.muertes = muertes
+        self.dia_llegada = dia_llegada
+
+    def prob_llegada(self):
+        """Fracción de réplicas en las que cada país llega a infectarse"""
+        return (self.dia_llegada >= 0).mean(axis=0)
+
+    def cuantiles_llegada(self):
+        """Cuantiles del día de llegada por país (NaN si nunca se infecta)"""
+        llegada = np.where(self.dia_llegada >= 0, self.dia_llegada, np.nan).astype(float)
+        resultado = np.full((len(self.cuantiles), len(self.paises)), np.nan)
+        alcanzados = ~np.all(np.isnan(llegada), axis=0)
+        if alcanzados.any():
+            resultado[:, alcanzados] = np.nanquantile(llegada[:, alcanzados], self.cuantiles, axis=0)
+        return resultado
+
+    def distribucion_llegada(self, pais):
+        """Histograma del día de llegada a un país (conteo de réplicas por día)"""
+        i = self.paises.index(pais)
+        llegada = self.dia_llegada[:, i]
+        llegada = llegada[llegada >= 0]
+        dias = self.media["I"].shape[1]
+        return np.bincount(llegada, minlength=dias)
+
+# =============================
+# EJECUCIÓN DEL ENSAMBLE
+# =============================
+
+def simular_ensamble(params, pais_inicial, replicas=1000, semilla=None, procesos=None,
+                     dias=DIAS, dt=DT, contagio="disperso", cuantiles=CUANTILES):
+    """
+    Monte Carlo: ejecuta `replicas` simulaciones independientes repartidas en
+    un ProcessPoolExecutor. Cada réplica recibe su propio flujo aleatorio, una
+    SeedSequence hija de `semilla` (entero, None o SeedSequence), así que
+    los flujos son independientes y el resultado no depende del número de
+    procesos. Con procesos=1 todo se ejecuta en el proceso actual.
+    """
+    semillas = semillas_replicas(semilla, replicas)
+
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    procesos = max(1, min(procesos, replicas))
+
+    # Bloques pequeños para repartir bien la carga entre procesos
+    tam_bloque = max(1, -(-replicas // (procesos * 4)))
+    bloques = [semillas[i:i + tam_bloque] for i in range(0, replicas, tam_bloque)]
+    args = (params, pais_inicial, dias, dt, contagio)
+
+    if procesos == 1:
+        parciales = [_ejecutar_bloque(*args, bloque) for bloque in bloques]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            futuros = [ejecutor.submit(_ejecutar_bloque, *args, bloque) for bloque in bloques]
+            parciales = [futuro.result() for futuro in futuros]
+
+    media = {c: sum(p[0][c] for p in parciales) / replicas for c in COMPARTIMENTOS}
+    total_I, total_D, pico_I, muertes, dia_llegada = (
+        np.concatenate([p[k] for p in parciales]) for k in range(1, 6))
+
+    return ResultadoEnsamble(params.paises, cuantiles, media, total_I, total_D,
+                             pico_I, muertes, dia_llegada)
@@ -0,0 +1,194 @@
+import heapq
+
+import numpy as np
+
+from .motor import DIAS, DT, MotorSIRD
+
+# =============================
+# PLANIFICADOR DE CONTAGIOS POR EVENTOS
+# =============================
+
+# Fases de un evento de contagio (la FASE 1 de un día va antes que la FASE 2)
+FASE_PREVIA = 1
+FASE_POSTERIOR = 2
+
+# Días que avanza el planificador entre sorteos de contagio
+BLOQUE_DIAS = 10
+
+class MotorEventos(MotorSIRD):
+    """
+    Variante de MotorSIRD que no sondea cada día a todos los infectados.
+
+    Los días avanzan en bloques de `bloque` días: las ecuaciones de los
+    países activos se integran en un paso vectorizado por día y, al cerrar
+    el bloque, los ensayos de contagio de todas las aristas pendientes
+    (infectado -> vecino sano) se sortean de una vez sobre los días del
+    bloque en que la fuente supera ambos umbrales. El primer éxito de cada
+    arista se guarda como evento (dia, fase, fuente, destino) en una cola de
+    prioridad y los eventos se procesan en orden; los que apuntan a un país
+    ya contagiado se descartan. Un país contagiado a mitad de bloque se
+    integra solo hasta el final del bloque y sus aristas se sortean a su vez.
+
+    Cada ensayo tiene la misma probabilidad que en el modelo original (FASE 1
+    con el estado del día anterior, FASE 2 con el del día), así que la
+    distribución de trayectorias es la misma; la secuencia aleatoria no.
+
+    avanzar() e iterar() funcionan como en MotorSIRD, pero cada bloque se
+    calcula entero: avanzar(dia) puede dejar calculados días posteriores
+    (dia_actual es el final del bloque). Solo admite historial completo;
+    no admite puntos de control ni ramas.
+    """
+    def __init__(self, params, pais_inicial, dias=DIAS, dt=DT, semilla=None, imprimir=False,
+                 historial=True, conjunto_activo=True, bloque=BLOQUE_DIAS, integrador="euler"):
+        if not historial:
+            raise ValueError("El planificador de eventos necesita historial completo")
+        super().__init__(params, pais_inicial, dias=dias, dt=dt, semilla=semilla,
+                         imprimir=imprimir, conjunto_activo=conjunto_activo,
+                         integrador=integrador)
+        self.contagio = "eventos"
+        self.bloque = bloque
+        self.eventos = []
+        self.eventos_descartados = 0
+        # Primer día en que cada país se integra (la FASE 2 solo usa esos días)
+        self.primer_dia_integrado = np.full(params.n, dias, dtype=int)
+        self.primer_dia_integrado[self.infectado] = 1
+        # Aristas infectado -> vecino sano aún sin contagio sorteado
+        self.pend_origen = np.empty(0, dtype=np.int64)
+        self.pend_destino = np.empty(0, dtype=np.int64)
+        self._agregar_fuentes(np.flatnonzero(self.infectado), 1, 0)
+
+    def _integrar(self, filas, desde, hasta):
+        """Integra las filas en los días desde..hasta, retirando las que se estabilizan"""
+        for dia in range(desde, hasta + 1):
+            if filas.size == 0:
+                break
+            self.paso_euler(filas, dia)
+            if not self.conjunto_activo:
+                continue
+            estables = self._estabilizar_filas(filas, dia)
+            if estables.size:
+                filas = np.setdiff1d(filas, estables)
+
+    def _sortear(self, origen, destino, desde, hasta):
+        """
+        Sortea los ensayos de las aristas dadas para los días desde..hasta y
+        encola el primer éxito de cada una. Devuelve la máscara de aristas resueltas.
+        """
+        p = self.params
+        umbral = np.maximum(p.umbral_contagiar[origen], p.umbral_ser_contagiado[destino])
+        # Columna 0 = día desde-1 (la FASE 1 del día d mira el día d-1)
+        apta = self.I[origen, desde - 1:hasta + 1] >= umbral[:, None]
+        dias_bloque = hasta - desde + 1
+
+        ensayos = np.empty((origen.size, dias_bloque, 2), dtype=bool)
+        ensayos[:, :, 0] = apta[:, :-1]
+        dias_abs = np.arange(desde, hasta + 1)
+        ensayos[:, :, 1] = apta[:, 1:] & (dias_abs >= self.primer_dia_integrado[origen, None])
+        filas = np.flatnonzero(ensayos.any(axis=(1, 2)))
+        if filas.size == 0:
+            return np.zeros(origen.size, dtype=bool)
+
+        ensayos = ensayos[filas]
+        prob = np.stack([p.prob_fase1[destino[filas]], p.prob_fase2[destino[filas]]], axis=1)
+        exito = ensayos & (self.rng.random_sample(ensayos.shape) < prob[:, None, :])
+        exito = exito.reshape(filas.size, -1)
+        primero = exito.argmax(axis=1)
+
+        resueltas = np.zeros(origen.size, dtype=bool)
+        for k in np.flatnonzero(exito.any(axis=1)):
+            dia, fase = divmod(int(primero[k]), 2)
+            arista = filas[k]
+            heapq.heappush(self.eventos, (desde + dia, FASE_PREVIA + fase,
+                                          int(origen[arista]), int(destino[arista])))
+            resueltas[arista] = True
+        return resueltas
+
+    def _agregar_fuentes(self, fuentes, desde, hasta):
+        """Añade las aristas de nuevas fuentes y sortea sus días desde..hasta"""
+        p = self.params
+        aristas = p.grafo.aristas_de(fuentes)
+        origen = p.grafo.origen[aristas]
+        destino = p.grafo.indices[aristas]
+        sanos = ~self.infectado[destino]
+        origen, destino = origen[sanos], destino[sanos]
+        if origen.size == 0:
+            return
+        resueltas = self._sortear(origen, destino, desde, hasta)
+        self.pend_origen = np.concatenate([self.pend_origen, origen[~resueltas]])
+        self.pend_destino = np.concatenate([self.pend_destino, destino[~resueltas]])
+
+    def _procesar_eventos(self, hasta):
+        """Atiende en orden los eventos de la cola con día <= hasta"""
+        while self.eventos and self.eventos[0][0] <= hasta:
+            # Un lote: todos los eventos del día más próximo
+            dia = self.eventos[0][0]
+            previos, integrados = [], []
+            while self.eventos and self.eventos[0][0] == dia:
+                _, fase, fuente, destino = heapq.heappop(self.eventos)
+                if self.infectado[destino]:
+                    self.eventos_descartados += 1
+                    continue
+                visto = dia - 1 if fase == FASE_PREVIA else dia
+                self._informar_contagio(dia, fuente, destino, self.I[fuente, visto])
+                # En la FASE 2, un país de índice mayor que su fuente se
+                # integra ese mismo día (como en el modelo original)
+                if fase == FASE_POSTERIOR and destino > fuente:
+                    self.infectado[destino] = True
+                    self.dia_llegada[destino] = dia
+                    integrados.append(destino)
+                else:
+                    self._sembrar(destino, dia)
+                    previos.append(destino)
+
+            previos = np.array(previos, dtype=np.int64)
+            integrados = np.array(integrados, dtype=np.int64)
+            if integrados.size:
+                self.paso_euler(integrados, dia)
+            self.primer_dia_integrado[previos] = dia + 1
+            self.primer_dia_integrado[integrados] = dia
+
+            nuevos = np.concatenate([previos, integrados])
+            if nuevos.size:
+                self._integrar(nuevos, dia + 1, hasta)
+                self._agregar_fuentes(nuevos, dia, hasta)
+
+    def _avanzar_bloque(self):
+        """Calcula el bloque de días siguiente a dia_actual procesando la cola de eventos"""
+        hecho = self.dia_actual
+        fin = min(hecho + self.bloque, self.dias - 1)
+        activos = np.flatnonzero(self.infectado & ~self.estabilizado)
+        self._integrar(activos, hecho + 1, fin)
+
+        # Solo las aristas con destino sano y fuente aún activa pueden contagiar
+        vivas = ~self.infectado[self.pend_destino] & ~self.estabilizado[self.pend_origen]
+        self.pend_origen = self.pend_origen[vivas]
+        self.pend_destino = self.pend_destino[vivas]
+        if self.pend_origen.size:
+            resueltas = self._sortear(self.pend_origen, self.pend_destino, hecho + 1, fin)
+            self.pend_origen = self.pend_origen[~resueltas]
+            self.pend_destino = self.pend_destino[~resueltas]
+
+        self._procesar_eventos(fin)
+        self.dia_actual = fin
+
+        # Sin aristas pendientes ni países activos la red es estacionaria
+        if not self.eventos and self.pend_origen.size == 0 and \
+                np.all(self.estabilizado[self.infectado]):
+            self.dia_estacionario = fin
+
+    def avanzar(self, dia):
+        """Calcula hasta `dia` (al menos) por bloques; un día ya calculado no hace nada"""
+        if dia >= self.dias:
+            raise ValueError(f"Día fuera del horizonte de la simulación: {dia}")
+        while self.dia_actual < dia:
+            if self.estacionario:
+                # Los días restantes ya están rellenos
+                self.dia_actual = dia
+                return
+            self._avanzar_bloque()
+
+def simular_sird_eventos(params, pais_inicial, dias=DIAS, dt=DT, semilla=None, imprimir=False,
+                         integrador="euler"):
+    """Atajo: construye un MotorEventos y lo ejecuta completo"""
+    return MotorEventos(params, pais_inicial, dias=dias, dt=dt, semilla=semilla,
+                        imprimir=imprimir, integrador=integrador).ejecutar()
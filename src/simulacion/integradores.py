@@ -0,0 +1,216 @@
+import numpy as np
+
+# =============================
+# INTEGRADORES DE ORDEN SUPERIOR
+# =============================
+
+INTEGRADORES = ("euler", "rk4", "rk45")
+
+# Tolerancias por defecto del integrador adaptativo (personas)
+RTOL = 1e-5
+ATOL = 1.0
+# Paso máximo del integrador adaptativo (días)
+PASO_MAXIMO = 30.0
+
+# Tablero de Dormand-Prince 5(4)
+_C = np.array([0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0])
+_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+_B5 = np.array([35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0])
+_B4 = np.array([5179 / 57600, 0.0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40])
+
+def derivadas_sird(params, y, dia, filas):
+    """
+    Lado derecho del sistema SIRD para las filas dadas. `y` tiene forma
+    (5, k) con S, I, R, D, V; `dia` (escalar o vector de k) es el día cuyo
+    régimen rige (recuperación y vacunación), igual que en paso_euler_sird.
+    """
+    p = params
+    N = p.poblacion[filas]
+    S, I = y[0], y[1]
+
+    gamma = np.where(dia < p.dia_recuperacion[filas], 0.0, p.gamma_post[filas])
+    vacunando = (dia >= p.vac_inicio[filas]) & (S > 0)
+    nu = np.where(vacunando, np.minimum(p.vac_rate[filas] * N, S), 0.0)
+    contagios = p.beta[filas] * S * I / N
+    mu = p.mu[filas]
+
+    return np.array([-contagios - nu,
+                     contagios - gamma * I - mu * I,
+                     gamma * I + nu,
+                     mu * I,
+                     nu])
+
+def acotar(params, y, filas):
+    """Mismas cotas que el modelo original sobre el estado de partida de un paso"""
+    N = params.poblacion[filas]
+    y = np.maximum(y, 0.0)
+    y[0] = np.minimum(y[0], N - params.infeccion_inicial)
+    y[1] = np.maximum(y[1], params.infeccion_inicial)
+    return y
+
+def paso_rk4(params, y, dia, h, filas):
+    """
+    Un paso de Runge-Kutta clásico de tamaño h (vector por fila). Devuelve
+    (y_nuevo, f_inicial)
+    """
+    k1 = derivadas_sird(params, y, dia, filas)
+    k2 = derivadas_sird(params, y + h / 2 * k1, dia, filas)
+    k3 = derivadas_sird(params, y + h / 2 * k2, dia, filas)
+    k4 = derivadas_sird(params, y + h * k3, dia, filas)
+    return y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4), k1
+
+def paso_dormand_prince(params, y, dia, h, filas):
+    """
+    Un paso de Dormand-Prince 5(4). Devuelve (y5, error, f_inicial, f_final):
+    la solución de orden 5, la diferencia con la de orden 4 y las derivadas en
+    los extremos del paso (útiles para interpolar).
+    """
+    k = []
+    for fila_a in _A:
+        y_etapa = y + h * sum(a * ki for a, ki in zip(fila_a, k)) if fila_a else y
+        k.append(derivadas_sird(params, y_etapa, dia, filas))
+    k = np.array(k)
+    y5 = y + h * np.tensordot(_B5, k, axes=1)
+    y4 = y + h * np.tensordot(_B4, k, axes=1)
+    return y5, y5 - y4, k[0], k[-1]
+
+def hermite(t, ta, ya, fa, tb, yb, fb):
+    """Interpolación cúbica de Hermite entre dos pasos (salida densa)"""
+    h = tb - ta
+    s = np.where(h > 0, (t - ta) / np.where(h > 0, h, 1.0), 1.0)
+    h00 = 2 * s**3 - 3 * s**2 + 1
+    h10 = s**3 - 2 * s**2 + s
+    h01 = -2 * s**3 + 3 * s**2
+    h11 = s**3 - s**2
+    return h00 * ya + h10 * h * fa + h01 * yb + h11 * h * fb
+
+class IntegradorFilas:
+    """
+    Integra el SIRD de cada país con su propio reloj: cada fila guarda su
+    último paso (ta, ya, fa) -> (tb, yb, fb) y avanza solo cuando se le pide
+    un día posterior a tb. Los pasos de todas las filas rezagadas se dan a la
+    vez (vectorizados) y los valores diarios se interpolan con Hermite, de
+    modo que un paso puede cubrir varios días en las fases tranquilas.
+
+    Los pasos nunca cruzan un cambio de régimen de la fila (inicio de la
+    recuperación o de la vacunación), donde el lado derecho es discontinuo.
+    - "rk4": pasos fijos de tamaño h (días)
+    - "rk45": Dormand-Prince con control de error (rtol, atol); h es el
+      paso inicial y nunca supera paso_maximo
+    """
+    def __init__(self, params, metodo="rk45", h=1.0, rtol=RTOL, atol=ATOL,
+                 paso_maximo=PASO_MAXIMO):
+        if metodo not in ("rk4", "rk45"):
+            raise ValueError(f"Integrador desconocido: {metodo}")
+        self.params = params
+        self.metodo = metodo
+        self.h_inicial = h
+        self.rtol = rtol
+        self.atol = atol
+        self.paso_maximo = paso_maximo
+
+        n = params.n
+        self.ta = np.full(n, -1.0)
+        self.tb = np.full(n, -1.0)
+        self.ya = np.zeros((5, n))
+        self.yb = np.zeros((5, n))
+        self.fa = np.zeros((5, n))
+        self.fb = np.zeros((5, n))
+        self.h = np.full(n, float(h))
+        self.pasos = 0
+        self.rechazados = 0
+
+        # Tiempos en que cambia el régimen de cada fila: el paso que termina
+        # en el día d usa el régimen del día d
+        self.cambios = np.stack([params.dia_recuperacion - 1, params.vac_inicio - 1])
+
+    def exportar(self):
+        """Estado interno como arrays (para los puntos de control del motor)"""
+        return {"ta": self.ta, "tb": self.tb, "ya": self.ya, "yb": self.yb, "fa": self.fa,
+                "fb": self.fb, "h": self.h, "contadores": np.array([self.pasos, self.rechazados])}
+
+    def importar(self, datos):
+        for clave in ("ta", "tb", "ya", "yb", "fa", "fb", "h"):
+            getattr(self, clave)[...] = datos[clave]
+        self.pasos, self.rechazados = (int(c) for c in datos["contadores"])
+
+    def iniciadas(self, filas):
+        return self.tb[filas] >= 0
+
+    def reiniciar(self, filas, t, y):
+        """Arranca las filas en el tiempo t con el estado y (5, k)"""
+        self.ta[filas] = self.tb[filas] = t
+        self.ya[:, filas] = self.yb[:, filas] = y
+        self.fa[:, filas] = self.fb[:, filas] = 0.0
+        self.h[filas] = self.h_inicial
+
+    def _limite_paso(self, filas, t):
+        """Distancia al próximo cambio de régimen de cada fila (inf si no quedan)"""
+        cambios = self.cambios[:, filas]
+        distancia = np.where(cambios > t + 1e-12, cambios - t, np.inf)
+        return distancia.min(axis=0)
+
+    def _paso(self, filas):
+        """Un intento de paso para las filas dadas; devuelve las que avanzaron"""
+        p = self.params
+        t = self.tb[filas]
+        y = acotar(p, self.yb[:, filas], filas)
+        h = np.minimum(self.h[filas], self._limite_paso(filas, t))
+        dia = np.floor(t + 1e-9) + 1  # régimen del tramo que empieza en t
+
+        if self.metodo == "rk4":
+            y_nuevo, f_inicial = paso_rk4(p, y, dia, h, filas)
+            f_nuevo = derivadas_sird(p, y_nuevo, dia, filas)
+            aceptadas = np.ones(filas.size, dtype=bool)
+        else:
+            y_nuevo, error, f_inicial, f_nuevo = paso_dormand_prince(p, y, dia, h, filas)
+            escala = self.atol + self.rtol * np.maximum(np.abs(y), np.abs(y_nuevo))
+            norma = np.max(np.abs(error) / escala, axis=0)
+            aceptadas = norma <= 1.0
+            factor = np.clip(0.9 * np.where(norma > 0, norma, 1e-10) ** -0.2, 0.2, 5.0)
+            self.h[filas] = np.minimum(h * factor, self.paso_maximo)
+            self.rechazados += int((~aceptadas).sum())
+
+        filas_ok = filas[aceptadas]
+        self.ta[filas_ok] = t[aceptadas]
+        self.ya[:, filas_ok] = y[:, aceptadas]
+        self.fa[:, filas_ok] = f_inicial[:, aceptadas]
+        self.tb[filas_ok] = t[aceptadas] + h[aceptadas]
+        self.yb[:, filas_ok] = y_nuevo[:, aceptadas]
+        self.fb[:, filas_ok] = f_nuevo[:, aceptadas]
+        self.pasos += int(aceptadas.sum())
+        return filas_ok
+
+    def valores(self, filas, dia):
+        """Estado (5, k) de las filas en el día `dia`, avanzando lo necesario"""
+        y = np.empty((5, filas.size))
+        rezagadas = self.tb[filas] < dia - 1e-9
+        al_dia = ~rezagadas
+        y[:, al_dia] = self._interpolar(filas[al_dia], dia)
+
+        if rezagadas.any():
+            # Las filas que necesitarán un paso mañana lo dan ya junto con las
+            # rezagadas (su valor de hoy ya está interpolado): así los pasos se
+            # agrupan en menos llamadas vectorizadas
+            manana = al_dia & (self.tb[filas] < dia + 1)
+            self._paso(filas[rezagadas | manana])
+            pendientes = filas[rezagadas]
+            pendientes = pendientes[self.tb[pendientes] < dia - 1e-9]
+            while pendientes.size:
+                self._paso(pendientes)
+                pendientes = pendientes[self.tb[pendientes] < dia - 1e-9]
+            y[:, rezagadas] = self._interpolar(filas[rezagadas], dia)
+
+        return np.maximum(y, 0.0)
+
+    def _interpolar(self, filas, dia):
+        return hermite(dia, self.ta[filas], self.ya[:, filas], self.fa[:, filas],
+                       self.tb[filas], self.yb[:, filas], self.fb[:, filas])
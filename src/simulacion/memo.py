@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from .aleatorio import descripcion_semilla
+from .motor import PARAMETROS_MODIFICABLES, ResultadoSIRD
+
+# Se incrementa si cambia el modelo o el formato del almacén
+VERSION_MEMORIA = 2
+
+# Resultados que se conservan en memoria
+CAPACIDAD_MEMORIA = 16
+
+# Resultados que MemoriaSimulaciones conserva en disco (~0.5 MB cada uno)
+CAPACIDAD_DISCO = 64
+
+# =============================
+# CLAVE DE CONTENIDO
+# =============================
+
+def huella_parametros(params):
+    """SHA-256 de todos los vectores y constantes de unos ParametrosPaises"""
+    h = hashlib.sha256()
+    h.update(json.dumps({"paises": params.paises, "sistemas": params.sistemas,
+                         "vecinos": params.vecinos,
+                         "tasa_contagio_base": params.tasa_contagio_base,
+                         "infeccion_inicial": params.infeccion_inicial}).encode())
+    for nombre in ("poblacion",) + PARAMETROS_MODIFICABLES:
+        h.update(np.ascontiguousarray(getattr(params, nombre), dtype=float).tobytes())
+    return h.hexdigest()
+
+def clave_simulacion(params, pais_inicial, semilla, configuracion):
+    """
+    Clave de una simulación según su contenido: parámetros, origen, semilla
+    y configuración (horizonte, dt, modos). `params` puede ser también su
+    huella_parametros ya calculada (p. ej. una por punto de un barrido). Sin
+    semilla, o con un generador ya creado, no hay clave (None): el resultado
+    no es reproducible.
+    """
+    semilla = descripcion_semilla(semilla)
+    if semilla is None:
+        return None
+    huella = params if isinstance(params, str) else huella_parametros(params)
+    contenido = {"version": VERSION_MEMORIA, "parametros": huella,
+                 "origen": pais_inicial, "semilla": semilla,
+                 "configuracion": vars(configuracion)}
+    return hashlib.sha256(json.dumps(contenido, sort_keys=True).encode()).hexdigest()
+
+# =============================
+# ALMACÉN MAPEADO EN DISCO
+# =============================
+
+class AlmacenMapeado:
+    """
+    Resultados en disco por clave_simulacion (la memoria de la interfaz y la
+    caché de los barridos): un .npy por clave con los cinco compartimentos
+    apilados, forma (5, n_paises, dias), que se abre con mmap_mode="r".
+    Reabrir un escenario solo mapea el archivo; el sistema operativo lee las
+    páginas a medida que se usan. Países, días de llegada y métricas
+    opcionales van en un .json que se escribe al final y marca la entrada
+    como completa. Las escrituras son atómicas (archivo temporal +
+    os.replace), así que varios procesos pueden guardar a la vez.
+
+    Con `capacidad`, guardar() borra las entradas usadas hace más tiempo
+    (según la fecha de su .json, que cargar() actualiza) hasta quedarse en
+    ese número; None no pone límite.
+    """
+    def __init__(self, directorio, capacidad=None):
+        if capacidad is not None and capacidad < 1:
+            raise ValueError("La capacidad del almacén debe ser al menos 1")
+        self.directorio = directorio
+        self.capacidad = capacidad
+
+    def _ruta(self, clave, extension):
+        return os.path.join(self.directorio, f"{clave}{extension}")
+
+    def __contains__(self, clave):
+        return os.path.exists(self._ruta(clave, ".json"))
+
+    def guardar(self, clave, resultado, metricas=None):
+        os.makedirs(self.directorio, exist_ok=True)
+        ruta = self._ruta(clave, ".npy")
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "wb") as archivo:
+            np.save(archivo, np.stack([resultado.S, resultado.I, resultado.R,
+                                       resultado.D, resultado.V]))
+        os.replace(temporal, ruta)
+
+        ruta = self._ruta(clave, ".json")
+        with open(f"{ruta}.{os.getpid()}.tmp", "w", encoding="utf-8") as archivo:
+            json.dump({"paises": list(resultado.paises),
+                       "dia_llegada": np.asarray(resultado.dia_llegada).tolist(),
+                       "metricas": None if metricas is None else np.asarray(metricas).tolist()},
+                      archivo)
+        os.replace(f"{ruta}.{os.getpid()}.tmp", ruta)
+        if self.capacidad is not None:
+            self._recortar()
+
+    def _recortar(self):
+        """Borra las entradas menos usadas que sobran (primero el .json, que marca la entrada)"""
+        entradas = []
+        for entrada in os.scandir(self.directorio):
+            if entrada.name.endswith(".json"):
+                try:
+                    entradas.append((entrada.stat().st_mtime, entrada.name[:-len(".json")]))
+                except FileNotFoundError:
+                    pass  # la borró otro proceso
+        entradas.sort()
+        for _, clave in entradas[:max(0, len(entradas) - self.capacidad)]:
+            for extension in (".json", ".npy"):
+                try:
+                    os.remove(self._ruta(clave, extension))
+                except OSError:
+                    pass  # ya borrada, o mapeada en Windows: se reintenta en el siguiente recorte
+
+    def __len__(self):
+        if not os.path.isdir(self.directorio):
+            return 0
+        return sum(1 for nombre in os.listdir(self.directorio) if nombre.endswith(".json"))
+
+    def cargar(self, clave):
+        """ResultadoSIRD cuyos compartimentos son vistas de solo lectura del archivo"""
+        ruta = self._ruta(clave, ".json")
+        with open(ruta, encoding="utf-8") as archivo:
+            meta = json.load(archivo)
+        os.utime(ruta)  # usada ahora: la última en borrarse
+        S, I, R, D, V = np.load(self._ruta(clave, ".npy"), mmap_mode="r")
+        return ResultadoSIRD(meta["paises"], S, I, R, D, V, np.array(meta["dia_llegada"]))
+
+    def metricas(self, clave):
+        """Métricas guardadas con la entrada (solo lee el .json), o None"""
+        with open(self._ruta(clave, ".json"), encoding="utf-8") as archivo:
+            metricas = json.load(archivo)["metricas"]
+        return None if metricas is None else np.array(metricas)
+
+# =============================
+# MEMORIA DE RESULTADOS
+# =============================
+
+class MemoriaSimulaciones:
+    """
+    Memoiza resultados de simulación por clave_simulacion. Los más recientes
+    quedan en un LRU en memoria (como mucho `capacidad`); con `directorio`
+    se guardan además en un AlmacenMapeado, que sobrevive a la sesión y
+    conserva como mucho `capacidad_disco` resultados (None: sin límite).
+    Un fallo en memoria que acierta en disco mapea el archivo y lo sube al LRU.
+    """
+    def __init__(self, capacidad=CAPACIDAD_MEMORIA, directorio=None,
+                 capacidad_disco=CAPACIDAD_DISCO):
+        if capacidad < 1:
+            raise ValueError("La capacidad de la memoria debe ser al menos 1")
+        self.capacidad = capacidad
+        self.almacen = None
+        if directorio is not None:
+            self.almacen = AlmacenMapeado(directorio, capacidad=capacidad_disco)
+        self._recientes = OrderedDict()
+        self.aciertos = 0
+        self.aciertos_disco = 0
+        self.fallos = 0
+
+    def obtener(self, clave):
+        """ResultadoSIRD guardado con esa clave, o None"""
+        if clave is None:
+            return None
+        if clave in self._recientes:
+            self._recientes.move_to_end(clave)
+            self.aciertos += 1
+            return self._recientes[clave]
+        if self.almacen is not None and clave in self.almacen:
+            self.aciertos_disco += 1
+            resultado = self.almacen.cargar(clave)
+            self._recordar(clave, resultado)
+            return resultado
+        self.fallos += 1
+        return None
+
+    def guardar(self, clave, resultado):
+        """Guarda un resultado completo (las claves None se ignoran)"""
+        if clave is None:
+            return
+        self._recordar(clave, resultado)
+        if self.almacen is not None and clave not in self.almacen:
+            self.almacen.guardar(clave, resultado)
+
+    def _recordar(self, clave, resultado):
+        self._recientes[clave] = resultado
+        self._recientes.move_to_end(clave)
+        if len(self._recientes) > self.capacidad:
+            self._recientes.popitem(last=False)
+
+    def simular(self, params, pais_inicial, semilla, configuracion, imprimir=False):
+        """Como simular_sird con una configuración, pero sin repetir escenarios ya simulados"""
+        clave = clave_simulacion(params, pais_inicial, semilla, configuracion)
+        resultado = self.obtener(clave)
+        if resultado is None:
+            motor = configuracion.crear_motor(params, pais_inicial, semilla=semilla,
+                                              imprimir=imprimir)
+            resultado = motor.ejecutar()
+            self.guardar(clave, resultado)
+        return resultado
+
+    def __len__(self):
+        return len(self._recientes)
@@ -0,0 +1,869 @@
+import copy
+import heapq
+import itertools
+
+import numpy as np
+
+from .aleatorio import FlujoAleatorio, crear_generador
+from .contagio import GrafoVecinos, contagio_disperso
+from .rangos import IndiceRangos
+
+# =============================
+# CONSTANTES DEL MODELO
+# =============================
+
+DIAS = 300
+DT = 1.0
+TASA_CONTAGIO_BASE = 0.90
+INFECCION_INICIAL = 30
+
+# Valores por defecto de ConfiguracionSimulacion; el motor no lee estas
+# constantes directamente, sino la configuración y los parámetros que recibe.
+# Multiplicador de la probabilidad de contagio según el sistema del país destino.
+# La FASE 1 (antes de integrar) y la FASE 2 (después de integrar) usan factores
+# distintos para los sistemas desarrollados, igual que el modelo original.
+FACTOR_SISTEMA_FASE1 = {"desarrollado": 0.4, "normal": 1.0, "precario": 2.0}
+FACTOR_SISTEMA_FASE2 = {"desarrollado": 0.5, "normal": 1.0, "precario": 2.0}
+
+VERSION_PUNTO_CONTROL = 2
+
+# Vectores de ParametrosPaises que una rama puede cambiar (ver MotorSIRD.bifurcar)
+PARAMETROS_MODIFICABLES = ("beta", "mu", "gamma_post", "dia_recuperacion", "vac_inicio",
+                           "vac_rate", "umbral_contagiar", "umbral_ser_contagiado",
+                           "prob_fase1", "prob_fase2")
+
+# =============================
+# PARÁMETROS VECTORIZADOS
+# =============================
+
+class ParametrosPaises:
+    """
+    Parámetros del modelo como vectores por país, precalculados una sola vez
+    desde config_paises. El índice i de cada vector corresponde a paises[i].
+    La tasa de contagio base y la infección inicial quedan fijadas aquí, de
+    modo que dos juegos de parámetros distintos pueden usarse a la vez.
+    """
+    def __init__(self, paises, config_paises, vecinos, tasa_contagio_base=TASA_CONTAGIO_BASE,
+                 infeccion_inicial=INFECCION_INICIAL):
+        self.paises = list(paises)
+        self.tasa_contagio_base = tasa_contagio_base
+        self.infeccion_inicial = infeccion_inicial
+        self.indice = {pais: i for i, pais in enumerate(self.paises)}
+        self.n = len(self.paises)
+
+        def vector(clave):
+            return np.array([config_paises[p][clave] for p in self.paises], dtype=float)
+
+        self.sistemas = [config_paises[p]["sistema"] for p in self.paises]
+        self.poblacion = vector("poblacion")
+        self.beta = vector("beta")
+        self.mu = vector("mu")
+        self.gamma_post = vector("gamma_post")
+        self.dia_recuperacion = vector("dia_recuperacion")
+        self.vac_inicio = vector("vac_inicio")
+        self.vac_rate = vector("vac_rate")
+        self.umbral_contagiar = vector("umbral_contagiar")
+        self.umbral_ser_contagiado = vector("umbral_ser_contagiado")
+
+        self.prob_fase1 = np.array([tasa_contagio_base * FACTOR_SISTEMA_FASE1.get(s, 1.0)
+                                    for s in self.sistemas])
+        self.prob_fase2 = np.array([tasa_contagio_base * FACTOR_SISTEMA_FASE2.get(s, 1.0)
+                                    for s in self.sistemas])
+
+        # Vecinos como listas de índices (se descartan nombres fuera de paises,
+        # conservando el orden original de cada lista)
+        self.vecinos = [[self.indice[v] for v in vecinos.get(p, []) if v in self.indice]
+                        for p in self.paises]
+        self.grafo = GrafoVecinos(self.vecinos)
+
+    def con_cambios(self, **cambios):
+        """
+        Copia con algunos vectores de PARAMETROS_MODIFICABLES cambiados. Cada
+        valor puede ser un escalar (todos los países), un {pais: valor} o un
+        vector completo; el resto de vectores y el grafo se comparten.
+        """
+        nuevo = copy.copy(self)
+        for clave, valor in cambios.items():
+            if clave not in PARAMETROS_MODIFICABLES:
+                raise ValueError(f"Parámetro no modificable: {clave}")
+            vector = getattr(self, clave).copy()
+            if isinstance(valor, dict):
+                for pais, v in valor.items():
+                    vector[self.indice[pais]] = v
+            else:
+                vector[:] = valor
+            setattr(nuevo, clave, vector)
+        return nuevo
+
+# =============================
+# PASO DE INTEGRACIÓN
+# =============================
+
+def paso_euler_sird(params, S, I, R, D, V, dia, dt, filas=slice(None)):
+    """
+    Un paso de Euler del modelo SIRD sobre arrays de estado cuyo último eje
+    recorre los países `filas`. Admite ejes adicionales al frente (por ejemplo,
+    escenarios); los parámetros se difunden sobre el último eje.
+    Devuelve los nuevos (S, I, R, D, V).
+    """
+    p = params
+    N = p.poblacion[filas]
+
+    # Estado actual (mismas cotas que el modelo original)
+    S = np.maximum(0, np.minimum(S, N - p.infeccion_inicial))
+    I = np.maximum(p.infeccion_inicial, I)
+    R = np.maximum(0, R)
+    D = np.maximum(0, D)
+
+    beta = p.beta[filas]
+    mu = p.mu[filas]
+
+    # Tasa de recuperación variable
+    gamma = np.where(dia < p.dia_recuperacion[filas], 0.0, p.gamma_post[filas])
+
+    # Vacunación
+    vacunando = (dia >= p.vac_inicio[filas]) & (S > 0)
+    nu = np.where(vacunando, np.minimum(p.vac_rate[filas] * N, S), 0.0)
+
+    # Ecuaciones diferenciales del modelo SIRD
+    dS = -(beta * S * I / N) - nu
+    dI = (beta * S * I / N) - gamma * I - mu * I
+    dR = gamma * I + nu
+    dD = mu * I
+
+    return (np.maximum(0, S + dS * dt),
+            np.maximum(0, I + dI * dt),
+            np.maximum(0, R + dR * dt),
+            np.maximum(0, D + dD * dt),
+            V + nu)
+
+def subpasos_euler(dt):
+    """
+    (pasos, h) de Euler por día: con dt < 1 se dan round(1/dt) pasos de
+    tamaño 1/pasos (un número entero por día, solo se guarda el día); con
+    dt >= 1 un único paso de tamaño dt, como el modelo original.
+    """
+    if dt < 1:
+        pasos = max(1, int(round(1 / dt)))
+        return pasos, 1.0 / pasos
+    return 1, dt
+
+def paso_euler_dia(params, S, I, R, D, V, dia, dt, filas=slice(None)):
+    """Avanza un día completo con los subpasos de Euler que indique dt"""
+    pasos, h = subpasos_euler(dt)
+    estado = (S, I, R, D, V)
+    for _ in range(pasos):
+        estado = paso_euler_sird(params, *estado, dia, h, filas)
+    return estado
+
+# =============================
+# CONFIGURACIÓN DE LA SIMULACIÓN
+# =============================
+
+class ConfiguracionSimulacion:
+    """
+    Horizonte, resolución temporal y constantes del modelo de una simulación.
+    Se pasa al motor y a la interfaz en lugar de usar variables globales, así
+    que varios escenarios con horizontes distintos pueden convivir en un
+    mismo proceso. Es inmutable por convención: reemplazar() crea otra.
+    - dias: días simulados (None = sin límite, solo en streaming)
+    - dt: paso del integrador en días (con Euler y dt < 1, subpasos por día)
+    - tasa_contagio_base, infeccion_inicial: constantes del modelo
+    - integrador, contagio: modos de MotorSIRD
+    """
+    def __init__(self, dias=DIAS, dt=DT, tasa_contagio_base=TASA_CONTAGIO_BASE,
+                 infeccion_inicial=INFECCION_INICIAL, integrador="euler", contagio="secuencial"):
+        if dias is not None and dias < 1:
+            raise ValueError("La simulación necesita al menos un día")
+        if dt <= 0:
+            raise ValueError("dt debe ser positivo")
+        self.dias = dias
+        self.dt = dt
+        self.tasa_contagio_base = tasa_contagio_base
+        self.infeccion_inicial = infeccion_inicial
+        self.integrador = integrador
+        self.contagio = contagio
+
+    def reemplazar(self, **cambios):
+        """Copia de la configuración con algunos campos cambiados"""
+        campos = dict(vars(self))
+        campos.update(cambios)
+        return ConfiguracionSimulacion(**campos)
+
+    def parametros(self, paises, config_paises, vecinos):
+        """ParametrosPaises con las constantes de esta configuración"""
+        return ParametrosPaises(paises, config_paises, vecinos,
+                                tasa_contagio_base=self.tasa_contagio_base,
+                                infeccion_inicial=self.infeccion_inicial)
+
+    def crear_motor(self, params, pais_inicial, **opciones):
+        """Motor listo para ejecutar con el horizonte y los modos de esta configuración"""
+        return crear_motor(params, pais_inicial, dias=self.dias, dt=self.dt,
+                           integrador=self.integrador, contagio=self.contagio, **opciones)
+
+    def __repr__(self):
+        campos = ", ".join(f"{k}={v!r}" for k, v in vars(self).items())
+        return f"ConfiguracionSimulacion({campos})"
+
+# =============================
+# RESULTADO DE LA SIMULACIÓN
+# =============================
+
+class ResultadoSIRD:
+    """
+    Compartimentos S/I/R/D/V como arrays 2-D de forma (n_paises, dias).
+    maximos(), totales() y rangos() se calculan una vez por resultado; solo
+    deben pedirse cuando sus días ya son definitivos.
+    """
+    def __init__(self, paises, S, I, R, D, V, dia_llegada):
+        self.paises = paises
+        self.S = S
+        self.I = I
+        self.R = R
+        self.D = D
+        self.V = V
+        self.dia_llegada = dia_llegada
+        self._resumenes = {}
+        self._rangos = None
+
+    def _resumen(self, tipo, compartimento, calcular):
+        clave = (tipo, compartimento)
+        if clave not in self._resumenes:
+            self._resumenes[clave] = calcular(getattr(self, compartimento))
+        return self._resumenes[clave]
+
+    def maximos(self, compartimento):
+        """Máximo de cada país en toda la serie, p. ej. maximos("I") = picos"""
+        return self._resumen("maximos", compartimento, lambda m: m.max(axis=1))
+
+    def totales(self, compartimento):
+        """Suma de todos los países por día, p. ej. totales("I") = infectados en Europa"""
+        return self._resumen("totales", compartimento, lambda m: m.sum(axis=0))
+
+    def rangos(self):
+        """IndiceRangos para consultas de máximo y mínimo por intervalo de días"""
+        if self._rangos is None:
+            self._rangos = IndiceRangos(self)
+        return self._rangos
+
+    def como_diccionarios(self):
+        """
+        Devuelve (datos_I, datos_D, datos_R, datos_S, datos_V) con el mismo
+        formato que la interfaz: {pais: serie diaria}. Cada serie es una vista
+        de la fila correspondiente, sin copiar datos.
+        """
+        def a_dict(matriz):
+            return {pais: matriz[i] for i, pais in enumerate(self.paises)}
+
+        return a_dict(self.I), a_dict(self.D), a_dict(self.R), a_dict(self.S), a_dict(self.V)
+
+# =============================
+# MOTOR SIRD VECTORIZADO
+# =============================
+
+class EstadoDiario:
+    """Estado de todos los países en un día: vectores S/I/R/D/V de longitud n_paises"""
+    def __init__(self, dia, S, I, R, D, V, infectado):
+        self.dia = dia
+        self.S = S
+        self.I = I
+        self.R = R
+        self.D = D
+        self.V = V
+        self.infectado = infectado
+
+    def total_infectados(self):
+        return float(self.I.sum())
+
+class MotorSIRD:
+    """
+    Integra el modelo SIRD de todos los países a la vez: cada paso de Euler es
+    una única actualización vectorizada sobre las filas de los países infectados.
+
+    Con historial=False solo se guardan el día actual y el anterior (memoria
+    constante); el resultado se consume día a día con iterar(). En ese modo
+    dias=None simula sin límite.
+
+    Modos de contagio entre vecinos:
+    - "secuencial": conserva el orden de evaluación del modelo original (países
+      en orden de índice, vecinos en orden de lista), de modo que con la misma
+      semilla se consumen los mismos números aleatorios y se obtienen las mismas
+      trayectorias.
+    - "disperso": una pasada sobre el grafo CSR por fase, con máscaras de umbral
+      y un solo sorteo vectorizado. Las probabilidades de contagio son las
+      mismas, pero la secuencia aleatoria puede diferir cuando varios vecinos
+      intentan contagiar al mismo país el mismo día.
+
+    Con conjunto_activo=True solo se integran los países con dinámica real.
+    Un país infectado con S=0, I en la cota mínima y la recuperación ya
+    iniciada queda "estabilizado": a partir de ahí R y D crecen en un
+    incremento constante y el resto no cambia, así que sus días restantes se
+    rellenan en bloque y deja de integrarse. Cuando todos los infectados están
+    estabilizados ya no puede haber contagios y la red es estacionaria:
+    avanzar() no hace nada más (los días ya están rellenos).
+
+    integrador elige cómo se resuelven las ecuaciones de cada país:
+    - "euler": un paso de Euler de tamaño dt por día (el modelo original);
+      con dt < 1, round(1/dt) subpasos por día
+    - "rk4": Runge-Kutta clásico con paso fijo dt (días; puede ser > 1)
+    - "rk45": Dormand-Prince con control de error, partiendo de dt
+    Con "rk4" y "rk45" cada país avanza con su propio paso y los valores
+    diarios se interpolan (ver simulacion.integradores.IntegradorFilas); el
+    conjunto activo solo se aplica con "euler", porque depende de su punto fijo.
+
+    semilla admite un entero (RandomState, reproduce el modelo original), una
+    SeedSequence (Generator PCG64; ver aleatorio.semillas_replicas) o un
+    generador ya creado. Los números se sirven por bloques con FlujoAleatorio.
+
+    bifurcar() crea ramas que comparten los primeros días con el motor y solo
+    calculan el resto; en una rama dia_inicial es el día de la bifurcación y
+    los arrays guardan solo los días dia_inicial.. (los anteriores se leen del
+    prefijo del padre).
+    """
+    def __init__(self, params, pais_inicial, dias=DIAS, dt=DT, semilla=None, imprimir=False,
+                 contagio="secuencial", historial=True, conjunto_activo=True,
+                 integrador="euler", dia_inicial=0):
+        if contagio not in ("secuencial", "disperso"):
+            raise ValueError(f"Modo de contagio desconocido: {contagio}")
+        if dias is None and historial:
+            raise ValueError("dias=None solo es posible con historial=False")
+        self.params = params
+        self.dias = dias
+        self.dt = dt
+        self.imprimir = imprimir
+        self.contagio = contagio
+        self.historial = historial
+        self.integrador = integrador
+        # El conjunto activo depende del punto fijo de un único paso de Euler por día
+        self.estabilizable = integrador == "euler" and subpasos_euler(dt)[0] == 1
+        self.conjunto_activo = conjunto_activo and self.estabilizable
+        self.integrador_filas = None
+        if integrador != "euler":
+            from .integradores import IntegradorFilas
+            self.integrador_filas = IntegradorFilas(params, integrador, h=dt)
+        self.rng = FlujoAleatorio(crear_generador(semilla))
+
+        # Con historial, una columna por día; sin él, un búfer circular de dos
+        # columnas (todas las filas infectadas se reescriben cada día y las
+        # demás conservan su estado inicial)
+        n = params.n
+        self.dia_inicial = dia_inicial
+        self.prefijo = None
+        self._columnas = dias - dia_inicial if historial else 2
+        self.S = np.empty((n, self._columnas))
+        self.S[:] = params.poblacion[:, None]
+        self.I = np.zeros((n, self._columnas))
+        self.R = np.zeros((n, self._columnas))
+        self.D = np.zeros((n, self._columnas))
+        self.V = np.zeros((n, self._columnas))
+
+        self.infectado = np.zeros(n, dtype=bool)
+        self.dia_llegada = np.full(n, -1, dtype=int)
+        self.recuperacion_iniciada = False
+
+        # Conjunto activo: países estabilizados y sus incrementos diarios
+        self.estabilizado = np.zeros(n, dtype=bool)
+        self.incremento_R = np.zeros(n)
+        self.incremento_D = np.zeros(n)
+        self.I_estable = np.zeros(n)
+        self.dia_estacionario = None
+        # Último día ya calculado (ejecutar e iterar continúan desde aquí)
+        self.dia_actual = dia_inicial
+
+        origen = params.indice[pais_inicial]
+        self.I[origen, 0] = params.infeccion_inicial
+        self.S[origen, 0] = params.poblacion[origen] - params.infeccion_inicial
+        self.infectado[origen] = True
+        self.dia_llegada[origen] = 0
+
+    def _columna(self, dia):
+        """Columna de los arrays de estado que guarda el día indicado"""
+        if self.historial:
+            return dia - self.dia_inicial
+        return dia % self._columnas
+
+    def _compartimentos(self):
+        return (self.S, self.I, self.R, self.D, self.V)
+
+    def _tramo(self, hasta):
+        """
+        (S, I, R, D, V) de los días 0..hasta-1: vistas de los arrays del motor,
+        salvo en una rama, donde se concatena el prefijo del padre (copia)
+        """
+        propios = [m[:, :hasta - self.dia_inicial] for m in self._compartimentos()]
+        if self.prefijo is None:
+            return propios
+        return [np.concatenate([previo, propio], axis=1)
+                for previo, propio in zip(self.prefijo, propios)]
+
+    def paso_euler(self, filas, dia):
+        """
+        Avanza al día `dia` las filas indicadas: un paso de Euler desde el día
+        anterior o, con otro integrador, el valor interpolado de su trayectoria
+        """
+        previa, hoy = self._columna(dia - 1), self._columna(dia)
+        if self.integrador_filas is not None:
+            self._paso_integrador(filas, dia, previa, hoy)
+            return
+        nuevo = paso_euler_dia(self.params, self.S[filas, previa], self.I[filas, previa],
+                               self.R[filas, previa], self.D[filas, previa],
+                               self.V[filas, previa], dia, self.dt, filas)
+        for matriz, valores in zip((self.S, self.I, self.R, self.D, self.V), nuevo):
+            matriz[filas, hoy] = valores
+
+    def _paso_integrador(self, filas, dia, previa, hoy):
+        # Las filas que aún no tienen trayectoria arrancan desde el día anterior
+        integrador = self.integrador_filas
+        nuevas = filas[~integrador.iniciadas(filas)]
+        if nuevas.size:
+            estado = np.array([m[nuevas, previa] for m in (self.S, self.I, self.R, self.D, self.V)])
+            integrador.reiniciar(nuevas, float(dia - 1), estado)
+
+        valores = integrador.valores(filas, float(dia))
+        for matriz, fila_valores in zip((self.S, self.I, self.R, self.D, self.V), valores):
+            matriz[filas, hoy] = fila_valores
+
+    def _sembrar(self, pais, dia):
+        """Inicializa un país recién contagiado con la infección inicial de los parámetros"""
+        hoy = self._columna(dia)
+        self.infectado[pais] = True
+        self.dia_llegada[pais] = dia
+        self.I[pais, hoy] = self.params.infeccion_inicial
+        self.S[pais, hoy] = self.params.poblacion[pais] - self.params.infeccion_inicial
+        self.R[pais, hoy] = 0
+        self.D[pais, hoy] = 0
+        self.V[pais, hoy] = 0
+
+    def _informar_contagio(self, dia, origen, destino, infectados_origen):
+        if self.imprimir:
+            p = self.params
+            print(f"Día {dia}: {p.paises[origen]} ({int(infectados_origen):,} inf.) → {p.paises[destino]} "
+                  f"[{p.sistemas[destino]}] ({p.infeccion_inicial} inf. iniciales)")
+
+    def contagio_fase1(self, dia):
+        """
+        Contagios evaluados con el estado del día anterior. Devuelve la lista de
+        países contagiados hoy, que no se integran en este paso.
+        """
+        p = self.params
+        I_prev = self.I[:, self._columna(dia - 1)]
+
+        if self.contagio == "disperso":
+            destinos, fuentes = contagio_disperso(p.grafo, self.infectado, I_prev,
+                                                  p.umbral_contagiar, p.umbral_ser_contagiado,
+                                                  p.prob_fase1, self.rng)
+            for fuente, vecino in zip(fuentes, destinos):
+                self._sembrar(vecino, dia)
+                self._informar_contagio(dia, fuente, vecino, I_prev[fuente])
+            return list(destinos)
+
+        # Los infectados no cambian hasta después de los sorteos: las aristas
+        # candidatas (fuentes en orden de índice, vecinos en orden de lista) se
+        # sortean en un solo bloque, con los mismos números que uno a uno
+        fuentes = np.flatnonzero(self.infectado & (I_prev >= p.umbral_contagiar))
+        if fuentes.size == 0:
+            return []
+        aristas = p.grafo.aristas_de(fuentes)
+        origen, destino = p.grafo.origen[aristas], p.grafo.indices[aristas]
+        candidatas = ~self.infectado[destino] & (I_prev[origen] >= p.umbral_ser_contagiado[destino])
+        if not candidatas.any():
+            return []
+        origen, destino = origen[candidatas], destino[candidatas]
+        exito = self.rng.random_sample(destino.size) < p.prob_fase1[destino]
+
+        contagiados = []
+        for fuente, vecino in zip(origen[exito].tolist(), destino[exito].tolist()):
+            if not self.infectado[vecino]:
+                self._sembrar(vecino, dia)
+                contagiados.append(vecino)
+                self._informar_contagio(dia, fuente, vecino, I_prev[fuente])
+        return contagiados
+
+    def contagio_fase2(self, dia, integrados):
+        """
+        Contagios evaluados con el estado ya integrado del día. Las fuentes se
+        recorren en orden de índice; un país contagiado por una fuente de índice
+        menor se integra desde su estado inicial y puede contagiar a su vez.
+        """
+        p = self.params
+        hoy = self._columna(dia)
+        I_hoy = self.I[:, hoy]
+
+        if self.contagio == "disperso":
+            self._contagio_fase2_disperso(dia, integrados)
+            return
+
+        fuentes = [int(i) for i in integrados[I_hoy[integrados] >= p.umbral_contagiar[integrados]]]
+        heapq.heapify(fuentes)
+
+        while fuentes:
+            fuente = heapq.heappop(fuentes)
+            for vecino in p.vecinos[fuente]:
+                if self.infectado[vecino] or I_hoy[fuente] < p.umbral_ser_contagiado[vecino]:
+                    continue
+                if self.rng.random_sample() >= p.prob_fase2[vecino]:
+                    continue
+
+                self.infectado[vecino] = True
+                self.dia_llegada[vecino] = dia
+                self.I[vecino, hoy] = max(self.I[vecino, hoy], p.infeccion_inicial)
+                self.S[vecino, hoy] = max(0, self.S[vecino, hoy] - p.infeccion_inicial)
+                self._informar_contagio(dia, fuente, vecino, I_hoy[fuente])
+
+                if vecino > fuente:
+                    self.paso_euler(np.array([vecino]), dia)
+                    if I_hoy[vecino] >= p.umbral_contagiar[vecino]:
+                        heapq.heappush(fuentes, vecino)
+
+    def _contagio_fase2_disperso(self, dia, integrados):
+        """
+        FASE 2 en una pasada dispersa. Un país contagiado por una fuente de
+        índice menor se integra desde su estado inicial, como en el modelo
+        original; esos países no contagian de nuevo el mismo día.
+        """
+        p = self.params
+        hoy = self._columna(dia)
+        I_hoy = self.I[:, hoy]
+        # Solo las filas integradas hoy pueden actuar como fuente
+        fuentes_posibles = np.zeros(p.n, dtype=bool)
+        fuentes_posibles[integrados] = True
+        I_fuente = np.where(fuentes_posibles, I_hoy, 0.0)
+
+        destinos, fuentes = contagio_disperso(p.grafo, self.infectado, I_fuente,
+                                              p.umbral_contagiar, p.umbral_ser_contagiado,
+                                              p.prob_fase2, self.rng)
+        if destinos.size == 0:
+            return
+
+        self.infectado[destinos] = True
+        self.dia_llegada[destinos] = dia
+        self.I[destinos, hoy] = np.maximum(self.I[destinos, hoy], p.infeccion_inicial)
+        self.S[destinos, hoy] = np.maximum(0, self.S[destinos, hoy] - p.infeccion_inicial)
+        for fuente, vecino in zip(fuentes, destinos):
+            self._informar_contagio(dia, fuente, vecino, I_hoy[fuente])
+
+        posteriores = destinos[destinos > fuentes]
+        if posteriores.size:
+            self.paso_euler(posteriores, dia)
+
+    @property
+    def estacionario(self):
+        return self.dia_estacionario is not None
+
+    def _estabilizar(self, dia):
+        """Estabiliza los países que corresponda y detecta si la red es estacionaria"""
+        self._estabilizar_filas(np.flatnonzero(self.infectado & ~self.estabilizado), dia)
+
+        if np.all(self.estabilizado[self.infectado]):
+            self.dia_estacionario = dia
+            if self.imprimir:
+                print(f"\n📉 DÍA {dia}: red estacionaria, se completan los días restantes\n")
+
+    def _estabilizar_filas(self, filas, dia):
+        """
+        Detecta, entre las filas dadas, los países cuyo estado ya solo deriva
+        linealmente: S=0 (no hay vacunación ni contagio interno), I en la cota
+        mínima (el paso siguiente siempre parte de la infección inicial) y γ ya
+        constante. Deben quedar además por debajo de su umbral para contagiar.
+        Devuelve las filas estabilizadas.
+        """
+        if not self.estabilizable:
+            return filas[:0]
+        p = self.params
+        hoy = self._columna(dia)
+        candidatos = (self.S[filas, hoy] == 0) & (self.I[filas, hoy] <= p.infeccion_inicial) & \
+            (dia + 1 >= p.dia_recuperacion[filas])
+        filas = filas[candidatos]
+        if filas.size:
+            # Estado del día siguiente calculado con el mismo paso de Euler
+            siguiente = paso_euler_sird(p, self.S[filas, hoy], self.I[filas, hoy],
+                                        self.R[filas, hoy], self.D[filas, hoy],
+                                        self.V[filas, hoy], dia + 1, self.dt, filas)
+            quietas = siguiente[1] < p.umbral_contagiar[filas]
+            filas = filas[quietas]
+            self.I_estable[filas] = siguiente[1][quietas]
+
+        if filas.size:
+            self.estabilizado[filas] = True
+            self.incremento_R[filas] = p.gamma_post[filas] * p.infeccion_inicial * self.dt
+            self.incremento_D[filas] = p.mu[filas] * p.infeccion_inicial * self.dt
+            if self.historial and dia + 1 < self.dias:
+                self._rellenar(filas, dia)
+        return filas
+
+    def _rellenar(self, filas, dia):
+        """Escribe en bloque los días dia+1.. de países estabilizados"""
+        restantes = self.dias - dia - 1
+        hoy, manana = self._columna(dia), self._columna(dia + 1)
+        self.S[filas, manana:] = 0.0
+        self.I[filas, manana:] = self.I_estable[filas, None]
+        self.V[filas, manana:] = self.V[filas, hoy][:, None]
+        # add.accumulate suma en orden, igual que repetir R + dR*dt día a día
+        for matriz, incremento in ((self.R, self.incremento_R), (self.D, self.incremento_D)):
+            bloque = np.empty((filas.size, restantes + 1))
+            bloque[:, 0] = matriz[filas, hoy]
+            bloque[:, 1:] = incremento[filas, None]
+            matriz[filas, manana:] = np.cumsum(bloque, axis=1)[:, 1:]
+
+    def _avanzar_estabilizados(self, dia):
+        """Sin historial no se puede rellenar: se aplica el incremento de cada día"""
+        filas = np.flatnonzero(self.estabilizado)
+        if filas.size == 0:
+            return
+        previa, hoy = self._columna(dia - 1), self._columna(dia)
+        self.S[filas, hoy] = 0.0
+        self.I[filas, hoy] = self.I_estable[filas]
+        self.V[filas, hoy] = self.V[filas, previa]
+        self.R[filas, hoy] = self.R[filas, previa] + self.incremento_R[filas]
+        self.D[filas, hoy] = self.D[filas, previa] + self.incremento_D[filas]
+
+    def avanzar(self, dia):
+        """Ejecuta un día completo: contagios previos, integración y contagios posteriores"""
+        if self.estacionario:
+            if not self.historial:
+                self._avanzar_estabilizados(dia)
+            self.dia_actual = dia
+            return
+
+        # FASE 1: Verificar contagios ANTES de actualizar ecuaciones
+        contagiados = self.contagio_fase1(dia)
+
+        if not self.recuperacion_iniciada and \
+                np.any(self.infectado & (dia >= self.params.dia_recuperacion)):
+            self.recuperacion_iniciada = True
+            if self.imprimir:
+                print(f"\n{'*'*70}")
+                print(f"🏥 DÍA {dia}: ¡FASE DE RECUPERACIÓN INICIADA!")
+                print(f"{'*'*70}\n")
+
+        # FASE 2: Actualizar ecuaciones diferenciales (un paso vectorizado)
+        activos = self.infectado & ~self.estabilizado
+        activos[contagiados] = False
+        integrados = np.flatnonzero(activos)
+        if integrados.size:
+            self.paso_euler(integrados, dia)
+        if not self.historial:
+            self._avanzar_estabilizados(dia)
+        self.contagio_fase2(dia, integrados)
+
+        if self.conjunto_activo:
+            self._estabilizar(dia)
+        self.dia_actual = dia
+
+    def estado(self, dia):
+        """EstadoDiario de un día ya calculado (copias, no vistas)"""
+        if self.prefijo is not None and dia < self.dia_inicial:
+            valores = [m[:, dia] for m in self.prefijo]
+        else:
+            hoy = self._columna(dia)
+            valores = [m[:, hoy] for m in self._compartimentos()]
+        return EstadoDiario(dia, *(v.copy() for v in valores), self.infectado.copy())
+
+    def iterar(self):
+        """
+        Generador que produce el EstadoDiario de cada día a medida que se
+        calcula, empezando por el último día ya calculado (el 0 en un motor
+        nuevo). El consumidor puede detenerse en cualquier momento; con
+        historial=False la memoria no crece con los días.
+        """
+        yield self.estado(self.dia_actual)
+        siguiente = self.dia_actual + 1
+        dias = itertools.count(siguiente) if self.dias is None else range(siguiente, self.dias)
+        for dia in dias:
+            self.avanzar(dia)
+            yield self.estado(dia)
+
+    def resultado(self):
+        """
+        ResultadoSIRD con vistas a los arrays del motor (sin copiar); en una
+        rama, con el prefijo del padre concatenado
+        """
+        if not self.historial:
+            raise ValueError("El motor se creó con historial=False; use iterar()")
+        return ResultadoSIRD(self.params.paises, *self._tramo(self.dias), self.dia_llegada)
+
+    def ejecutar(self):
+        """Integra todos los días y devuelve un ResultadoSIRD"""
+        if not self.historial:
+            raise ValueError("El motor se creó con historial=False; use iterar()")
+        for dia in range(self.dia_actual + 1, self.dias):
+            if self.estacionario:
+                # _rellenar ya escribió todos los días restantes
+                self.dia_actual = self.dias - 1
+                break
+            self.avanzar(dia)
+        return self.resultado()
+
+    # =============================
+    # PUNTOS DE CONTROL
+    # =============================
+
+    def guardar_punto_control(self, ruta):
+        """
+        Guarda en un .npz comprimido todo lo necesario para continuar la
+        simulación desde dia_actual: compartimentos, países infectados, estado
+        del generador aleatorio, conjunto activo y estado del integrador.
+        """
+        if self.contagio == "eventos":
+            raise ValueError("El planificador de eventos no admite puntos de control")
+
+        # Una rama se guarda con su prefijo: al cargarla es un motor completo
+        S, I, R, D, V = self._tramo(self.dias) if self.historial else self._compartimentos()
+        arrays = {
+            "S": S, "I": I, "R": R, "D": D, "V": V,
+            "infectado": self.infectado, "dia_llegada": self.dia_llegada,
+            "estabilizado": self.estabilizado, "incremento_R": self.incremento_R,
+            "incremento_D": self.incremento_D, "I_estable": self.I_estable,
+            "rng": np.array(self.rng.estado()),
+        }
+        if self.integrador_filas is not None:
+            for clave, valor in self.integrador_filas.exportar().items():
+                arrays[f"integrador_{clave}"] = valor
+
+        np.savez_compressed(
+            ruta, version=np.array(VERSION_PUNTO_CONTROL), paises=np.array(self.params.paises),
+            infeccion_inicial=np.array(self.params.infeccion_inicial),
+            tasa_contagio_base=np.array(self.params.tasa_contagio_base),
+            dia_actual=np.array(self.dia_actual),
+            dias=np.array(-1 if self.dias is None else self.dias), dt=np.array(self.dt),
+            contagio=np.array(self.contagio), integrador=np.array(self.integrador),
+            historial=np.array(self.historial), conjunto_activo=np.array(self.conjunto_activo),
+            recuperacion_iniciada=np.array(self.recuperacion_iniciada),
+            dia_estacionario=np.array(-1 if self.dia_estacionario is None else self.dia_estacionario),
+            **arrays)
+
+    @classmethod
+    def cargar_punto_control(cls, ruta, params, imprimir=False):
+        """
+        Reconstruye un motor desde un punto de control. `params` debe describir
+        los mismos países y constantes que el motor guardado; la simulación
+        sigue exactamente como habría seguido sin interrumpirse.
+        """
+        with np.load(ruta) as datos:
+            if int(datos["version"]) != VERSION_PUNTO_CONTROL:
+                raise ValueError("Versión de punto de control incompatible")
+            if [str(p) for p in datos["paises"]] != params.paises or \
+                    float(datos["infeccion_inicial"]) != params.infeccion_inicial or \
+                    float(datos["tasa_contagio_base"]) != params.tasa_contagio_base:
+                raise ValueError("Los parámetros no coinciden con los del punto de control")
+
+            dias = int(datos["dias"])
+            origen = params.paises[int(np.argmax(datos["dia_llegada"] == 0))]
+            motor = cls(params, origen, dias=None if dias < 0 else dias, dt=float(datos["dt"]),
+                        imprimir=imprimir, contagio=str(datos["contagio"]),
+                        historial=bool(datos["historial"]),
+                        conjunto_activo=bool(datos["conjunto_activo"]),
+                        integrador=str(datos["integrador"]))
+
+            for nombre in ("S", "I", "R", "D", "V", "infectado", "dia_llegada", "estabilizado",
+                           "incremento_R", "incremento_D", "I_estable"):
+                getattr(motor, nombre)[...] = datos[nombre]
+            motor.rng = FlujoAleatorio.desde_estado(str(datos["rng"]))
+            if motor.integrador_filas is not None:
+                motor.integrador_filas.importar({clave[len("integrador_"):]: datos[clave]
+                                                 for clave in datos.files
+                                                 if clave.startswith("integrador_")})
+
+            motor.dia_actual = int(datos["dia_actual"])
+            motor.recuperacion_iniciada = bool(datos["recuperacion_iniciada"])
+            dia_estacionario = int(datos["dia_estacionario"])
+            motor.dia_estacionario = None if dia_estacionario < 0 else dia_estacionario
+        return motor
+
+    # =============================
+    # RAMAS DESDE UN DÍA
+    # =============================
+
+    def bifurcar(self, dia=None, semilla=None, imprimir=False, **cambios):
+        """
+        Rama de la simulación que comparte los días 0..dia con este motor y
+        solo calcula los siguientes, con los parámetros cambiados según
+        ParametrosPaises.con_cambios (por ejemplo beta=0.05 o
+        vac_inicio={"Spain": 150}). Los días compartidos son vistas de los
+        arrays de este motor, que nunca reescribe un día ya calculado.
+
+        Por defecto se bifurca desde dia_actual, el único día posible sin
+        historial. Desde dia_actual y sin semilla, la rama hereda el estado del
+        generador aleatorio (sin cambios, sigue igual que este motor); desde un
+        día anterior, o con semilla, sortea con su propio generador. Ramas con
+        la misma semilla usan los mismos números aleatorios.
+        """
+        dia = self.dia_actual if dia is None else dia
+        if self.contagio == "eventos":
+            raise ValueError("El planificador de eventos no admite ramas")
+        if not self.dia_inicial <= dia <= self.dia_actual:
+            raise ValueError(f"Solo se puede bifurcar desde un día ya calculado "
+                             f"({self.dia_inicial}..{self.dia_actual})")
+        if not self.historial and dia != self.dia_actual:
+            raise ValueError("Sin historial solo se puede bifurcar desde el día actual")
+
+        params = self.params.con_cambios(**cambios) if cambios else self.params
+        origen = self.params.paises[int(np.argmax(self.dia_llegada == 0))]
+        rama = MotorSIRD(params, origen, dias=self.dias, dt=self.dt, semilla=semilla,
+                         imprimir=imprimir, contagio=self.contagio, historial=self.historial,
+                         conjunto_activo=self.conjunto_activo, integrador=self.integrador,
+                         dia_inicial=dia)
+        if semilla is None and dia == self.dia_actual:
+            rama.rng = copy.deepcopy(self.rng)
+        if rama.integrador_filas is not None and dia == self.dia_actual and not cambios:
+            # Sin cambios, las trayectorias en curso siguen siendo válidas
+            rama.integrador_filas.importar(self.integrador_filas.exportar())
+        if self.historial:
+            rama.prefijo = self._tramo(dia)
+
+        hoy = self._columna(dia)
+        for propia, del_padre in zip(rama._compartimentos(), self._compartimentos()):
+            propia[:, rama._columna(dia)] = del_padre[:, hoy]
+        # Los contagios posteriores a la bifurcación aún no han ocurrido en la
+        # rama; el conjunto activo se vuelve a detectar y, en otro caso, las
+        # trayectorias del integrador arrancan del día de la bifurcación
+        rama.dia_llegada[:] = np.where(self.dia_llegada <= dia, self.dia_llegada, -1)
+        rama.infectado[:] = rama.dia_llegada >= 0
+        rama.recuperacion_iniciada = bool(np.any(rama.infectado & (dia >= params.dia_recuperacion)))
+        return rama
+
+def crear_motor(params, pais_inicial, contagio="secuencial", **opciones):
+    """
+    MotorSIRD para el modo de contagio pedido; con contagio="eventos" usa el
+    planificador de eventos (simulacion.eventos)
+    """
+    if contagio == "eventos":
+        from .eventos import MotorEventos
+        return MotorEventos(params, pais_inicial, **opciones)
+    return MotorSIRD(params, pais_inicial, contagio=contagio, **opciones)
+
+def simular_sird(params, pais_inicial, dias=DIAS, dt=DT, semilla=None, imprimir=False,
+                 contagio="secuencial", integrador="euler", configuracion=None):
+    """
+    Atajo: construye el motor y lo ejecuta completo. Si se pasa una
+    ConfiguracionSimulacion, sus campos sustituyen a dias, dt, contagio e
+    integrador.
+    """
+    if configuracion is not None:
+        return configuracion.crear_motor(params, pais_inicial, semilla=semilla,
+                                         imprimir=imprimir).ejecutar()
+    return crear_motor(params, pais_inicial, dias=dias, dt=dt, semilla=semilla, imprimir=imprimir,
+                       contagio=contagio, integrador=integrador).ejecutar()
+
+def bifurcar_sird(motor, dia, intervenciones, semilla=None):
+    """
+    Atajo para comparar intervenciones: una rama de `motor` desde `dia` por
+    cada diccionario de cambios de `intervenciones`, ejecutada hasta el final.
+    Devuelve la lista de ResultadoSIRD.
+    """
+    return [motor.bifurcar(dia, semilla=semilla, **cambios).ejecutar()
+            for cambios in intervenciones]
+
+def iterar_sird(params, pais_inicial, dias=DIAS, dt=DT, semilla=None, imprimir=False,
+                contagio="secuencial", integrador="euler", configuracion=None):
+    """
+    Atajo en streaming: produce un EstadoDiario por día sin guardar el
+    historial. Con dias=None no termina nunca; el consumidor decide cuándo
+    parar. Una ConfiguracionSimulacion sustituye a dias, dt, contagio e integrador.
+    """
+    if configuracion is not None:
+        dias, dt = configuracion.dias, configuracion.dt
+        contagio, integrador = configuracion.contagio, configuracion.integrador
+    motor = crear_motor(params, pais_inicial, dias=dias, dt=dt, semilla=semilla, imprimir=imprimir,
+                        contagio=contagio, historial=False, integrador=integrador)
+    return motor.iterar()
@@ -0,0 +1,120 @@
+import numpy as np
+
+from .aleatorio import FlujoAleatorio, crear_generador
+from .contagio import contagio_disperso_lote
+from .motor import DIAS, DT, paso_euler_dia
+
+# =============================
+# RESUMEN POR PAÍS DE ORIGEN
+# =============================
+
+class ResumenMultiorigen:
+    """
+    Resultado de simular un brote por cada país de origen. La fila k de cada
+    array corresponde a origenes[k]:
+    - dia_pico, pico_infectados: día y valor del máximo de infectados activos
+      en todo el continente
+    - muertes_totales: muertes acumuladas en el continente al final
+    - muertes: muertes acumuladas por país al final, forma (origenes, n_paises)
+    - dia_llegada: día en que el virus llega a cada país (-1 si nunca),
+      forma (origenes, n_paises); es la matriz de riesgo del continente
+    """
+    def __init__(self, origenes, paises, total_I, muertes, dia_llegada):
+        self.origenes = origenes
+        self.paises = paises
+        self.total_I = total_I
+        self.dia_pico = total_I.argmax(axis=1)
+        self.pico_infectados = total_I.max(axis=1)
+        self.muertes = muertes
+        self.muertes_totales = muertes.sum(axis=1)
+        self.dia_llegada = dia_llegada
+
+    def fila(self, origen):
+        """Resumen de un origen como diccionario"""
+        k = self.origenes.index(origen)
+        return {
+            "dia_pico": int(self.dia_pico[k]),
+            "pico_infectados": float(self.pico_infectados[k]),
+            "muertes_totales": float(self.muertes_totales[k]),
+            "dia_llegada": {p: int(d) for p, d in zip(self.paises, self.dia_llegada[k])},
+        }
+
+# =============================
+# SIMULACIÓN EN LOTE
+# =============================
+
+def simular_todos_los_origenes(params, origenes=None, dias=DIAS, dt=DT, semilla=None):
+    """
+    Simula en un solo bucle de Euler un brote independiente por cada país de
+    origen (todos los de params.paises por defecto). El estado tiene forma
+    (escenarios, n_paises): cada paso y cada etapa de contagio son una sola
+    operación vectorizada sobre todos los escenarios.
+
+    Solo se conserva el estado del día actual y los resúmenes, no la historia
+    completa. Los escenarios comparten un generador aleatorio, por lo que cada
+    uno no coincide número a número con una ejecución individual con la misma
+    semilla, pero sigue el mismo modelo (contagio "disperso").
+    """
+    p = params
+    if origenes is None:
+        origenes = list(p.paises)
+    rng = FlujoAleatorio(crear_generador(semilla))
+
+    n_esc = len(origenes)
+    filas = np.arange(n_esc)
+    fila_origen = np.array([p.indice[o] for o in origenes])
+    N = np.broadcast_to(p.poblacion, (n_esc, p.n))
+
+    S = N.copy()
+    I = np.zeros((n_esc, p.n))
+    R = np.zeros((n_esc, p.n))
+    D = np.zeros((n_esc, p.n))
+    V = np.zeros((n_esc, p.n))
+    I[filas, fila_origen] = p.infeccion_inicial
+    S[filas, fila_origen] -= p.infeccion_inicial
+
+    infectado = np.zeros((n_esc, p.n), dtype=bool)
+    infectado[filas, fila_origen] = True
+    dia_llegada = np.full((n_esc, p.n), -1, dtype=int)
+    dia_llegada[filas, fila_origen] = 0
+
+    total_I = np.zeros((n_esc, dias))
+    total_I[:, 0] = I.sum(axis=1)
+
+    for dia in range(1, dias):
+        # FASE 1: contagios con el estado del día anterior
+        esc, dest, _ = contagio_disperso_lote(p.grafo, infectado, I, p.umbral_contagiar,
+                                              p.umbral_ser_contagiado, p.prob_fase1, rng)
+        nuevos = np.zeros_like(infectado)
+        nuevos[esc, dest] = True
+        infectado[esc, dest] = True
+        dia_llegada[esc, dest] = dia
+
+        # FASE 2: un paso de Euler para todas las celdas. Las celdas no
+        # infectadas dan el paso desde el estado inicial de contagio, que es
+        # justo lo que necesitan los países contagiados más abajo.
+        paso = paso_euler_dia(p, S, I, R, D, V, dia, dt)
+        integrados = infectado & ~nuevos
+        S, I, R, D, V = (np.where(integrados, nuevo, actual)
+                         for nuevo, actual in zip(paso, (S, I, R, D, V)))
+        S[nuevos] = N[nuevos] - p.infeccion_inicial
+        I[nuevos] = p.infeccion_inicial
+        R[nuevos] = D[nuevos] = V[nuevos] = 0
+
+        # Contagios con el estado integrado; solo las celdas integradas contagian
+        I_fuente = np.where(integrados, I, 0.0)
+        esc, dest, fuente = contagio_disperso_lote(p.grafo, infectado, I_fuente,
+                                                   p.umbral_contagiar, p.umbral_ser_contagiado,
+                                                   p.prob_fase2, rng)
+        infectado[esc, dest] = True
+        dia_llegada[esc, dest] = dia
+        I[esc, dest] = np.maximum(I[esc, dest], p.infeccion_inicial)
+        S[esc, dest] = np.maximum(0, S[esc, dest] - p.infeccion_inicial)
+        # Contagiados por una fuente de índice menor: se integran desde su estado inicial
+        post = dest > fuente
+        for matriz, valores in zip((S, I, R, D, V), paso):
+            matriz[esc[post], dest[post]] = valores[esc[post], dest[post]]
+
+        total_I[:, dia] = I.sum(axis=1)
+
+    return ResumenMultiorigen(list(origenes), p.paises, total_I, D, dia_llegada)
@@ -0,0 +1,114 @@
+import numpy as np
+
+# =============================
+# TABLA DISPERSA (MÁXIMO / MÍNIMO POR INTERVALO)
+# =============================
+
+class TablaDispersa:
+    """
+    Máximo o mínimo de un intervalo de días [desde, hasta] en O(1), tras un
+    preprocesado O(d log d): el nivel k guarda, para cada día i, el día del
+    extremo de la ventana [i, i + 2^k). Una consulta combina las dos
+    ventanas (solapadas) de mayor potencia de dos que cubren el intervalo.
+
+    `valores` es una serie (dias,) o una matriz (filas, dias) con una serie
+    independiente por fila (por ejemplo, un país por fila). En los empates
+    gana el día posterior, igual que encontrar_maximo_DyV y
+    encontrar_minimo_DyV.
+    """
+    def __init__(self, valores, modo="max"):
+        if modo not in ("max", "min"):
+            raise ValueError(f"Modo desconocido: {modo}")
+        valores = np.asarray(valores)
+        self.serie = valores.ndim == 1
+        self.valores = np.atleast_2d(valores)
+        self.modo = modo
+        self._mejor = np.greater if modo == "max" else np.less
+        self.filas, self.dias = self.valores.shape
+        self._todas = np.arange(self.filas)
+
+        # Los valores de cada nivel solo se guardan mientras se construye el siguiente
+        nivel = np.broadcast_to(np.arange(self.dias, dtype=np.int32), self.valores.shape)
+        extremos = self.valores
+        self.niveles = [nivel]
+        ancho = 1
+        while 2 * ancho <= self.dias:
+            largo = self.dias - 2 * ancho + 1
+            # Ventanas disjuntas: la izquierda solo gana si es estrictamente mejor
+            v_izq, v_der = extremos[:, :largo], extremos[:, ancho:ancho + largo]
+            gana_izq = self._mejor(v_izq, v_der)
+            nivel = np.where(gana_izq, nivel[:, :largo], nivel[:, ancho:ancho + largo])
+            extremos = np.where(gana_izq, v_izq, v_der)
+            self.niveles.append(nivel)
+            ancho *= 2
+
+    def _elegir(self, filas, izq, der):
+        """Día del extremo entre dos candidatos; en empate, el posterior"""
+        v_izq = self.valores[filas, izq]
+        v_der = self.valores[filas, der]
+        gana_izq = self._mejor(v_izq, v_der) | ((v_izq == v_der) & (izq > der))
+        return np.where(gana_izq, izq, der)
+
+    def consultar(self, desde, hasta, fila=None):
+        """
+        (valor, día) del extremo entre los días desde y hasta, ambos incluidos.
+        Con una matriz y fila=None responde todas las filas a la vez (vectores).
+        """
+        desde, hasta = int(desde), int(hasta)
+        if not 0 <= desde <= hasta < self.dias:
+            raise ValueError(f"Intervalo de días fuera de rango: [{desde}, {hasta}]")
+        if self.serie:
+            fila = 0
+        k = (hasta - desde + 1).bit_length() - 1
+        nivel = self.niveles[k]
+        filas = self._todas if fila is None else fila
+        dia = self._elegir(filas, nivel[filas, desde], nivel[filas, hasta - (1 << k) + 1])
+        if fila is None:
+            return self.valores[filas, dia], dia
+        return self.valores[fila, dia], int(dia)
+
+# =============================
+# ÍNDICE SOBRE UN RESULTADO
+# =============================
+
+class IndiceRangos:
+    """
+    Consultas por intervalo de días sobre un ResultadoSIRD terminado: tablas
+    dispersas de máximo y mínimo por país y del total continental de cada
+    compartimento. Cada tabla se construye la primera vez que se consulta
+    y después responde en O(1), sin volver a recorrer las series.
+    """
+    def __init__(self, resultado):
+        self.resultado = resultado
+        self.indice = {pais: i for i, pais in enumerate(resultado.paises)}
+        self._tablas = {}
+
+    def _tabla(self, compartimento, modo, total=False):
+        clave = (compartimento, modo, total)
+        if clave not in self._tablas:
+            if total:
+                valores = self.resultado.totales(compartimento)
+            else:
+                valores = getattr(self.resultado, compartimento)
+            self._tablas[clave] = TablaDispersa(valores, modo)
+        return self._tablas[clave]
+
+    def maximo(self, compartimento, pais, desde, hasta):
+        """(valor, día) del máximo de un país entre los días desde y hasta (incluidos)"""
+        return self._tabla(compartimento, "max").consultar(desde, hasta, self.indice[pais])
+
+    def minimo(self, compartimento, pais, desde, hasta):
+        """(valor, día) del mínimo de un país entre los días desde y hasta (incluidos)"""
+        return self._tabla(compartimento, "min").consultar(desde, hasta, self.indice[pais])
+
+    def maximos(self, compartimento, desde, hasta):
+        """(valores, días) del máximo de cada país en el intervalo, en el orden de paises"""
+        return self._tabla(compartimento, "max").consultar(desde, hasta)
+
+    def minimos(self, compartimento, desde, hasta):
+        """(valores, días) del mínimo de cada país en el intervalo, en el orden de paises"""
+        return self._tabla(compartimento, "min").consultar(desde, hasta)
+
+    def pico(self, compartimento, desde, hasta):
+        """(valor, día) del máximo del total continental en el intervalo"""
+        return self._tabla(compartimento, "max", total=True).consultar(desde, hasta)
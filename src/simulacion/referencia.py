@@ -0,0 +1,207 @@
+import numpy as np
+
+from .datos import config_paises, paises, vecinos
+from .motor import DIAS as dias, DT as dt, INFECCION_INICIAL, TASA_CONTAGIO_BASE
+
+# =============================
+# IMPLEMENTACIÓN DE REFERENCIA (FUERZA BRUTA)
+# =============================
+
+def imprimir_encabezado_simulacion(pais_inicial):
+    """Muestra en consola el país inicial y los umbrales del modelo"""
+    print(f"\n{'='*70}")
+    print(f"INICIANDO SIMULACIÓN - MODELO SIRD CON UMBRALES PERSONALIZADOS")
+    print(f"País inicial: {pais_inicial}")
+    print(f"Población: {config_paises[pais_inicial]['poblacion']:,}")
+    print(f"Sistema: {config_paises[pais_inicial]['sistema'].upper()}")
+    print(f"Umbral para contagiar: {config_paises[pais_inicial]['umbral_contagiar']:,}")
+    print(f"Umbral de resistencia: {config_paises[pais_inicial]['umbral_ser_contagiado']:,}")
+    print(f"")
+    print(f"UMBRALES POR SISTEMA:")
+    print(f"🟢 Desarrollado: contagia a 15k | se infecta a 40k")
+    print(f"🟡 Normal:        contagia a 10k | se infecta a 20k")
+    print(f"🔴 Precario:      contagia a  5k | se infecta a 10k")
+    print(f"{'='*70}\n")
+
+def iniciar_simulacion_fuerza_bruta(pais_inicial):
+    """
+    Versión original del modelo SIRD: recorre país por país y día por día.
+    Se conserva como referencia para validar el motor vectorizado.
+    """
+    
+    # Inicializar compartimentos
+    datos_S = {pais: np.zeros(dias) for pais in paises}
+    datos_I = {pais: np.zeros(dias) for pais in paises}
+    datos_R = {pais: np.zeros(dias) for pais in paises}
+    datos_D = {pais: np.zeros(dias) for pais in paises}
+    datos_V = {pais: np.zeros(dias) for pais in paises}
+
+    imprimir_encabezado_simulacion(pais_inicial)
+
+    # Condiciones iniciales
+    for pais in paises:
+        config = config_paises[pais]
+        N = config["poblacion"]
+        datos_I[pais] = [0 for _ in range(dias)]
+        datos_S[pais] = [N for _ in range(dias)]
+        if pais == pais_inicial:
+            datos_I[pais][0] = INFECCION_INICIAL
+            print(datos_I[pais])
+            datos_S[pais][0] = N - INFECCION_INICIAL
+            print(datos_S[pais])
+        
+        datos_R[pais] = [0 for _ in range(dias)]
+        datos_D[pais] = [0 for _ in range(dias)]
+        datos_V[pais] = [0 for _ in range(dias)]
+
+    np.random.seed()
+    paises_infectados = {pais_inicial}
+    
+    recuperacion_iniciada = False
+
+    # Integración temporal (Método de Euler)
+    for dia in range(1, dias):
+        # FASE 1: Verificar contagios ANTES de actualizar ecuaciones
+        nuevos_contagios = []
+        
+        for pais in paises:
+            if pais not in paises_infectados:
+                continue
+                
+            config = config_paises[pais]
+            
+            # Contagio a países vecinos
+            if datos_I[pais][dia - 1] >= config["umbral_contagiar"] and pais in vecinos:
+                for vecino in vecinos[pais]:
+                    if vecino in paises and vecino not in paises_infectados:
+                        config_vecino = config_paises[vecino]
+                        
+                        if datos_I[pais][dia - 1] >= config_vecino["umbral_ser_contagiado"]:
+                            prob_contagio = TASA_CONTAGIO_BASE
+                            
+                            if config_vecino["sistema"] == "desarrollado":
+                                prob_contagio *= 0.4
+                            elif config_vecino["sistema"] == "precario":
+                                prob_contagio *= 2.0
+                            
+                            if np.random.random() < prob_contagio:
+                                nuevos_contagios.append((pais, vecino))
+                                print(pais, vecino)
+        
+        # Aplicar contagios
+        print(nuevos_contagios)
+        for pais_origen, vecino in nuevos_contagios:
+            print(vecino)
+            if vecino not in paises_infectados:
+                paises_infectados.add(vecino)
+                config_vecino = config_paises[vecino]
+                N_vecino = config_vecino["poblacion"]
+                datos_I[vecino][dia] = INFECCION_INICIAL
+                datos_S[vecino][dia] = N_vecino - INFECCION_INICIAL
+                datos_R[vecino][dia] = 0
+                datos_D[vecino][dia] = 0
+                datos_V[vecino][dia] = 0
+                
+                print(f"Día {dia}: {pais_origen} ({int(datos_I[pais_origen][dia-1]):,} inf.) → {vecino} "
+                    f"[{config_paises[vecino]['sistema']}] (inicializado con {INFECCION_INICIAL} inf.)")
+        
+        # Verificar recuperación
+        if not recuperacion_iniciada:
+            for pais in paises:
+                if pais in paises_infectados:
+                    config = config_paises[pais]
+                    if dia >= config["dia_recuperacion"]:
+                        print(f"\n{'*'*70}")
+                        print(f"🏥 DÍA {dia}: ¡FASE DE RECUPERACIÓN INICIADA!")
+                        print(f"Los sistemas de salud comienzan a recuperar pacientes")
+                        print(f"{'*'*70}\n")
+                        recuperacion_iniciada = True
+                        break
+        
+        # FASE 2: Actualizar ecuaciones diferenciales
+        for pais in paises:
+            if pais in [vecino for _, vecino in nuevos_contagios]:
+                continue
+            
+            if pais not in paises_infectados:
+                continue
+            config = config_paises[pais]
+            N = config["poblacion"]
+            
+            # Estado actual
+            S = max(0, min(datos_S[pais][dia - 1], N-INFECCION_INICIAL))
+            I = max(INFECCION_INICIAL, datos_I[pais][dia - 1])
+            R = max(0, datos_R[pais][dia - 1])
+            D = max(0, datos_D[pais][dia - 1])
+            V_acum = datos_V[pais][dia - 1]
+
+            # Parámetros del modelo
+            beta = config["beta"]
+            mu = config["mu"]
+            
+            # Tasa de recuperación variable
+            if dia < config["dia_recuperacion"]:
+                gamma = 0.0
+            else:
+                gamma = config["gamma_post"]
+
+            # Vacunación
+            vac_inicio = config["vac_inicio"]
+            vac_rate = config["vac_rate"]
+            
+            if dia >= vac_inicio and S > 0:
+                nu = min(vac_rate * N, S)
+            else:
+                nu = 0
+
+            # Ecuaciones diferenciales del modelo SIRD
+            dS = -(beta * S * I / N) - nu
+            dI = (beta * S * I / N) - gamma * I - mu * I
+            dR = gamma * I + nu
+            dD = mu * I
+
+            # Actualizar estados (Método de Euler)
+            if dia%10 == 0:
+                print(f'Pais: {pais}, dia: {dia}, beta: {beta}, S: {S}, I: {I}, N: {N}')
+            datos_S[pais][dia] = max(0, S + dS * dt)
+            datos_I[pais][dia] = max(0, I + dI * dt)
+            datos_R[pais][dia] = max(0, R + dR * dt)
+            datos_D[pais][dia] = max(0, D + dD * dt)
+            datos_V[pais][dia] = V_acum + nu
+
+            # Contagio a países vecinos
+            if pais in paises_infectados and datos_I[pais][dia] >= config["umbral_contagiar"]:
+                if pais in vecinos:
+                    for vecino in vecinos[pais]:
+                        if vecino in paises and vecino not in paises_infectados:
+                            config_vecino = config_paises[vecino]
+                            
+                            if datos_I[pais][dia] >= config_vecino["umbral_ser_contagiado"]:
+                                prob_contagio = TASA_CONTAGIO_BASE
+                                
+                                if config_vecino["sistema"] == "desarrollado":
+                                    prob_contagio *= 0.5
+                                elif config_vecino["sistema"] == "precario":
+                                    prob_contagio *= 2.0
+                                
+                                if np.random.random() < prob_contagio:
+                                    paises_infectados.add(vecino)
+                                    S_vecino = datos_S[vecino][dia - 1] if dia > 0 else config_paises[vecino]["poblacion"]
+                                    casos_importados = min(INFECCION_INICIAL, S_vecino)
+                                    
+                                    if casos_importados < INFECCION_INICIAL:
+                                        casos_importados = INFECCION_INICIAL
+                                    
+                                    datos_I[vecino][dia] = max(datos_I[vecino][dia], casos_importados)
+                                    datos_S[vecino][dia] = max(0, datos_S[vecino][dia] - casos_importados)
+                                    
+                                    print(f"Día {dia}: {pais} ({int(datos_I[pais][dia]):,} inf.) → {vecino} "
+                                        f"[{config_vecino['sistema']}] ({int(casos_importados)} inf. iniciales)")
+
+    print(f"\n{'='*70}")
+    print(f"SIMULACIÓN COMPLETADA")
+    print(f"Total de días simulados: {dias}")
+    print(f"Países infectados: {len(paises_infectados)}/{len(paises)}")
+    print(f"{'='*70}\n")
+    
+    return datos_I, datos_D, datos_R, datos_S, datos_V
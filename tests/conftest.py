@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Los paquetes viven en src/ (simulacion, algoritmos, interfaz) y se importan
+# sin instalar, igual que al ejecutar proyecto_final_main.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
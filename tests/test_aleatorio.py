@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from simulacion import FlujoAleatorio, crear_generador, semillas_replicas
+
+# Tamaños mezclados: sorteos sueltos, vectores, matrices y bloques más
+# grandes que el búfer
+TAMANOS = [None, 3, None, None, 300, (2, 4), None, 0, 1, 700] + [None] * 600 + [5]
+
+# RandomState del modelo original y Generator de una réplica
+SEMILLAS = [7, semillas_replicas(7, 2)[1]]
+
+def uno_a_uno(generador, n):
+    if isinstance(generador, np.random.Generator):
+        return [generador.random() for _ in range(n)]
+    return [generador.random_sample() for _ in range(n)]
+
+@pytest.mark.parametrize("bloque", [1, 16, 256])
+@pytest.mark.parametrize("semilla", SEMILLAS)
+def test_bloques_igual_que_uno_a_uno(bloque, semilla):
+    flujo = FlujoAleatorio(crear_generador(semilla), bloque)
+    servidos = []
+    for size in TAMANOS:
+        valor = flujo.random_sample(size)
+        if size is None:
+            assert isinstance(valor, float)
+            servidos.append(valor)
+        else:
+            assert valor.shape == np.empty(size).shape
+            servidos.extend(valor.ravel().tolist())
+    esperado = uno_a_uno(crear_generador(semilla), len(servidos))
+    assert servidos == esperado
+
+@pytest.mark.parametrize("semilla", SEMILLAS)
+def test_estado_se_recupera(semilla):
+    flujo = FlujoAleatorio(crear_generador(semilla), 64)
+    for size in TAMANOS[:20]:
+        flujo.random_sample(size)
+    copia = FlujoAleatorio.desde_estado(flujo.estado())
+    for size in TAMANOS:
+        np.testing.assert_array_equal(copia.random_sample(size), flujo.random_sample(size))
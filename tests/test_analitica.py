@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from simulacion import analitica
+from algoritmos.ordenamiento import OrdenadorMezcla, RankingIncremental, argsort_estable
+
+# Las funciones de divide y vencerás originales viven en el script de la interfaz
+dyv = pytest.importorskip("proyecto_final_main")
+
+def series(semilla, casos=200):
+    """Vectores y matrices pequeños con muchos empates"""
+    rng = np.random.default_rng(semilla)
+    for _ in range(casos):
+        n = int(rng.integers(1, 40))
+        yield rng.integers(0, 4, n).astype(float), rng.integers(0, 3, (int(rng.integers(1, 8)), n)).astype(float)
+
+def test_extremo_igual_que_dyv():
+    for vector, _ in series(1):
+        ultimo = len(vector) - 1
+        assert analitica.extremo(vector) == dyv.encontrar_maximo_DyV(list(vector), 0, ultimo)
+        assert analitica.extremo(vector, "min") == dyv.encontrar_minimo_DyV(list(vector), 0, ultimo)
+
+def test_extremos_por_pais_igual_que_dyv():
+    for _, matriz in series(2):
+        for modo, referencia in (("max", dyv.encontrar_maximo_DyV), ("min", dyv.encontrar_minimo_DyV)):
+            valores, dias = analitica.extremos_por_pais(matriz, modo)
+            for fila in range(matriz.shape[0]):
+                esperado = referencia(list(matriz[fila]), 0, matriz.shape[1] - 1)
+                assert (valores[fila], dias[fila]) == esperado
+
+def test_dia_pico_igual_que_dyv():
+    for _, matriz in series(3):
+        totales = [sum(matriz[:, dia]) for dia in range(matriz.shape[1])]
+        assert analitica.dia_pico(matriz) == dyv.encontrar_maximo_DyV(totales, 0, len(totales) - 1)
+
+def test_acumulado_y_nuevos_por_dia():
+    for _, matriz in series(4, casos=50):
+        np.testing.assert_allclose(analitica.nuevos_por_dia(analitica.acumulado(matriz)), matriz)
+
+def test_top_k_por_dia_igual_que_sorted():
+    for _, matriz in series(5):
+        for k in range(1, matriz.shape[0] + 1):
+            valores, indices = analitica.top_k_por_dia(matriz, k)
+            for dia in range(matriz.shape[1]):
+                columna = list(matriz[:, dia])
+                orden = sorted(range(len(columna)), key=lambda i: -columna[i])[:k]
+                assert indices[dia].tolist() == orden
+                assert valores[dia].tolist() == [columna[i] for i in orden]
+                assert analitica.k_esimo_por_dia(matriz, k - 1)[dia] == columna[orden[-1]]
+
+def test_top_k_por_dia_igual_que_np_sort():
+    rng = np.random.default_rng(7)
+    for forma in ((3, 5), (1, 4), (10, 3), (40, 30)):
+        matriz = rng.integers(0, 5, forma).astype(float)
+        for k in range(1, forma[0] + 1):
+            valores, _ = analitica.top_k_por_dia(matriz, k)
+            np.testing.assert_array_equal(valores, np.sort(matriz, axis=0)[::-1][:k].T)
+            np.testing.assert_array_equal(analitica.k_esimo_por_dia(matriz, k - 1),
+                                          np.sort(matriz, axis=0)[::-1][k - 1])
+
+@pytest.mark.parametrize("k", [0, 4, -1])
+def test_top_k_por_dia_fuera_de_rango(k):
+    matriz = np.zeros((3, 5))
+    with pytest.raises(ValueError):
+        analitica.top_k_por_dia(matriz, k)
+    with pytest.raises(ValueError):
+        analitica.k_esimo_por_dia(matriz, k if k else 3)
+
+def test_argsort_estable_igual_que_merge_sort_dyv_salvo_empates():
+    for vector, _ in series(6):
+        valores, _ = dyv.merge_sort_DyV(list(vector), list(range(len(vector))), descendente=True)
+        orden = argsort_estable(vector)
+        assert vector[orden].tolist() == valores
+        assert orden.tolist() == sorted(range(len(vector)), key=lambda i: -vector[i])
+
+@pytest.mark.parametrize("descendente", [True, False])
+def test_ordenador_mezcla_estable_igual_que_argsort_estable(descendente):
+    ordenador = OrdenadorMezcla()
+    for vector, _ in series(7):
+        valores, indices = ordenador.ordenar(list(vector), descendente=descendente)
+        # Estable: entre iguales, el orden de entrada
+        clave = (lambda i: (-vector[i], i)) if descendente else (lambda i: (vector[i], i))
+        assert indices == sorted(range(len(vector)), key=clave)
+        assert indices == argsort_estable(vector, descendente).tolist()
+        referencia, _ = dyv.merge_sort_DyV(list(vector), list(range(len(vector))), descendente)
+        assert valores == referencia
+
+def test_ranking_con_ordenador_mezcla():
+    con_mezcla = RankingIncremental(ordenador=OrdenadorMezcla())
+    con_numpy = RankingIncremental()
+    for vector, _ in series(8, casos=50):
+        assert con_mezcla.reiniciar(vector) == con_numpy.reiniciar(vector)
+        assert con_mezcla.actualizar(vector[::-1]) == con_numpy.actualizar(vector[::-1])
@@ -0,0 +1,39 @@
+import numpy as np
+
+from simulacion import (AlmacenMapeado, ConfiguracionSimulacion, MemoriaSimulaciones,
+                        barrido_parametros, config_paises, paises, rejilla_parametros,
+                        simular_sird, vecinos)
+from simulacion.barrido import METRICAS
+
+CONFIGURACION = ConfiguracionSimulacion(dias=150, contagio="disperso")
+ORIGENES = ["Italy", "Spain"]
+
+def test_cache_solo_calcula_las_celdas_nuevas(tmp_path):
+    puntos = rejilla_parametros({"beta": [0.06, 0.08]})
+    primero = barrido_parametros(puntos, ORIGENES, [0, 1], CONFIGURACION,
+                                 cache=str(tmp_path), procesos=1)
+    assert primero.calculadas == 8
+
+    # Un punto más: solo se simulan sus cuatro celdas
+    puntos = rejilla_parametros({"beta": [0.06, 0.08, 0.10]})
+    segundo = barrido_parametros(puntos, ORIGENES, [0, 1], CONFIGURACION,
+                                 cache=str(tmp_path), procesos=1)
+    assert segundo.calculadas == 4
+    assert len(AlmacenMapeado(str(tmp_path))) == 12
+
+    sin_cache = barrido_parametros(puntos, ORIGENES, [0, 1], CONFIGURACION, procesos=1)
+    for nombre in METRICAS:
+        np.testing.assert_array_equal(getattr(segundo, nombre), getattr(sin_cache, nombre))
+    np.testing.assert_array_equal(segundo.resultado(0, 1, 1).I, primero.resultado(0, 1, 1).I)
+
+def test_cache_compartida_con_la_memoria(tmp_path):
+    params = CONFIGURACION.parametros(paises, config_paises, vecinos)
+    memoria = MemoriaSimulaciones(directorio=str(tmp_path))
+    memoria.simular(params, "Italy", 3, CONFIGURACION)
+
+    barrido = barrido_parametros([{}], ["Italy"], [3], CONFIGURACION, cache=str(tmp_path),
+                                 procesos=1)
+    assert barrido.calculadas == 0
+    esperado = simular_sird(params, "Italy", semilla=3, configuracion=CONFIGURACION)
+    np.testing.assert_array_equal(barrido.resultado(0).I, esperado.I)
+    assert barrido.muertes[0, 0, 0] == esperado.D[:, -1].sum()
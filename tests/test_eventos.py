@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from simulacion import ParametrosPaises, config_paises, crear_motor, paises, simular_sird, vecinos
+from simulacion.eventos import MotorEventos
+
+# Con probabilidad 1 el primer ensayo apto siempre contagia: el planificador
+# y el modelo secuencial deben dar exactamente las mismas trayectorias
+SEGUROS = ParametrosPaises(paises, config_paises, vecinos).con_cambios(prob_fase1=1.0,
+                                                                       prob_fase2=1.0)
+
+@pytest.mark.parametrize("bloque", [1, 2, 3, 7, 10, 64, 300])
+@pytest.mark.parametrize("pais_inicial", ["Italy", "Poland"])
+def test_probabilidad_uno_igual_que_secuencial(pais_inicial, bloque):
+    secuencial = simular_sird(SEGUROS, pais_inicial, semilla=0)
+    eventos = MotorEventos(SEGUROS, pais_inicial, semilla=0, bloque=bloque).ejecutar()
+    for c in ("S", "I", "R", "D", "V"):
+        np.testing.assert_array_equal(getattr(eventos, c), getattr(secuencial, c), err_msg=c)
+    np.testing.assert_array_equal(eventos.dia_llegada, secuencial.dia_llegada)
+
+def test_iterar_usa_la_cola_de_eventos():
+    completo = simular_sird(SEGUROS, "Spain", semilla=2, contagio="eventos")
+    motor = crear_motor(SEGUROS, "Spain", semilla=2, contagio="eventos")
+    for estado in motor.iterar():
+        np.testing.assert_array_equal(estado.I, completo.I[:, estado.dia])
+
+def test_sin_historial_no_se_admite():
+    with pytest.raises(ValueError):
+        crear_motor(SEGUROS, "Spain", contagio="eventos", historial=False)
@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+
+from simulacion import (AlmacenMapeado, ConfiguracionSimulacion, MemoriaSimulaciones,
+                        clave_simulacion, config_paises, paises, simular_sird, vecinos)
+
+CONFIGURACION = ConfiguracionSimulacion(dias=120)
+PARAMS = CONFIGURACION.parametros(paises, config_paises, vecinos)
+
+def test_simular_repetido_sale_de_la_memoria():
+    memoria = MemoriaSimulaciones()
+    primero = memoria.simular(PARAMS, "Italy", 2, CONFIGURACION)
+    segundo = memoria.simular(PARAMS, "Italy", 2, CONFIGURACION)
+    assert segundo is primero
+    assert (memoria.aciertos, memoria.fallos) == (1, 1)
+    esperado = simular_sird(PARAMS, "Italy", semilla=2, configuracion=CONFIGURACION)
+    np.testing.assert_array_equal(primero.I, esperado.I)
+
+def test_sin_semilla_no_se_guarda():
+    memoria = MemoriaSimulaciones()
+    assert clave_simulacion(PARAMS, "Italy", None, CONFIGURACION) is None
+    memoria.simular(PARAMS, "Italy", None, CONFIGURACION)
+    assert len(memoria) == 0
+
+def test_acierto_en_disco(tmp_path):
+    memoria = MemoriaSimulaciones(directorio=str(tmp_path))
+    original = memoria.simular(PARAMS, "Spain", 5, CONFIGURACION)
+
+    # Una memoria nueva (otra sesión) lee el resultado del disco
+    otra = MemoriaSimulaciones(directorio=str(tmp_path))
+    leido = otra.simular(PARAMS, "Spain", 5, CONFIGURACION)
+    assert (otra.aciertos_disco, otra.fallos) == (1, 0)
+    for c in ("S", "I", "R", "D", "V"):
+        np.testing.assert_array_equal(getattr(leido, c), getattr(original, c))
+    np.testing.assert_array_equal(leido.dia_llegada, original.dia_llegada)
+
+def test_almacen_descarta_el_menos_usado(tmp_path):
+    almacen = AlmacenMapeado(str(tmp_path), capacidad=2)
+    resultado = simular_sird(PARAMS, "Italy", semilla=1, configuracion=CONFIGURACION)
+    claves = [clave_simulacion(PARAMS, "Italy", semilla, CONFIGURACION) for semilla in range(3)]
+    almacen.guardar(claves[0], resultado)
+    almacen.guardar(claves[1], resultado)
+    # Fechas antiguas y distintas; cargar la primera la deja como la más reciente
+    for segundos, clave in enumerate(claves[:2], start=1):
+        os.utime(almacen._ruta(clave, ".json"), (segundos, segundos))
+    almacen.cargar(claves[0])
+    almacen.guardar(claves[2], resultado)
+    assert len(almacen) == 2
+    assert claves[0] in almacen and claves[1] not in almacen and claves[2] in almacen
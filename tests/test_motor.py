@@ -0,0 +1,115 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from simulacion import (MotorSIRD, ParametrosPaises, config_paises, iterar_sird, paises,
+                        simular_sird, vecinos)
+
+PARAMS = ParametrosPaises(paises, config_paises, vecinos)
+
+COMPARTIMENTOS = ("S", "I", "R", "D", "V")
+
+def iguales(a, b):
+    """Los cinco compartimentos de dos ResultadoSIRD son idénticos bit a bit"""
+    return all(np.array_equal(getattr(a, c), getattr(b, c)) for c in COMPARTIMENTOS)
+
+# =============================
+# STREAMING
+# =============================
+
+@pytest.mark.parametrize("contagio", ["secuencial", "disperso"])
+def test_streaming_igual_que_historial(contagio):
+    completo = simular_sird(PARAMS, "Italy", semilla=3, contagio=contagio)
+    dias = 0
+    for estado in iterar_sird(PARAMS, "Italy", semilla=3, contagio=contagio):
+        for c in COMPARTIMENTOS:
+            np.testing.assert_array_equal(getattr(estado, c), getattr(completo, c)[:, estado.dia])
+        dias += 1
+    assert dias == completo.I.shape[1]
+
+def test_streaming_sin_horizonte():
+    completo = simular_sird(PARAMS, "Spain", semilla=5, dias=400)
+    estados = itertools.islice(iterar_sird(PARAMS, "Spain", semilla=5, dias=None), 400)
+    for estado in estados:
+        np.testing.assert_array_equal(estado.I, completo.I[:, estado.dia])
+
+# =============================
+# CONJUNTO ACTIVO
+# =============================
+
+@pytest.mark.parametrize("dias", [300, 1200])
+@pytest.mark.parametrize("contagio", ["secuencial", "disperso"])
+def test_conjunto_activo_igual_que_integrar_todo(contagio, dias):
+    for semilla in (1, 4):
+        activo = MotorSIRD(PARAMS, "Italy", dias=dias, semilla=semilla, contagio=contagio)
+        todo = MotorSIRD(PARAMS, "Italy", dias=dias, semilla=semilla, contagio=contagio,
+                         conjunto_activo=False)
+        assert iguales(activo.ejecutar(), todo.ejecutar())
+        np.testing.assert_array_equal(activo.dia_llegada, todo.dia_llegada)
+
+def test_parada_estacionaria_marca_todos_los_dias_calculados():
+    motor = MotorSIRD(PARAMS, "Italy", dias=2000, semilla=4)
+    motor.ejecutar()
+    assert motor.estacionario and motor.dia_estacionario < 1999
+    assert motor.dia_actual == 1999
+
+# =============================
+# PUNTOS DE CONTROL
+# =============================
+
+@pytest.mark.parametrize("contagio,integrador",
+                         [("secuencial", "euler"), ("disperso", "euler"), ("secuencial", "rk45")])
+@pytest.mark.parametrize("corte", [0, 40, 150])
+def test_reanudar_igual_que_sin_interrumpir(tmp_path, contagio, integrador, corte):
+    seguido = MotorSIRD(PARAMS, "Italy", semilla=6, contagio=contagio, integrador=integrador)
+    esperado = seguido.ejecutar()
+
+    motor = MotorSIRD(PARAMS, "Italy", semilla=6, contagio=contagio, integrador=integrador)
+    for dia in range(1, corte + 1):
+        motor.avanzar(dia)
+    ruta = tmp_path / "punto.npz"
+    motor.guardar_punto_control(ruta)
+    reanudado = MotorSIRD.cargar_punto_control(ruta, PARAMS)
+    assert reanudado.dia_actual == corte
+    assert iguales(reanudado.ejecutar(), esperado)
+    np.testing.assert_array_equal(reanudado.dia_llegada, seguido.dia_llegada)
+
+def test_punto_control_con_otros_paises(tmp_path):
+    motor = MotorSIRD(PARAMS, "Italy", semilla=6)
+    ruta = tmp_path / "punto.npz"
+    motor.guardar_punto_control(ruta)
+    otros = ParametrosPaises(paises[:-1], config_paises, vecinos)
+    with pytest.raises(ValueError):
+        MotorSIRD.cargar_punto_control(ruta, otros)
+
+# =============================
+# RAMAS DESDE UN DÍA
+# =============================
+
+@pytest.mark.parametrize("contagio", ["secuencial", "disperso"])
+def test_rama_sin_cambios_igual_que_el_padre(contagio):
+    esperado = simular_sird(PARAMS, "Italy", semilla=8, contagio=contagio)
+    motor = MotorSIRD(PARAMS, "Italy", semilla=8, contagio=contagio)
+    for dia in range(1, 60):
+        motor.avanzar(dia)
+    rama = motor.bifurcar()
+    assert iguales(rama.ejecutar(), esperado)
+    assert iguales(motor.ejecutar(), esperado)
+
+def test_rama_comparte_el_prefijo():
+    motor = MotorSIRD(PARAMS, "Italy", semilla=8)
+    padre = motor.ejecutar()
+    rama = motor.bifurcar(80, semilla=1, beta=0.05).ejecutar()
+    for c in COMPARTIMENTOS:
+        np.testing.assert_array_equal(getattr(rama, c)[:, :81], getattr(padre, c)[:, :81])
+    assert not np.array_equal(rama.I, padre.I)
+
+def test_rama_despues_del_dia_estacionario():
+    motor = MotorSIRD(PARAMS, "Italy", dias=2000, semilla=4)
+    padre = motor.ejecutar()
+    assert motor.dia_estacionario < 1500
+    rama = motor.bifurcar(1500)
+    assert iguales(rama.ejecutar(), padre)
+    with pytest.raises(ValueError):
+        motor.bifurcar(2000)
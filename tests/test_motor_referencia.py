@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from simulacion import ParametrosPaises, config_paises, paises, simular_sird, vecinos
+from simulacion import referencia
+
+PARAMS = ParametrosPaises(paises, config_paises, vecinos)
+
+def legado(monkeypatch, pais_inicial, semilla):
+    """Modelo original con el generador global sembrado con `semilla`"""
+    sembrar = np.random.seed
+    monkeypatch.setattr(np.random, "seed", lambda *args: sembrar(semilla))
+    return referencia.iniciar_simulacion_fuerza_bruta(pais_inicial)
+
+@pytest.mark.parametrize("semilla", [0, 7, 123])
+@pytest.mark.parametrize("pais_inicial", ["Italy", "Spain", "Germany", "Poland"])
+def test_motor_secuencial_reproduce_modelo_original(monkeypatch, pais_inicial, semilla):
+    resultado = simular_sird(PARAMS, pais_inicial, semilla=semilla, contagio="secuencial")
+    datos_I, datos_D, datos_R, datos_S, datos_V = legado(monkeypatch, pais_inicial, semilla)
+    for datos, matriz in ((datos_S, resultado.S), (datos_I, resultado.I), (datos_R, resultado.R),
+                          (datos_D, resultado.D), (datos_V, resultado.V)):
+        for i, pais in enumerate(resultado.paises):
+            np.testing.assert_array_equal(np.asarray(datos[pais], dtype=float), matriz[i],
+                                          err_msg=pais)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from simulacion.rangos import TablaDispersa
+
+def fuerza_bruta(serie, desde, hasta, modo):
+    """(valor, día) del extremo del intervalo; en empate, el día posterior"""
+    tramo = serie[desde:hasta + 1]
+    objetivo = tramo.max() if modo == "max" else tramo.min()
+    dia = desde + int(np.flatnonzero(tramo == objetivo)[-1])
+    return serie[dia], dia
+
+@pytest.mark.parametrize("modo", ["max", "min"])
+def test_serie_igual_que_fuerza_bruta(modo):
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        serie = rng.integers(0, 5, int(rng.integers(1, 60))).astype(float)
+        tabla = TablaDispersa(serie, modo)
+        for _ in range(20):
+            desde, hasta = sorted(rng.integers(0, serie.size, 2))
+            valor, dia = tabla.consultar(desde, hasta)
+            assert (valor, dia) == fuerza_bruta(serie, desde, hasta, modo)
+
+@pytest.mark.parametrize("modo", ["max", "min"])
+def test_matriz_igual_que_fuerza_bruta(modo):
+    rng = np.random.default_rng(1)
+    for _ in range(30):
+        matriz = rng.integers(0, 4, (int(rng.integers(1, 6)), int(rng.integers(1, 40)))).astype(float)
+        tabla = TablaDispersa(matriz, modo)
+        for _ in range(10):
+            desde, hasta = sorted(rng.integers(0, matriz.shape[1], 2))
+            valores, dias = tabla.consultar(desde, hasta)
+            for fila in range(matriz.shape[0]):
+                esperado = fuerza_bruta(matriz[fila], desde, hasta, modo)
+                assert (valores[fila], dias[fila]) == esperado
+                assert tabla.consultar(desde, hasta, fila) == esperado
+
+def test_intervalo_fuera_de_rango():
+    tabla = TablaDispersa(np.arange(5.0))
+    with pytest.raises(ValueError):
+        tabla.consultar(3, 5)
+    with pytest.raises(ValueError):
+        tabla.consultar(4, 3)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from algoritmos.seleccion import k_esimo, seleccionar_DyV, top_k_heap
+
+def vectores(semilla, casos=300):
+    rng = np.random.default_rng(semilla)
+    for caso in range(casos):
+        n = int(rng.integers(1, 120))
+        # La mitad con muchos empates
+        maximo = 4 if caso % 2 else 10_000
+        yield rng.integers(0, maximo, n).astype(float)
+
+@pytest.mark.parametrize("descendente", [True, False])
+def test_seleccion_igual_que_np_sort(descendente):
+    for valores in vectores(0):
+        ordenados = np.sort(valores)[::-1] if descendente else np.sort(valores)
+        for k in range(valores.size):
+            valor, indice = seleccionar_DyV(list(valores), k, descendente)
+            assert valor == ordenados[k] and valores[indice] == valor
+            assert k_esimo(valores, k, descendente) == (valor, indice)
+
+@pytest.mark.parametrize("descendente", [True, False])
+def test_top_k_heap_igual_que_np_sort(descendente):
+    for valores in vectores(1):
+        ordenados = np.sort(valores)[::-1] if descendente else np.sort(valores)
+        k = valores.size // 2 + 1
+        primeros, indices = top_k_heap(list(valores), k, descendente)
+        assert primeros == ordenados[:k].tolist()
+        assert [valores[i] for i in indices] == primeros
+        # Entre iguales, primero el de menor índice
+        assert all(indices[j] < indices[j + 1] for j in range(k - 1) if primeros[j] == primeros[j + 1])
+
+def test_posicion_fuera_de_rango():
+    with pytest.raises(ValueError):
+        seleccionar_DyV([1, 2, 3], 3)
+    with pytest.raises(ValueError):
+        k_esimo(np.array([1.0, 2.0]), -1)
@@ -0,0 +1,78 @@
+from interfaz.tabla import ModeloTabla
+
+class TreeviewFalso:
+    """Lo mínimo de ttk.Treeview que usa ModeloTabla, contando las operaciones"""
+    def __init__(self):
+        self.valores = {}
+        self.orden = []
+        self.operaciones = []
+
+    def insert(self, padre, posicion, iid, values):
+        self.valores[iid] = tuple(values)
+        self.orden.append(iid)
+        self.operaciones.append(("insert", iid))
+
+    def item(self, iid, values):
+        self.valores[iid] = tuple(values)
+        self.operaciones.append(("item", iid))
+
+    def move(self, iid, padre, posicion):
+        if iid in self.orden:
+            self.orden.remove(iid)
+        self.orden.insert(posicion, iid)
+        self.operaciones.append(("move", iid))
+
+    def detach(self, *iids):
+        for iid in iids:
+            self.orden.remove(iid)
+            self.operaciones.append(("detach", iid))
+
+    def visibles(self):
+        return [(iid, self.valores[iid]) for iid in self.orden]
+
+def filas(*pares):
+    return [(iid, (iid, valor)) for iid, valor in pares]
+
+def test_muestra_las_filas_en_orden():
+    tabla = TreeviewFalso()
+    modelo = ModeloTabla(tabla)
+    nuevas = filas(("a", 1), ("b", 2), ("c", 3))
+    modelo.mostrar(nuevas)
+    assert tabla.visibles() == nuevas
+
+def test_solo_actualiza_las_filas_que_cambian():
+    tabla = TreeviewFalso()
+    modelo = ModeloTabla(tabla)
+    modelo.mostrar(filas(("a", 1), ("b", 2), ("c", 3)))
+    tabla.operaciones.clear()
+    nuevas = filas(("a", 1), ("b", 5), ("c", 3))
+    modelo.mostrar(nuevas)
+    assert tabla.operaciones == [("item", "b")]
+    assert tabla.visibles() == nuevas
+
+def test_sin_cambios_no_toca_la_tabla():
+    tabla = TreeviewFalso()
+    modelo = ModeloTabla(tabla)
+    modelo.mostrar(filas(("a", 1), ("b", 2)))
+    tabla.operaciones.clear()
+    modelo.mostrar(filas(("a", 1), ("b", 2)))
+    assert tabla.operaciones == []
+
+def test_reordena_oculta_y_vuelve_a_mostrar():
+    tabla = TreeviewFalso()
+    modelo = ModeloTabla(tabla)
+    modelo.mostrar(filas(("a", 1), ("b", 2), ("c", 3), ("d", 4)))
+
+    # Se oculta "b" y se invierte el resto: nada se crea de nuevo
+    nuevas = filas(("d", 4), ("c", 3), ("a", 1))
+    modelo.mostrar(nuevas)
+    assert tabla.visibles() == nuevas
+    assert ("detach", "b") in tabla.operaciones
+    assert [op for op in tabla.operaciones if op[0] == "insert"] == \
+        [("insert", iid) for iid in "abcd"]
+
+    # "b" vuelve con otro valor y en otra posición
+    nuevas = filas(("b", 9), ("d", 4), ("c", 3), ("a", 1))
+    modelo.mostrar(nuevas)
+    assert tabla.visibles() == nuevas
+    assert tabla.operaciones.count(("insert", "b")) == 1